@@ -0,0 +1,35 @@
+import json
+import threading
+
+from Catequizado.cacheCatequizado import CacheCatequizado
+
+# Valores por defecto de la caché de listas de clase (sección "asistencia" de config.json)
+DEFAULT_ASISTENCIA_CONFIG = {
+    "max_grupos": 200,   # Máximo de listas de clase guardadas
+    "ttl_lista": 3600    # Segundos que una lista de clase se considera vigente
+}
+
+# Caché compartida por todo el proceso (se crea la primera vez que se necesita).
+# Es la misma caché LRU/TTL de los catequizados, indexada por idGrupo en lugar de cédula
+_cache = None
+_cache_lock = threading.Lock()
+
+# Función para leer la configuración de asistencia (usa los valores por defecto si no existe la sección o el archivo)
+def get_asistencia_config(config_file='config.json'):
+    asistencia_config = dict(DEFAULT_ASISTENCIA_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            asistencia_config.update(json.load(file).get('asistencia', {}))
+    except FileNotFoundError:
+        pass
+    return asistencia_config
+
+# Función que devuelve la caché compartida de listas de clase (idGrupo -> tupla de InscritoGrupo)
+def get_cache_listas(config_file='config.json'):
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                config = get_asistencia_config(config_file)
+                _cache = CacheCatequizado(max_size=config["max_grupos"], ttl=config["ttl_lista"])
+    return _cache
\ No newline at end of file
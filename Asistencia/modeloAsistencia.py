@@ -0,0 +1,17 @@
+from typing import NamedTuple
+
+# Estados que acepta Proceso.Asistencia (CK_Asistencia_estado)
+ESTADOS_ASISTENCIA = ("Presente", "Ausente", "Justificado")
+
+# Registro inmutable de un estudiante en la lista de clase de un grupo (inscripción 'Cursando')
+class InscritoGrupo(NamedTuple):
+    idInscripcion: int
+    idCatequizado: int
+    nombres: str
+    apellidos: str
+    cedulaIdentidad: str
+
+    # Construye el registro a partir de una fila de sp_ListarInscritosGrupo (mismas columnas y orden)
+    @classmethod
+    def desde_fila(cls, row):
+        return cls._make(tuple(row[:5]))
\ No newline at end of file
@@ -0,0 +1,51 @@
+from datetime import date
+
+from Asistencia.modeloAsistencia import ESTADOS_ASISTENCIA
+from Asistencia.repositorioAsistencia import RepositorioAsistencia
+
+# Atajos para marcar la asistencia por consola (Enter = Presente)
+ATAJOS_ASISTENCIA = {"": "Presente", "p": "Presente", "a": "Ausente", "j": "Justificado"}
+
+# Clase que maneja la toma de asistencia de un grupo desde la consola
+class OperacionesAsistencia:
+
+    def __init__(self):
+        self.repositorio = RepositorioAsistencia()
+
+    def operacion_tomar_asistencia(self):
+        print("\n--- Tomar Asistencia de un Grupo ---")
+        try:
+            idGrupo = int(input("ID del Grupo: ").strip())
+            fecha = input(f"Fecha de la clase (YYYY-MM-DD, Enter para {date.today()}): ").strip()
+            fechaClase = date.fromisoformat(fecha) if fecha else date.today()
+        except ValueError:
+            print("[ERROR] ID de Grupo o Formato de Fecha incorrecto. Use YYYY-MM-DD.")
+            return
+
+        # La lista de clase se lee una sola vez (y queda en caché para las próximas clases del grupo)
+        try:
+            inscritos = self.repositorio.listarInscritos(idGrupo)
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return
+        if not inscritos:
+            print(f"El grupo {idGrupo} no existe o no tiene inscritos cursando.")
+            return
+
+        # Las marcas se acumulan en memoria y se envían todas juntas al final
+        print("Marque P = Presente, A = Ausente, J = Justificado (Enter = Presente)")
+        marcas = {}
+        for inscrito in inscritos:
+            while True:
+                opcion = input(f"{inscrito.apellidos} {inscrito.nombres} ({inscrito.cedulaIdentidad}): ").strip().lower()
+                if opcion in ATAJOS_ASISTENCIA:
+                    marcas[inscrito.idInscripcion] = ATAJOS_ASISTENCIA[opcion]
+                    break
+                print(f"[ERROR] Opción no válida. Use {', '.join(ESTADOS_ASISTENCIA)} (P/A/J).")
+
+        try:
+            resultado = self.repositorio.registrarAsistencia(idGrupo, fechaClase, marcas)
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return
+        print(resultado.mensaje, "\n")
\ No newline at end of file
@@ -0,0 +1,78 @@
+
+import connection as conexion
+from instrumentation import instrumented
+from Asistencia.cacheAsistencia import get_cache_listas
+from Asistencia.modeloAsistencia import ESTADOS_ASISTENCIA, InscritoGrupo
+from Catequizado.procedimientosCatequizado import (CODIGO_CAMPOS_OBLIGATORIOS, CODIGO_INSCRIPCION_INVALIDA,
+                                                   ErrorCatequizado, LlamadaProcedimiento)
+from Catequizado.repositorioCatequizado import ResultadoOperacion
+
+# Repositorio sin estado para Proceso.Asistencia: la asistencia de una clase se guarda completa en una sola llamada
+class RepositorioAsistencia:
+    SQL_LISTAR_INSCRITOS = "{CALL Proceso.sp_ListarInscritosGrupo(?)}"
+    # Las marcas viajan como un parámetro con valores de tabla (TVP): (idInscripcion, estadoAsistencia)
+    REGISTRAR_ASISTENCIA = LlamadaProcedimiento("Proceso.sp_RegistrarAsistenciaGrupo", 3)
+
+    # --- MÉTODOS AUXILIARES ---
+
+    # --- OPERACIONES ---
+
+    # Devuelve la lista de clase del grupo (inscripciones 'Cursando') como tupla de InscritoGrupo.
+    # Se lee con una sola consulta y se guarda en caché: las clases siguientes del grupo no vuelven a pedirla
+    @instrumented("listar_inscritos", "Proceso.sp_ListarInscritosGrupo")
+    def listarInscritos(self, idGrupo, cancelacion=None):
+        cache = get_cache_listas()
+        inscritos = cache.obtener(idGrupo)
+        if inscritos is not None:
+            return inscritos
+
+        # Si se inscribe o retira a alguien mientras se lee, la lista leída no se guarda (quedaría hasta 'ttl_lista')
+        generacion = cache.generacion(idGrupo)
+        with conexion.get_connection_pool().connection(self.SQL_LISTAR_INSCRITOS, cancelacion) as (database, cursor):
+            cursor.execute(self.SQL_LISTAR_INSCRITOS, (idGrupo,))
+            inscritos = tuple(InscritoGrupo.desde_fila(row) for row in cursor.fetchall())
+
+        cache.guardar(idGrupo, inscritos, generacion)
+        return inscritos
+
+    # Descarta la lista de clase guardada de los grupos indicados (p. ej. tras inscribir o retirar a alguien)
+    def invalidarGrupos(self, *idGrupos):
+        get_cache_listas().invalidar(*idGrupos)
+
+    # Registra la asistencia de toda una clase. 'marcas' es un diccionario idInscripcion -> estado
+    # ('Presente', 'Ausente' o 'Justificado'); las marcas ya guardadas para esa fecha se actualizan.
+    # Todas las marcas se envían en una sola llamada y se confirman en una sola transacción
+    @instrumented("registrar_asistencia", REGISTRAR_ASISTENCIA.nombre)
+    def registrarAsistencia(self, idGrupo, fechaClase, marcas, cancelacion=None):
+        if not marcas:
+            return ResultadoOperacion(False, "ERROR: No hay marcas de asistencia para registrar.",
+                                      codigo=CODIGO_CAMPOS_OBLIGATORIOS)
+        for estado in marcas.values():
+            if estado not in ESTADOS_ASISTENCIA:
+                return ResultadoOperacion(False, f"ERROR: Estado de asistencia no válido: '{estado}'. "
+                                                 f"Use {', '.join(ESTADOS_ASISTENCIA)}.",
+                                          codigo=CODIGO_CAMPOS_OBLIGATORIOS)
+
+        # Validación de cliente contra la lista en caché; si no coincide, la lista pudo cambiar y se vuelve a leer
+        desconocidas = self._inscripcionesFuera(idGrupo, marcas)
+        if desconocidas:
+            self.invalidarGrupos(idGrupo)
+            desconocidas = self._inscripcionesFuera(idGrupo, marcas)
+        if desconocidas:
+            return ResultadoOperacion(False, f"ERROR: Las inscripciones {sorted(desconocidas)} no están cursando "
+                                             f"en el grupo {idGrupo}.", codigo=CODIGO_INSCRIPCION_INVALIDA)
+
+        filas = [(idInscripcion, estado) for idInscripcion, estado in sorted(marcas.items())]
+        with conexion.get_connection_pool().connection(self.REGISTRAR_ASISTENCIA.sql,
+                                                       cancelacion) as (database, cursor):
+            try:
+                row = self.REGISTRAR_ASISTENCIA.ejecutar(cursor, (idGrupo, fechaClase, filas))
+            except ErrorCatequizado as e:
+                database.rollback()
+                return ResultadoOperacion(False, e.mensaje, codigo=e.codigo)
+            database.commit()
+        return ResultadoOperacion(True, row[1])
+
+    def _inscripcionesFuera(self, idGrupo, marcas):
+        inscritos = {inscrito.idInscripcion for inscrito in self.listarInscritos(idGrupo)}
+        return set(marcas) - inscritos
\ No newline at end of file
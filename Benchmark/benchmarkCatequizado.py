@@ -0,0 +1,286 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import connection as conexion
+from Benchmark.motorSQLite import cargar_catequizados, conectar_sqlite, crear_esquema
+from Catalogo.cacheCatalogo import CatalogoReferencia, set_catalogo_referencia
+from Catequizado.cacheCatequizado import get_cache_catequizados
+from Catequizado.importadorCatequizado import ImportadorCatequizado
+from Catequizado.modeloCatequizado import Catequizado
+from Catequizado.repositorioCatequizado import RepositorioCatequizado
+
+# Benchmark del camino CRUD de catequizados (repositorio + pool + caché) con datos sintéticos.
+# Uso:  python -m Benchmark.benchmarkCatequizado --filas 1000 100000 1000000 --salida resultados.json
+# Con --motor sqlserver se usa la base de config.json: ejecútelo solo contra una base de pruebas,
+# porque las filas de la carga inicial quedan registradas.
+
+NOMBRES = ("Ana", "Luis", "María", "José", "Carmen", "Pedro", "Lucía", "Andrés", "Sofía", "Diego")
+APELLIDOS = ("Pérez", "Gómez", "Rodríguez", "Sánchez", "Torres", "Vega", "Castro", "Mora", "Ríos", "León")
+
+# Las cédulas sintéticas empiezan con 9 (carga inicial) u 8 (registradas durante la medición)
+# para no chocar entre sí ni con datos reales
+PREFIJO_CARGA = "9"
+PREFIJO_REGISTRO = "8"
+
+
+# --- DATOS SINTÉTICOS ---
+
+# Genera un catequizado válido y determinista para el número indicado
+def generar_catequizado(numero, parroquias, prefijo=PREFIJO_CARGA):
+    aleatorio = random.Random(numero)
+    fechaNacimiento = date(2008, 1, 1) + timedelta(days=aleatorio.randrange(3650))
+    return Catequizado(
+        None,
+        parroquias[numero % len(parroquias)],
+        f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(NOMBRES)}",
+        f"{aleatorio.choice(APELLIDOS)} {aleatorio.choice(APELLIDOS)}",
+        f"{prefijo}{numero:09d}",
+        fechaNacimiento,
+        f"Calle {aleatorio.randrange(1, 500)} y Av. {aleatorio.choice(APELLIDOS)}",
+        f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}",
+        f"09{aleatorio.randrange(10 ** 8):08d}",
+        f"representante{numero}@correo.com",
+        fechaNacimiento + timedelta(days=aleatorio.randrange(30, 365)),
+        f"Parroquia {aleatorio.choice(APELLIDOS)}"
+    )
+
+# Carga inicial en SQLite: inserción directa con los IDs consecutivos que asignaría el procedimiento
+def _cargar_sqlite(ruta, desde, hasta, parroquias):
+    def filas():
+        for numero in range(desde, hasta):
+            catequizado = generar_catequizado(numero, parroquias)
+            valores = list(catequizado.valores_procedimiento())
+            valores[4] = valores[4].isoformat()
+            valores[9] = valores[9].isoformat()
+            yield (numero + 1, *valores)
+    cargar_catequizados(ruta, filas())
+
+# Carga inicial en SQL Server: lotes por sp_RegistrarCatequizadosLote (mismo camino que la importación)
+def _cargar_sqlserver(desde, hasta, parroquias, tamanio_lote=5000):
+    with conexion.get_connection_pool().connection() as (database, cursor):
+        for inicio in range(desde, hasta, tamanio_lote):
+            lote = [(numero,) + generar_catequizado(numero, parroquias).valores_procedimiento()
+                    for numero in range(inicio, min(inicio + tamanio_lote, hasta))]
+            cursor.execute(ImportadorCatequizado.SENTENCIA_SQL, (lote,))
+            cursor.fetchall()
+            database.commit()
+
+def _parroquias_sqlserver():
+    with conexion.get_connection_pool().connection() as (database, cursor):
+        cursor.execute("SELECT idParroquia FROM Configuracion.Parroquia ORDER BY idParroquia")
+        return [row[0] for row in cursor.fetchall()]
+
+
+# --- MEDICIÓN ---
+
+# Percentil por rango más cercano sobre una lista ya ordenada
+def percentil(ordenadas, porcentaje):
+    if not ordenadas:
+        return None
+    return ordenadas[max(0, math.ceil(porcentaje / 100 * len(ordenadas)) - 1)]
+
+# Resume las latencias (en segundos) de una operación: rendimiento y percentiles en milisegundos
+def resumir_latencias(latencias, segundos, errores=0, filas=None):
+    ordenadas = sorted(latencias)
+    resumen = {
+        "operaciones": len(latencias),
+        "errores": errores,
+        "segundos": round(segundos, 6),
+        "operaciones_por_segundo": round(len(latencias) / segundos, 2) if segundos else None,
+        "p50_ms": None,
+        "p95_ms": None,
+        "p99_ms": None,
+        "max_ms": None
+    }
+    for clave, porcentaje in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99), ("max_ms", 100)):
+        if ordenadas:
+            resumen[clave] = round(percentil(ordenadas, porcentaje) * 1000, 4)
+    if filas is not None:
+        resumen["filas"] = filas
+        resumen["filas_por_segundo"] = round(filas / segundos, 2) if segundos else None
+    return resumen
+
+# Ejecuta la operación una vez por cada juego de argumentos y mide cada llamada por separado
+def medir(operacion, argumentos):
+    latencias = []
+    errores = 0
+    inicio = time.perf_counter()
+    for args in argumentos:
+        t0 = time.perf_counter()
+        resultado = operacion(*args)
+        latencias.append(time.perf_counter() - t0)
+        if not resultado.ok:
+            errores += 1
+    return resumir_latencias(latencias, time.perf_counter() - inicio, errores)
+
+# Recorre todas las páginas del listado midiendo cada página
+def medir_paginas(repositorio, tamanioPagina):
+    latencias = []
+    filas = 0
+    desdeId = 0
+    inicio = time.perf_counter()
+    while desdeId is not None:
+        t0 = time.perf_counter()
+        catequizados, desdeId = repositorio.listarPagina(desdeId, tamanioPagina)
+        latencias.append(time.perf_counter() - t0)
+        filas += len(catequizados)
+    return resumir_latencias(latencias, time.perf_counter() - inicio, filas=filas)
+
+# Recorre el listado completo con el generador: primero solo tiempo, luego memoria pico con tracemalloc
+# (tracemalloc ralentiza la ejecución, por eso no se mide todo en la misma pasada)
+def medir_listado(repositorio, tamanioPagina):
+    inicio = time.perf_counter()
+    filas = sum(1 for _ in repositorio.iterar(tamanioPagina=tamanioPagina))
+    segundos = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    try:
+        for _ in repositorio.iterar(tamanioPagina=tamanioPagina):
+            pass
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "filas": filas,
+        "segundos": round(segundos, 6),
+        "filas_por_segundo": round(filas / segundos, 2) if segundos else None,
+        "memoria_pico_mb": round(pico / (1024 * 1024), 3)
+    }
+
+# Contadores de la caché acumulados solo durante la corrida (la caché es compartida por todo el proceso)
+def _diferencia_cache(previos, actuales):
+    diferencia = dict(actuales)
+    for clave in ("aciertos", "fallos", "desalojos", "expiraciones", "invalidaciones"):
+        diferencia[clave] = actuales[clave] - previos[clave]
+    consultas = diferencia["aciertos"] + diferencia["fallos"]
+    diferencia["tasa_aciertos"] = diferencia["aciertos"] / consultas if consultas else 0.0
+    return diferencia
+
+# Mide las operaciones CRUD sobre una tabla que ya tiene 'filas' registros sintéticos
+def ejecutar_corrida(filas, operaciones, parroquias, tamanioPagina, semilla):
+    repositorio = RepositorioCatequizado()
+    cache = get_cache_catequizados()
+    aleatorio = random.Random(semilla)
+    contadores_previos = cache.estadisticas()
+
+    nuevos = [generar_catequizado(numero, parroquias, PREFIJO_REGISTRO) for numero in range(operaciones)]
+    existentes = [f"{PREFIJO_CARGA}{numero:09d}" for numero in aleatorio.sample(range(filas), min(operaciones, filas))]
+    modificados = [catequizado._replace(direccionDomicilio=f"Dirección actualizada {numero}")
+                   for numero, catequizado in enumerate(nuevos)]
+
+    resultados = {}
+    resultados["registrar"] = medir(repositorio.registrar, [(catequizado,) for catequizado in nuevos])
+    # Primero sin caché (todas las búsquedas llegan a la base) y luego con las mismas cédulas ya cacheadas
+    cache.limpiar()
+    resultados["buscar"] = medir(repositorio.buscarPorCedula, [(cedula,) for cedula in existentes])
+    resultados["buscar_cache"] = medir(repositorio.buscarPorCedula, [(cedula,) for cedula in existentes])
+    resultados["actualizar"] = medir(repositorio.actualizar,
+                                     [(catequizado.cedulaIdentidad, catequizado) for catequizado in modificados])
+    # Al eliminar los registrados la tabla vuelve a tener 'filas' registros para el listado y la corrida siguiente
+    resultados["eliminar"] = medir(repositorio.eliminar, [(catequizado.cedulaIdentidad,) for catequizado in nuevos])
+    resultados["listar_pagina"] = medir_paginas(repositorio, tamanioPagina)
+
+    return {
+        "filas": filas,
+        "operaciones": resultados,
+        "listado": medir_listado(repositorio, tamanioPagina),
+        "cache": _diferencia_cache(contadores_previos, cache.estadisticas()),
+        "pool": conexion.get_connection_pool().stats()
+    }
+
+# Ejecuta una corrida por cada tamaño (de menor a mayor, cargando solo las filas que faltan)
+def ejecutar_benchmark(tamanios, operaciones=1000, motor="sqlite", ruta_sqlite=None, numero_parroquias=20,
+                       tamanioPagina=500, semilla=42):
+    directorio_temporal = None
+    if motor == "sqlite":
+        if ruta_sqlite is None:
+            directorio_temporal = tempfile.mkdtemp(prefix="benchmark_catequizado_")
+            ruta_sqlite = os.path.join(directorio_temporal, "catequesis.sqlite")
+        crear_esquema(ruta_sqlite, numero_parroquias)
+        parroquias = list(range(1, numero_parroquias + 1))
+        conexion.set_connection_pool(conexion.ConnectionPool(ruta_sqlite, connect=conectar_sqlite,
+                                                             **conexion.DEFAULT_POOL_CONFIG))
+        # Catálogos solo en memoria: el archivo local de catálogos es el de la base de config.json
+        set_catalogo_referencia(CatalogoReferencia(origen=ruta_sqlite))
+    elif motor == "sqlserver":
+        parroquias = _parroquias_sqlserver()
+        if not parroquias:
+            raise ValueError("No hay parroquias registradas en Configuracion.Parroquia.")
+    else:
+        raise ValueError(f"Motor no soportado: '{motor}'. Use sqlite o sqlserver.")
+
+    reporte = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "motor": motor,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "operaciones_por_tipo": operaciones,
+        "tamanio_pagina": tamanioPagina,
+        "semilla": semilla,
+        "corridas": []
+    }
+
+    try:
+        cargadas = 0
+        for filas in sorted(set(tamanios)):
+            inicio = time.perf_counter()
+            if motor == "sqlite":
+                _cargar_sqlite(ruta_sqlite, cargadas, filas, parroquias)
+            else:
+                _cargar_sqlserver(cargadas, filas, parroquias)
+            segundos_carga = time.perf_counter() - inicio
+            cargadas = filas
+
+            corrida = ejecutar_corrida(filas, operaciones, parroquias, tamanioPagina, semilla)
+            corrida["segundos_carga"] = round(segundos_carga, 3)
+            reporte["corridas"].append(corrida)
+            print(f"{filas} filas: " + ", ".join(
+                f"{nombre} {resumen['operaciones_por_segundo']} op/s (p95 {resumen['p95_ms']} ms)"
+                for nombre, resumen in corrida["operaciones"].items()))
+    finally:
+        conexion.close_connection_pool()
+        if motor == "sqlite":
+            set_catalogo_referencia(None)
+        if directorio_temporal is not None:
+            shutil.rmtree(directorio_temporal, ignore_errors=True)
+
+    return reporte
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark de las operaciones CRUD de catequizados.")
+    parser.add_argument("--filas", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Tamaños de la tabla a medir (p. ej. 1000 100000 1000000).")
+    parser.add_argument("--operaciones", type=int, default=1000,
+                        help="Operaciones medidas por cada tipo (registrar, buscar, actualizar, eliminar).")
+    parser.add_argument("--motor", choices=("sqlite", "sqlserver"), default="sqlite",
+                        help="sqlite: base local temporal; sqlserver: la base de config.json (solo de pruebas).")
+    parser.add_argument("--sqlite", dest="ruta_sqlite", default=None,
+                        help="Archivo SQLite a usar (por defecto uno temporal que se borra al terminar).")
+    parser.add_argument("--parroquias", type=int, default=20, help="Parroquias de prueba (solo SQLite).")
+    parser.add_argument("--tamanio-pagina", type=int, default=500, help="Filas por página del listado.")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--salida", default=None, help="Archivo JSON de resultados (por defecto se imprime).")
+    args = parser.parse_args(argumentos)
+
+    reporte = ejecutar_benchmark(args.filas, args.operaciones, args.motor, args.ruta_sqlite, args.parroquias,
+                                 args.tamanio_pagina, args.semilla)
+
+    if args.salida is None:
+        print(json.dumps(reporte, indent=2, ensure_ascii=False))
+    else:
+        with open(args.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(reporte, archivo, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.salida}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,325 @@
+import itertools
+import re
+import sqlite3
+from collections import namedtuple
+
+from Catequizado.validacionesCatequizado import PATRON_CEDULA, PATRON_EMAIL, PATRON_TELEFONO
+
+# Sustituto local de SQL Server para los benchmarks: una base SQLite con las tablas Parroquia y Catequizado
+# y los procedimientos CRUD de Script-Stored-Procedures-CRUD-Catequizado.sql reescritos en Python.
+# La conexión imita la interfaz de pyodbc que usa el repositorio (cursor, execute, fetch*, commit, rollback),
+# así que ConnectionPool, la caché y RepositorioCatequizado se miden sin cambios.
+
+ESQUEMA_SQLITE = """
+    CREATE TABLE IF NOT EXISTS Parroquia (
+        idParroquia INTEGER NOT NULL PRIMARY KEY,
+        nombreParroquia VARCHAR(255) NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS Catequizado (
+        idCatequizado INTEGER NOT NULL PRIMARY KEY,
+        idParroquiaPertenece INTEGER NOT NULL REFERENCES Parroquia (idParroquia),
+        nombres VARCHAR(255) NOT NULL,
+        apellidos VARCHAR(255) NOT NULL,
+        cedulaIdentidad VARCHAR(10) NOT NULL,
+        fechaNacimiento DATE NOT NULL,
+        direccionDomicilio VARCHAR(255) NOT NULL,
+        nombreRepresentante VARCHAR(255) NOT NULL,
+        telefonoRepresentante VARCHAR(255) NOT NULL,
+        emailRepresentante VARCHAR(255) NOT NULL,
+        fechaBautismo DATE NOT NULL,
+        parroquiaBautismo VARCHAR(255) NOT NULL,
+        CONSTRAINT UQ_Catequizado_cedula UNIQUE (cedulaIdentidad)
+    );
+    CREATE INDEX IF NOT EXISTS IX_Catequizado_Parroquia_Id ON Catequizado (idParroquiaPertenece, idCatequizado);
+"""
+
+# Mismas columnas y orden que sp_BuscarCatequizadoPorCedula y sp_ListarCatequizadosPaginado
+SELECT_CATEQUIZADO = """
+    SELECT C.idCatequizado, C.idParroquiaPertenece, P.nombreParroquia, C.nombres, C.apellidos,
+           C.cedulaIdentidad, C.fechaNacimiento, C.direccionDomicilio, C.nombreRepresentante,
+           C.telefonoRepresentante, C.emailRepresentante, C.fechaBautismo, C.parroquiaBautismo
+    FROM Catequizado AS C
+    LEFT JOIN Parroquia AS P ON P.idParroquia = C.idParroquiaPertenece"""
+
+# sp_ListarCatequizadosPaginado con @incluirNombreParroquia = 0: Nombre_Parroquia en NULL y sin JOIN
+SELECT_CATEQUIZADO_SIN_PARROQUIA = """
+    SELECT C.idCatequizado, C.idParroquiaPertenece, NULL, C.nombres, C.apellidos,
+           C.cedulaIdentidad, C.fechaNacimiento, C.direccionDomicilio, C.nombreRepresentante,
+           C.telefonoRepresentante, C.emailRepresentante, C.fechaBautismo, C.parroquiaBautismo
+    FROM Catequizado AS C"""
+
+MENSAJE_OBLIGATORIOS = "ERROR: Todos los campos son obligatorios. Por favor, complete la información faltante."
+MENSAJE_CEDULA_OBLIGATORIA = ("ERROR: El campo cédula de identidad es obligatorio. "
+                              "Por favor, complete la información faltante.")
+MENSAJE_CEDULA = "ERROR: La cédula debe tener 10 dígitos numéricos."
+MENSAJE_TELEFONO = "ERROR: El teléfono celular debe empezar con 09 y tener 10 dígitos."
+MENSAJE_EMAIL = "ERROR: El formato del correo electrónico no es válido."
+MENSAJE_PARROQUIA = "ERROR: La parroquia seleccionada no existe en el sistema."
+
+# Fila de resultado de los procedimientos ...ConCodigo (ver Catequizado/procedimientosCatequizado.py)
+FilaResultado = namedtuple("FilaResultado", "codigo mensaje")
+# El registro exitoso trae además el ID asignado
+FilaRegistro = namedtuple("FilaRegistro", "codigo mensaje idCatequizado")
+
+CODIGOS_FORMATO = {MENSAJE_CEDULA: 2, MENSAJE_TELEFONO: 3, MENSAJE_EMAIL: 4}
+
+PATRON_LLAMADA = re.compile(r"\{CALL\s+(?:Proceso|Configuracion)\.(\w+)")
+
+# Los catálogos del benchmark no cambian durante la medición: su versión es fija
+VERSION_CATALOGOS = 1
+
+
+# Varios conjuntos de resultados de una misma llamada (el cursor los recorre con nextset)
+class ConjuntosResultados(tuple):
+    pass
+
+
+# --- PROCEDIMIENTOS (misma lógica, códigos y mensajes que los de SQL Server) ---
+
+# ISNULL(LTRIM(RTRIM(@valor)), '') = ''
+def _vacio(valor):
+    return valor is None or str(valor).strip(' ') == ''
+
+def _trim(valor):
+    return valor.strip(' ')
+
+def _fecha(valor):
+    return None if valor is None else str(valor)
+
+def _datos_incompletos(valores):
+    return any(_vacio(valor) for valor in valores)
+
+# Validaciones de formato comunes a registrar y actualizar (cédula, teléfono y email)
+def _error_formato(cedula, telefono, email):
+    if not PATRON_CEDULA.fullmatch(cedula.rstrip(' ')):
+        return MENSAJE_CEDULA
+    if not PATRON_TELEFONO.fullmatch(telefono.rstrip(' ')):
+        return MENSAJE_TELEFONO
+    if not PATRON_EMAIL.fullmatch(email.rstrip(' ')):
+        return MENSAJE_EMAIL
+    return None
+
+def _existe_parroquia(cursor, idParroquia):
+    return cursor.execute("SELECT 1 FROM Parroquia WHERE idParroquia = ?", (idParroquia,)).fetchone() is not None
+
+def _id_por_cedula(cursor, cedula):
+    fila = cursor.execute("SELECT idCatequizado FROM Catequizado WHERE cedulaIdentidad = ?", (cedula,)).fetchone()
+    return None if fila is None else fila[0]
+
+def sp_RegistrarCatequizadoConCodigo(cursor, idParroquia, nombres, apellidos, cedula, fechaNacimiento, direccion,
+                            nombreRepresentante, telefono, email, fechaBautismo, parroquiaBautismo):
+    if _datos_incompletos((nombres, apellidos, cedula, fechaNacimiento, direccion, nombreRepresentante,
+                           telefono, email, fechaBautismo, parroquiaBautismo)):
+        return [FilaResultado(1, MENSAJE_OBLIGATORIOS)]
+    error = _error_formato(cedula, telefono, email)
+    if error is not None:
+        return [FilaResultado(CODIGOS_FORMATO[error], error)]
+    if not _existe_parroquia(cursor, idParroquia):
+        return [FilaResultado(5, MENSAJE_PARROQUIA)]
+    if _id_por_cedula(cursor, cedula) is not None:
+        return [FilaResultado(6, f"ERROR: El estudiante con cédula {cedula} ya se encuentra registrado.")]
+
+    try:
+        nuevoId = cursor.execute("SELECT IFNULL(MAX(idCatequizado), 0) + 1 FROM Catequizado").fetchone()[0]
+        cursor.execute(
+            "INSERT INTO Catequizado VALUES (?,?,?,?,?,?,?,?,?,?,?,?)",
+            (nuevoId, idParroquia, _trim(nombres), _trim(apellidos), cedula, _fecha(fechaNacimiento),
+             _trim(direccion), _trim(nombreRepresentante), _trim(telefono), _trim(email).lower(),
+             _fecha(fechaBautismo), _trim(parroquiaBautismo)))
+    except sqlite3.Error as e:
+        return [FilaResultado(50, f"ERROR CRÍTICO SQL: {e}")]
+    # Como en SQL Server, el registro exitoso devuelve además el ID asignado
+    return [FilaRegistro(0, f"OK: Registro exitoso. Código asignado: {nuevoId}", nuevoId)]
+
+def sp_BuscarCatequizadoPorCedulaConCodigo(cursor, cedula):
+    if _vacio(cedula):
+        return [FilaResultado(1, MENSAJE_CEDULA_OBLIGATORIA)]
+    if not PATRON_CEDULA.fullmatch(cedula.rstrip(' ')):
+        return [FilaResultado(2, MENSAJE_CEDULA)]
+    fila = cursor.execute(SELECT_CATEQUIZADO + " WHERE C.cedulaIdentidad = ?", (cedula,)).fetchone()
+    if fila is None:
+        return [FilaResultado(7, f"ERROR: No existe ningún catequizado registrado con la cédula {cedula}")]
+    return [(0, "OK: Catequizado encontrado.") + fila]
+
+def sp_ActualizarCatequizadoConCodigo(cursor, cedulaActualizar, idParroquia, nombres, apellidos, cedula, fechaNacimiento,
+                             direccion, nombreRepresentante, telefono, email, fechaBautismo, parroquiaBautismo):
+    if _datos_incompletos((cedulaActualizar, nombres, apellidos, cedula, fechaNacimiento, direccion,
+                           nombreRepresentante, telefono, email, fechaBautismo, parroquiaBautismo)):
+        return [FilaResultado(1, MENSAJE_OBLIGATORIOS)]
+    if not PATRON_CEDULA.fullmatch(cedulaActualizar.rstrip(' ')):
+        return [FilaResultado(2, "ERROR: La cédula a actualizar debe tener 10 dígitos numéricos.")]
+    error = _error_formato(cedula, telefono, email)
+    if error is not None:
+        return [FilaResultado(CODIGOS_FORMATO[error], error)]
+
+    idCatequizado = _id_por_cedula(cursor, cedulaActualizar)
+    if idCatequizado is None:
+        return [FilaResultado(7, f"ERROR: No se encontró ningún catequizado con la cédula {cedulaActualizar}")]
+    idOtro = _id_por_cedula(cursor, cedula)
+    if idOtro is not None and idOtro != idCatequizado:
+        return [FilaResultado(6, "ERROR: La cédula ya está registrada con otro estudiante.")]
+    if not _existe_parroquia(cursor, idParroquia):
+        return [FilaResultado(5, MENSAJE_PARROQUIA)]
+
+    try:
+        cursor.execute(
+            """UPDATE Catequizado SET idParroquiaPertenece = ?, nombres = ?, apellidos = ?, cedulaIdentidad = ?,
+                   fechaNacimiento = ?, direccionDomicilio = ?, nombreRepresentante = ?, telefonoRepresentante = ?,
+                   emailRepresentante = ?, fechaBautismo = ?, parroquiaBautismo = ?
+               WHERE idCatequizado = ?""",
+            (idParroquia, _trim(nombres), _trim(apellidos), cedula, _fecha(fechaNacimiento), _trim(direccion),
+             _trim(nombreRepresentante), _trim(telefono), _trim(email).lower(), _fecha(fechaBautismo),
+             _trim(parroquiaBautismo), idCatequizado))
+    except sqlite3.Error as e:
+        return [FilaResultado(50, f"ERROR CRÍTICO SQL: {e}")]
+    return [FilaResultado(0, "OK: Catequizado actualizado exitosamente.")]
+
+def sp_EliminarCatequizadoPorCedulaConCodigo(cursor, cedula):
+    if _vacio(cedula):
+        return [FilaResultado(1, MENSAJE_CEDULA_OBLIGATORIA)]
+    if not PATRON_CEDULA.fullmatch(cedula.rstrip(' ')):
+        return [FilaResultado(2, MENSAJE_CEDULA)]
+    if _id_por_cedula(cursor, cedula) is None:
+        return [FilaResultado(7, f"ERROR: No existe ningún catequizado registrado con la cédula {cedula}")]
+
+    try:
+        cursor.execute("DELETE FROM Catequizado WHERE cedulaIdentidad = ?", (cedula,))
+    except sqlite3.Error as e:
+        return [FilaResultado(50, "ERROR SQL: No se pudo eliminar. Es posible que tenga registros asociados "
+                            f"(inscripciones, etc.). Detalles: {e}")]
+    return [FilaResultado(0, "OK: Catequizado eliminado exitosamente.")]
+
+# Devuelve el cursor de SQLite sin materializar la página: el repositorio la consume con fetchmany
+def sp_ListarCatequizadosPaginado(cursor, desdeId=0, tamanioPagina=500, idParroquia=None, incluirNombreParroquia=1):
+    if desdeId is None:
+        desdeId = 0
+    if tamanioPagina is None or tamanioPagina < 1:
+        tamanioPagina = 500
+    tamanioPagina = min(tamanioPagina, 5000)
+    seleccion = SELECT_CATEQUIZADO if incluirNombreParroquia else SELECT_CATEQUIZADO_SIN_PARROQUIA
+    return cursor.execute(
+        seleccion + """
+        WHERE C.idCatequizado > ? AND (? IS NULL OR C.idParroquiaPertenece = ?)
+        ORDER BY C.idCatequizado
+        LIMIT ?""", (desdeId, idParroquia, idParroquia, tamanioPagina))
+
+def sp_ContarCatequizadosPorParroquia(cursor):
+    return cursor.execute("""
+        SELECT P.idParroquia, P.nombreParroquia, COUNT(*) AS total
+        FROM Parroquia AS P
+        INNER JOIN Catequizado AS C ON C.idParroquiaPertenece = P.idParroquia
+        GROUP BY P.idParroquia, P.nombreParroquia
+        ORDER BY total DESC, P.idParroquia""")
+
+def sp_VersionCatalogos(cursor):
+    return [(VERSION_CATALOGOS, None)]
+
+# La tabla Parroquia de SQLite solo tiene ID y nombre; Nivel, Sacramento y Rol no existen en el motor
+def sp_ListarCatalogos(cursor):
+    parroquias = [(idParroquia, nombre, "", "", "") for idParroquia, nombre in
+                  cursor.execute("SELECT idParroquia, nombreParroquia FROM Parroquia ORDER BY idParroquia")]
+    return ConjuntosResultados((sp_VersionCatalogos(cursor), parroquias, [], [], []))
+
+PROCEDIMIENTOS = {
+    "sp_RegistrarCatequizadoConCodigo": sp_RegistrarCatequizadoConCodigo,
+    "sp_BuscarCatequizadoPorCedulaConCodigo": sp_BuscarCatequizadoPorCedulaConCodigo,
+    "sp_ActualizarCatequizadoConCodigo": sp_ActualizarCatequizadoConCodigo,
+    "sp_EliminarCatequizadoPorCedulaConCodigo": sp_EliminarCatequizadoPorCedulaConCodigo,
+    "sp_ListarCatequizadosPaginado": sp_ListarCatequizadosPaginado,
+    "sp_ContarCatequizadosPorParroquia": sp_ContarCatequizadosPorParroquia,
+    "sp_VersionCatalogos": sp_VersionCatalogos,
+    "sp_ListarCatalogos": sp_ListarCatalogos
+}
+
+
+# --- CONEXIÓN COMPATIBLE CON LA INTERFAZ DE PYODBC ---
+
+# Cursor que reconoce las llamadas {CALL Proceso.sp_...} y las despacha al procedimiento equivalente
+class CursorSQLite:
+    def __init__(self, database):
+        self._database = database
+        self._cursor = database.cursor()
+        self._filas = iter(())
+        self._conjuntos = iter(())
+
+    def execute(self, sql, parametros=()):
+        # pyodbc acepta un único parámetro sin envolver en tupla
+        if not isinstance(parametros, (tuple, list)):
+            parametros = (parametros,)
+
+        llamada = PATRON_LLAMADA.search(sql)
+        if llamada is None:
+            # Consultas directas, p. ej. el SELECT 1 con el que el pool valida las conexiones
+            self._filas = iter(self._cursor.execute(sql, parametros))
+            self._conjuntos = iter(())
+            return self
+
+        procedimiento = PROCEDIMIENTOS.get(llamada.group(1))
+        if procedimiento is None:
+            raise NotImplementedError(f"El motor SQLite no implementa {llamada.group(1)}.")
+        resultado = procedimiento(self._cursor, *parametros)
+        conjuntos = resultado if isinstance(resultado, ConjuntosResultados) else (resultado,)
+        self._filas = iter(conjuntos[0])
+        self._conjuntos = iter(conjuntos[1:])
+        return self
+
+    def fetchone(self):
+        return next(self._filas, None)
+
+    def fetchmany(self, tamanio):
+        return list(itertools.islice(self._filas, tamanio))
+
+    def fetchall(self):
+        return list(self._filas)
+
+    # Pasa al siguiente conjunto de resultados (True) o devuelve None si no hay más, como pyodbc
+    def nextset(self):
+        siguiente = next(self._conjuntos, None)
+        if siguiente is None:
+            # Como en pyodbc, las filas sin leer del conjunto actual se descartan
+            self._filas = iter(())
+            return None
+        self._filas = iter(siguiente)
+        return True
+
+    def cancel(self):
+        self._database.interrupt()
+
+    def close(self):
+        self._cursor.close()
+
+class ConexionSQLite:
+    def __init__(self, ruta):
+        # El pool presta la conexión a distintos hilos (nunca a dos a la vez)
+        self._database = sqlite3.connect(ruta, check_same_thread=False)
+
+    def cursor(self):
+        return CursorSQLite(self._database)
+
+    def commit(self):
+        self._database.commit()
+
+    def rollback(self):
+        self._database.rollback()
+
+    def close(self):
+        self._database.close()
+
+# Función de conexión para ConnectionPool(connect=...): la "cadena de conexión" es la ruta del archivo SQLite
+def conectar_sqlite(ruta):
+    return ConexionSQLite(ruta)
+
+# Crea las tablas (si no existen) y registra las parroquias de prueba
+def crear_esquema(ruta, numero_parroquias=20):
+    with sqlite3.connect(ruta) as database:
+        database.executescript(ESQUEMA_SQLITE)
+        database.executemany(
+            "INSERT OR IGNORE INTO Parroquia VALUES (?, ?)",
+            ((idParroquia, f"Parroquia {idParroquia}") for idParroquia in range(1, numero_parroquias + 1)))
+    database.close()
+
+# Inserta filas ya validadas directamente en la tabla (carga inicial del benchmark, fuera de la medición)
+def cargar_catequizados(ruta, filas):
+    with sqlite3.connect(ruta) as database:
+        database.executemany("INSERT INTO Catequizado VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", filas)
+    database.close()
\ No newline at end of file
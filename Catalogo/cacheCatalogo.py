@@ -0,0 +1,181 @@
+import json
+import logging
+import threading
+import time
+
+import connection as conexion
+from Catalogo.repositorioCatalogo import RepositorioCatalogo
+from Catalogo.snapshotCatalogo import guardar_snapshot, leer_snapshot, marcar_vigente
+
+# Valores por defecto de los catálogos (se pueden sobrescribir en la sección "catalogo" de config.json)
+DEFAULT_CATALOGO_CONFIG = {
+    "habilitado": True,                        # Sin catálogos locales el listado hace el JOIN con Parroquia
+    "archivo_snapshot": "catalogos.snapshot",  # Archivo local para iniciar sin consultarlos (null = solo memoria)
+    "intervalo_verificacion": 300              # Segundos entre comprobaciones de la versión en la base de datos
+}
+
+# Espera máxima (segundos) antes de reintentar cuando la base de datos no respondió
+ESPERA_REINTENTO = 30
+
+_logger = logging.getLogger("catequizado.catalogo")
+
+
+# Catálogos de referencia en memoria. Se cargan una vez (del archivo local o de la base de datos) y solo se
+# vuelven a leer cuando cambia la versión, que se comprueba cada 'intervalo_verificacion' segundos con una
+# consulta de una fila. Si la base de datos no responde se siguen usando los catálogos que ya se tenían
+class CatalogoReferencia:
+    def __init__(self, archivo_snapshot=None, intervalo_verificacion=300, repositorio=None, origen=None):
+        self.archivo_snapshot = archivo_snapshot
+        self.intervalo_verificacion = intervalo_verificacion
+        self.repositorio = repositorio or RepositorioCatalogo()
+        # Identifica la base de datos del archivo local (por defecto, la cadena de conexión de config.json)
+        self._origen = origen
+        self._catalogos = None
+        self._proximaVerificacion = 0.0
+        self._archivoLeido = False
+        self._lock = threading.Lock()
+        self._contadores = {"verificaciones": 0, "recargas": 0, "desde_archivo": 0, "fallos": 0}
+
+    @property
+    def origen(self):
+        if self._origen is None:
+            self._origen = conexion.build_connection_string(conexion.get_db_config())
+        return self._origen
+
+    # Catálogos vigentes (Catalogos) o None si no se pudieron obtener
+    def actual(self):
+        # Camino rápido sin candado: los catálogos se reemplazan completos, nunca se modifican
+        catalogos = self._catalogos
+        if catalogos is not None and time.monotonic() < self._proximaVerificacion:
+            return catalogos
+        with self._lock:
+            if self._catalogos is None or time.monotonic() >= self._proximaVerificacion:
+                self._verificar()
+            return self._catalogos
+
+    # Comprueba la versión en este momento, sin esperar al intervalo
+    def refrescar(self):
+        with self._lock:
+            self._verificar(forzar=True)
+            return self._catalogos
+
+    # Solo los catálogos ya cargados o los del archivo local, sin consultar la base de datos
+    def local(self):
+        with self._lock:
+            self._leerArchivo()
+            return self._catalogos
+
+    # True si la parroquia existe, False si no existe y None si no se puede saber (sin catálogos locales).
+    # Un ID desconocido fuerza una comprobación de versión: puede ser una parroquia creada hace poco
+    def validarParroquia(self, idParroquia):
+        try:
+            idParroquia = int(idParroquia)
+        except (TypeError, ValueError):
+            return None
+        catalogos = self.actual()
+        if catalogos is None or catalogos.existeParroquia(idParroquia):
+            return None if catalogos is None else True
+        catalogos = self.refrescar()
+        return None if catalogos is None else catalogos.existeParroquia(idParroquia)
+
+    def estadisticas(self):
+        with self._lock:
+            version = self._catalogos.version if self._catalogos is not None else None
+            return dict(self._contadores, version=version)
+
+    # --- MÉTODOS AUXILIARES (se llaman con el candado tomado) ---
+
+    # La primera vez, carga el archivo local; su antigüedad cuenta para la próxima comprobación de versión
+    def _leerArchivo(self):
+        if self._archivoLeido or self._catalogos is not None or not self.archivo_snapshot:
+            return
+        self._archivoLeido = True
+        leido = leer_snapshot(self.archivo_snapshot, self.origen)
+        if leido is None:
+            return
+        self._catalogos, modificado = leido
+        self._contadores["desde_archivo"] += 1
+        antiguedad = max(time.time() - modificado, 0)
+        self._proximaVerificacion = time.monotonic() + max(self.intervalo_verificacion - antiguedad, 0)
+
+    def _verificar(self, forzar=False):
+        self._leerArchivo()
+        if not forzar and self._catalogos is not None and time.monotonic() < self._proximaVerificacion:
+            return
+
+        self._contadores["verificaciones"] += 1
+        try:
+            version = self.repositorio.version()
+            if self._catalogos is not None and version == self._catalogos.version:
+                if self.archivo_snapshot:
+                    marcar_vigente(self.archivo_snapshot)
+            else:
+                self._catalogos = self.repositorio.listar()
+                self._contadores["recargas"] += 1
+                self._guardarArchivo()
+        except Exception as e:
+            self._contadores["fallos"] += 1
+            _logger.warning("No se pudieron verificar los catálogos: %s", e)
+            self._proximaVerificacion = time.monotonic() + min(self.intervalo_verificacion, ESPERA_REINTENTO)
+            return
+        self._proximaVerificacion = time.monotonic() + self.intervalo_verificacion
+
+    def _guardarArchivo(self):
+        if not self.archivo_snapshot:
+            return
+        try:
+            guardar_snapshot(self.archivo_snapshot, self._catalogos, self.origen)
+        except (OSError, ValueError) as e:
+            _logger.warning("No se pudo guardar el archivo de catálogos '%s': %s", self.archivo_snapshot, e)
+
+# Sin catálogos locales: el listado resuelve los nombres en el servidor y la validación queda en el procedimiento
+class _CatalogoDeshabilitado:
+    def actual(self):
+        return None
+
+    def refrescar(self):
+        return None
+
+    def local(self):
+        return None
+
+    def validarParroquia(self, idParroquia):
+        return None
+
+    def estadisticas(self):
+        return {}
+
+# Catálogos compartidos por todo el proceso (se crean la primera vez que se necesitan)
+_catalogo = None
+_catalogo_lock = threading.Lock()
+
+# Función para leer la configuración de los catálogos (usa los valores por defecto si no existe la sección)
+def get_catalogo_config(config_file='config.json'):
+    catalogo_config = dict(DEFAULT_CATALOGO_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            catalogo_config.update(json.load(file).get('catalogo', {}))
+    except FileNotFoundError:
+        pass
+    return catalogo_config
+
+# Función para crear los catálogos a partir de su configuración
+def build_catalogo_referencia(config):
+    if not config["habilitado"]:
+        return _CatalogoDeshabilitado()
+    return CatalogoReferencia(config["archivo_snapshot"], config["intervalo_verificacion"])
+
+# Función que devuelve los catálogos compartidos, creándolos a partir de config.json si aún no existen
+def get_catalogo_referencia(config_file='config.json'):
+    global _catalogo
+    if _catalogo is None:
+        with _catalogo_lock:
+            if _catalogo is None:
+                _catalogo = build_catalogo_referencia(get_catalogo_config(config_file))
+    return _catalogo
+
+# Función para reemplazar los catálogos compartidos (p. ej. sin archivo local en los benchmarks)
+def set_catalogo_referencia(catalogo):
+    global _catalogo
+    with _catalogo_lock:
+        _catalogo = catalogo
\ No newline at end of file
@@ -0,0 +1,63 @@
+from typing import NamedTuple
+
+# Registros de los catálogos de Configuracion (mismas columnas y orden que sp_ListarCatalogos)
+class Parroquia(NamedTuple):
+    idParroquia: int
+    nombreParroquia: str
+    direccion: str
+    telefonoContacto: str
+    emailContacto: str
+
+class Nivel(NamedTuple):
+    idNivel: int
+    nombreNivel: str
+    descripcionNivel: str
+    ordenProgresion: int
+    idSacramentoOtorga: int
+
+class Sacramento(NamedTuple):
+    idSacramento: int
+    nombreSacramento: str
+    descripcionSacramento: str
+
+class Rol(NamedTuple):
+    idRol: int
+    nombreRol: str
+    descripcionPermisos: str
+
+# Catálogos en el orden de los conjuntos de resultados de sp_ListarCatalogos (después de la versión)
+TABLAS_CATALOGO = (
+    ("Parroquia", Parroquia),
+    ("Nivel", Nivel),
+    ("Sacramento", Sacramento),
+    ("Rol", Rol)
+)
+
+# Los cuatro catálogos de una misma versión, cada uno como diccionario ID -> registro.
+# 'nombresParroquia' (ID -> nombre) es la tabla que usan el listado y la validación de parroquias
+class Catalogos(NamedTuple):
+    version: int
+    parroquias: dict
+    niveles: dict
+    sacramentos: dict
+    roles: dict
+    nombresParroquia: dict
+
+    # Construye los catálogos a partir de las filas de cada tabla (en el orden de TABLAS_CATALOGO)
+    @classmethod
+    def desde_filas(cls, version, filasPorTabla):
+        tablas = [{fila[0]: tipo._make(tuple(fila)) for fila in filas}
+                  for (_, tipo), filas in zip(TABLAS_CATALOGO, filasPorTabla)]
+        parroquias = tablas[0]
+        nombres = {idParroquia: parroquia.nombreParroquia for idParroquia, parroquia in parroquias.items()}
+        return cls(int(version), *tablas, nombres)
+
+    # Filas de cada tabla en el orden de TABLAS_CATALOGO (para guardar el archivo local)
+    def filas(self):
+        return (self.parroquias.values(), self.niveles.values(), self.sacramentos.values(), self.roles.values())
+
+    def existeParroquia(self, idParroquia):
+        return idParroquia in self.nombresParroquia
+
+    def nombreParroquia(self, idParroquia):
+        return self.nombresParroquia.get(idParroquia)
\ No newline at end of file
@@ -0,0 +1,25 @@
+import connection as conexion
+from instrumentation import instrumented
+from Catalogo.modeloCatalogo import TABLAS_CATALOGO, Catalogos
+
+# Repositorio sin estado para los catálogos de Configuracion (Parroquia, Nivel, Sacramento y Rol)
+class RepositorioCatalogo:
+    SQL_VERSION = "{CALL Configuracion.sp_VersionCatalogos}"
+    SQL_LISTAR = "{CALL Configuracion.sp_ListarCatalogos}"
+
+    # Versión actual de los catálogos (crece con cada cambio; 0 si la tabla de versión está vacía)
+    @instrumented("version_catalogos", "Configuracion.sp_VersionCatalogos")
+    def version(self):
+        with conexion.get_connection_pool().connection(self.SQL_VERSION) as (database, cursor):
+            cursor.execute(self.SQL_VERSION)
+            row = cursor.fetchone()
+        return int(row[0]) if row is not None else 0
+
+    # Lee los cuatro catálogos en una sola llamada: la versión y luego un conjunto de resultados por tabla
+    @instrumented("listar_catalogos", "Configuracion.sp_ListarCatalogos")
+    def listar(self):
+        with conexion.get_connection_pool().connection(self.SQL_LISTAR) as (database, cursor):
+            cursor.execute(self.SQL_LISTAR)
+            row = cursor.fetchone()
+            filasPorTabla = [cursor.fetchall() if cursor.nextset() else [] for _ in TABLAS_CATALOGO]
+        return Catalogos.desde_filas(row[0] if row is not None else 0, filasPorTabla)
\ No newline at end of file
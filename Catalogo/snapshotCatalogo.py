@@ -0,0 +1,99 @@
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+
+from Catalogo.modeloCatalogo import TABLAS_CATALOGO, Catalogos
+
+# Archivo local con los catálogos, para no consultarlos a la base de datos al iniciar.
+# Formato binario (little-endian), pensado para leerse con mmap sin copiar el archivo a memoria:
+#   cabecera: MAGIA, FORMATO, número de tablas, versión de los catálogos, huella del origen, CRC32 del cuerpo
+#   cuerpo:   por cada tabla de TABLAS_CATALOGO, el número de filas y luego cada fila campo por campo
+#             (enteros de 8 bytes; textos UTF-8 precedidos de su longitud en 4 bytes)
+# La huella del origen (SHA-1 de la cadena de conexión) evita usar el archivo de otra base de datos
+MAGIA = b"CATALOGO"
+FORMATO = 1
+CABECERA = struct.Struct("<8sHHq20sI")
+NUMERO_FILAS = struct.Struct("<I")
+ENTERO = struct.Struct("<q")
+LONGITUD = struct.Struct("<I")
+
+# Tipo de cada campo (int o str) de cada tabla, en el orden de TABLAS_CATALOGO
+_TIPOS = tuple(tuple(tipo.__annotations__[campo] for campo in tipo._fields) for _, tipo in TABLAS_CATALOGO)
+
+def huella_origen(origen):
+    return hashlib.sha1(str(origen).encode("utf-8")).digest()
+
+# Escribe el archivo completo en un temporal y lo reemplaza de una vez (un lector nunca ve un archivo a medias)
+def guardar_snapshot(ruta, catalogos, origen):
+    cuerpo = bytearray()
+    for tipos, filas in zip(_TIPOS, catalogos.filas()):
+        filas = list(filas)
+        cuerpo += NUMERO_FILAS.pack(len(filas))
+        for fila in filas:
+            for tipo, valor in zip(tipos, fila):
+                if tipo is int:
+                    cuerpo += ENTERO.pack(valor)
+                else:
+                    texto = str(valor).encode("utf-8")
+                    cuerpo += LONGITUD.pack(len(texto))
+                    cuerpo += texto
+
+    cabecera = CABECERA.pack(MAGIA, FORMATO, len(TABLAS_CATALOGO), catalogos.version, huella_origen(origen),
+                             zlib.crc32(cuerpo))
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(cabecera)
+        archivo.write(cuerpo)
+    os.replace(temporal, ruta)
+
+# Lee el archivo y devuelve (Catalogos, instante de la última modificación), o None si no existe,
+# es de otro origen o de otro formato, o está dañado
+def leer_snapshot(ruta, origen):
+    try:
+        with open(ruta, "rb") as archivo:
+            modificado = os.fstat(archivo.fileno()).st_mtime
+            with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+                catalogos = _decodificar(datos, origen)
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+    return None if catalogos is None else (catalogos, modificado)
+
+# Marca el archivo como vigente (la versión de la base de datos no cambió) sin volver a escribirlo
+def marcar_vigente(ruta):
+    try:
+        os.utime(ruta)
+    except OSError:
+        pass
+
+def _decodificar(datos, origen):
+    magia, formato, numeroTablas, version, huella, crc = CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA or formato != FORMATO or numeroTablas != len(TABLAS_CATALOGO):
+        return None
+    if huella != huella_origen(origen) or zlib.crc32(datos[CABECERA.size:]) != crc:
+        return None
+
+    posicion = CABECERA.size
+    filasPorTabla = []
+    for tipos in _TIPOS:
+        (numeroFilas,) = NUMERO_FILAS.unpack_from(datos, posicion)
+        posicion += NUMERO_FILAS.size
+        filas = []
+        for _ in range(numeroFilas):
+            fila = []
+            for tipo in tipos:
+                if tipo is int:
+                    fila.append(ENTERO.unpack_from(datos, posicion)[0])
+                    posicion += ENTERO.size
+                else:
+                    (longitud,) = LONGITUD.unpack_from(datos, posicion)
+                    posicion += LONGITUD.size
+                    fila.append(datos[posicion:posicion + longitud].decode("utf-8"))
+                    posicion += longitud
+            filas.append(fila)
+        filasPorTabla.append(filas)
+
+    if posicion != len(datos):
+        return None
+    return Catalogos.desde_filas(version, filasPorTabla)
\ No newline at end of file
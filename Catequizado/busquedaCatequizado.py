@@ -0,0 +1,297 @@
+import heapq
+import json
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+
+# Valores por defecto de la búsqueda (se pueden sobrescribir en la sección "busqueda" de config.json)
+DEFAULT_BUSQUEDA_CONFIG = {
+    "umbral_similitud": 0.3,      # Similitud mínima de trigramas para aceptar una palabra con errores de escritura
+    "max_palabras_similares": 50  # Palabras parecidas que se consideran como máximo por cada término
+}
+
+# Peso de cada campo en el puntaje: un apellido pesa más que el nombre de la parroquia
+PESOS_CAMPOS = (
+    ("apellidos", 1.0),
+    ("nombres", 0.9),
+    ("nombreRepresentante", 0.6),
+    ("nombreParroquia", 0.4)
+)
+
+# Quita tildes y diéresis, pasa a minúsculas y deja solo letras y números ("García Peña" -> "garcia pena")
+def normalizar(texto):
+    if not texto:
+        return ""
+    descompuesto = unicodedata.normalize("NFKD", str(texto))
+    sin_tildes = "".join(caracter for caracter in descompuesto if not unicodedata.combining(caracter))
+    return "".join(caracter if caracter.isalnum() else " " for caracter in sin_tildes.casefold())
+
+# Palabras normalizadas de un texto, sin repetir y en el orden en que aparecen
+def palabras(texto):
+    return list(dict.fromkeys(normalizar(texto).split()))
+
+# Trigramas de una palabra con el mismo relleno que pg_trgm ("  ana " -> "  a", " an", "ana", "na ")
+def trigramas(palabra):
+    relleno = f"  {palabra} "
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+# Índice invertido en memoria sobre nombres, apellidos, representante y parroquia.
+# Cada palabra apunta a los catequizados que la contienen y cada trigrama a las palabras que lo contienen,
+# así una búsqueda solo recorre las palabras que coinciden y nunca la tabla completa
+class IndiceBusquedaCatequizado:
+    def __init__(self, umbral_similitud=0.3, max_palabras_similares=50):
+        self.umbral_similitud = umbral_similitud
+        self.max_palabras_similares = max_palabras_similares
+        self._lock = threading.RLock()
+        self._lock_construccion = threading.Lock()
+        self._vaciar()
+        self.cargado = False
+        # Cédulas modificadas mientras se construía el índice (se aplican al terminar)
+        self._construyendo = False
+        self._pendientes = set()
+        # Invalidación pedida mientras se construía el índice (se aplica al terminar)
+        self._invalidado = False
+        self._segundos_construccion = None
+
+    def _vaciar(self):
+        # idCatequizado -> registro Catequizado
+        self._documentos = {}
+        # cédula -> idCatequizado (los cambios llegan identificados por cédula)
+        self._ids_por_cedula = {}
+        # palabra -> {idCatequizado: peso del campo donde aparece}
+        self._palabras = {}
+        # palabras ordenadas, para encontrar por bisección todas las que empiezan con un prefijo
+        self._vocabulario = []
+        # trigrama -> palabras que lo contienen
+        self._trigramas = {}
+
+    # --- CONSTRUCCIÓN Y ACTUALIZACIÓN ---
+
+    # Construye el índice la primera vez que se necesita. 'fuente' devuelve un iterable de registros Catequizado
+    # (leído por páginas, sin cargar la tabla de una vez) y 'resolver' busca el registro actual de una cédula
+    def cargar(self, fuente, resolver):
+        if self.cargado:
+            return
+        with self._lock_construccion:
+            # Si llegó una invalidación durante la lectura, el índice se descarta al terminar y se vuelve a leer
+            while not self.cargado:
+                self.reconstruir(fuente, resolver)
+
+    # Vuelve a leer todos los registros; las búsquedas siguen usando el índice anterior hasta el reemplazo
+    def reconstruir(self, fuente, resolver):
+        inicio = time.perf_counter()
+        with self._lock:
+            self._construyendo = True
+            self._pendientes = set()
+            self._invalidado = False
+        try:
+            nuevo = IndiceBusquedaCatequizado(self.umbral_similitud, self.max_palabras_similares)
+            for catequizado in fuente():
+                nuevo._agregar(catequizado)
+        except Exception:
+            with self._lock:
+                self._construyendo = False
+                if self._invalidado:
+                    self._invalidado = False
+                    self._vaciar()
+                    self.cargado = False
+            raise
+
+        with self._lock:
+            self._construyendo = False
+            # Una invalidación (p. ej. una importación masiva) llegó durante la lectura: lo leído puede no incluir
+            # esos cambios, así que se aplica ahora en lugar de publicar el índice nuevo
+            if self._invalidado:
+                self._invalidado = False
+                self._pendientes = set()
+                self._vaciar()
+                self.cargado = False
+                return
+            self._documentos = nuevo._documentos
+            self._ids_por_cedula = nuevo._ids_por_cedula
+            self._palabras = nuevo._palabras
+            self._vocabulario = nuevo._vocabulario
+            self._trigramas = nuevo._trigramas
+            self.cargado = True
+            pendientes, self._pendientes = self._pendientes, set()
+        self._segundos_construccion = round(time.perf_counter() - inicio, 3)
+
+        # Los registros modificados durante la lectura pueden haber llegado con sus datos anteriores
+        self.actualizar(pendientes, resolver)
+
+    # Aplica los cambios de un registro, actualización o eliminación. Si el índice todavía no se ha cargado
+    # no hace nada; si se está construyendo, las cédulas quedan pendientes hasta que termine
+    def actualizar(self, cedulas, resolver):
+        with self._lock:
+            if self._construyendo:
+                self._pendientes.update(cedulas)
+                return
+            if not self.cargado:
+                return
+
+        try:
+            for cedula in cedulas:
+                catequizado = resolver(cedula)
+                with self._lock:
+                    self._quitar(self._ids_por_cedula.get(cedula))
+                    if catequizado is not None:
+                        self._quitar(catequizado.idCatequizado)
+                        self._agregar(catequizado)
+        except Exception:
+            # Si no se pudo leer el registro actual, el índice se reconstruye en la próxima búsqueda
+            self.invalidar()
+
+    # Descarta el índice (p. ej. tras una importación masiva); se vuelve a construir en la próxima búsqueda.
+    # Si se está construyendo, la invalidación queda pendiente hasta que termine
+    def invalidar(self):
+        with self._lock:
+            if self._construyendo:
+                self._invalidado = True
+                return
+            self._vaciar()
+            self.cargado = False
+
+    def _agregar(self, catequizado):
+        idCatequizado = catequizado.idCatequizado
+        self._documentos[idCatequizado] = catequizado
+        self._ids_por_cedula[catequizado.cedulaIdentidad] = idCatequizado
+        for campo, peso in PESOS_CAMPOS:
+            for palabra in palabras(getattr(catequizado, campo)):
+                documentos = self._palabras.get(palabra)
+                if documentos is None:
+                    documentos = self._palabras[palabra] = {}
+                    insort(self._vocabulario, palabra)
+                    for trigrama in trigramas(palabra):
+                        self._trigramas.setdefault(trigrama, set()).add(palabra)
+                # Si la palabra aparece en varios campos cuenta el de mayor peso
+                if peso > documentos.get(idCatequizado, 0):
+                    documentos[idCatequizado] = peso
+
+    def _quitar(self, idCatequizado):
+        catequizado = self._documentos.pop(idCatequizado, None)
+        if catequizado is None:
+            return
+        if self._ids_por_cedula.get(catequizado.cedulaIdentidad) == idCatequizado:
+            del self._ids_por_cedula[catequizado.cedulaIdentidad]
+        for campo, peso in PESOS_CAMPOS:
+            for palabra in palabras(getattr(catequizado, campo)):
+                documentos = self._palabras.get(palabra)
+                if documentos is None:
+                    continue
+                documentos.pop(idCatequizado, None)
+                # Las palabras que ya no usa ningún catequizado salen del vocabulario y de los trigramas
+                if not documentos:
+                    del self._palabras[palabra]
+                    del self._vocabulario[bisect_left(self._vocabulario, palabra)]
+                    for trigrama in trigramas(palabra):
+                        palabrasTrigrama = self._trigramas.get(trigrama)
+                        if palabrasTrigrama is not None:
+                            palabrasTrigrama.discard(palabra)
+                            if not palabrasTrigrama:
+                                del self._trigramas[trigrama]
+
+    # --- BÚSQUEDA ---
+
+    # Palabras del vocabulario que coinciden con un término y su similitud (1 = idéntica).
+    # Los prefijos puntúan más que las palabras parecidas por trigramas (errores de escritura)
+    def _coincidencias(self, termino):
+        coincidencias = {}
+        posicion = bisect_left(self._vocabulario, termino)
+        while posicion < len(self._vocabulario) and self._vocabulario[posicion].startswith(termino):
+            palabra = self._vocabulario[posicion]
+            coincidencias[palabra] = 1.0 if palabra == termino else 0.6 + 0.4 * len(termino) / len(palabra)
+            posicion += 1
+
+        # Con menos de 3 letras los trigramas no discriminan: solo se usa el prefijo
+        if len(termino) >= 3:
+            trigramasTermino = trigramas(termino)
+            compartidos = {}
+            for trigrama in trigramasTermino:
+                for palabra in self._trigramas.get(trigrama, ()):
+                    compartidos[palabra] = compartidos.get(palabra, 0) + 1
+            similares = []
+            for palabra, comunes in compartidos.items():
+                if palabra in coincidencias:
+                    continue
+                similitud = comunes / (len(trigramasTermino) + len(palabra) + 1 - comunes)
+                if similitud >= self.umbral_similitud:
+                    similares.append((similitud, palabra))
+            for similitud, palabra in heapq.nlargest(self.max_palabras_similares, similares):
+                coincidencias[palabra] = 0.6 * similitud
+        return coincidencias
+
+    # Busca catequizados que coincidan con todas las palabras del texto (en cualquiera de los campos indexados),
+    # opcionalmente solo en una parroquia. Devuelve la página pedida (empezando en 1), ordenada de mayor a menor
+    # puntaje, y el total de coincidencias
+    def buscar(self, texto, idParroquia=None, pagina=1, tamanioPagina=20):
+        terminos = palabras(texto)
+        if not terminos or pagina < 1 or tamanioPagina < 1:
+            return [], 0
+
+        with self._lock:
+            puntajes = None
+            # Los términos más largos son los más selectivos: se procesan primero para reducir los candidatos
+            for termino in sorted(terminos, key=len, reverse=True):
+                puntajesTermino = {}
+                for palabra, similitud in self._coincidencias(termino).items():
+                    for idCatequizado, peso in self._palabras[palabra].items():
+                        if puntajes is not None and idCatequizado not in puntajes:
+                            continue
+                        if idParroquia is not None and \
+                                self._documentos[idCatequizado].idParroquiaPertenece != idParroquia:
+                            continue
+                        valor = similitud * peso
+                        if valor > puntajesTermino.get(idCatequizado, 0):
+                            puntajesTermino[idCatequizado] = valor
+
+                if puntajes is None:
+                    puntajes = puntajesTermino
+                else:
+                    puntajes = {idCatequizado: puntajes[idCatequizado] + valor
+                                for idCatequizado, valor in puntajesTermino.items()}
+                if not puntajes:
+                    return [], 0
+
+            # Solo se ordenan los candidatos necesarios para llegar a la página pedida
+            documentos = self._documentos
+            mejores = heapq.nsmallest(
+                pagina * tamanioPagina, puntajes.items(),
+                key=lambda item: (-item[1], documentos[item[0]].apellidos, documentos[item[0]].nombres, item[0]))
+            resultados = [documentos[idCatequizado] for idCatequizado, puntaje in mejores[(pagina - 1) * tamanioPagina:]]
+            return resultados, len(puntajes)
+
+    # Tamaño del índice para dimensionar la memoria
+    def estadisticas(self):
+        with self._lock:
+            return {
+                "cargado": self.cargado,
+                "catequizados": len(self._documentos),
+                "palabras": len(self._vocabulario),
+                "trigramas": len(self._trigramas),
+                "segundos_construccion": self._segundos_construccion
+            }
+
+
+# Índice compartido por todo el proceso (se crea la primera vez que se necesita)
+_indice = None
+_indice_lock = threading.Lock()
+
+# Función para leer la configuración de la búsqueda (usa los valores por defecto si no existe la sección o el archivo)
+def get_busqueda_config(config_file='config.json'):
+    busqueda_config = dict(DEFAULT_BUSQUEDA_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            busqueda_config.update(json.load(file).get('busqueda', {}))
+    except FileNotFoundError:
+        pass
+    return busqueda_config
+
+# Función que devuelve el índice de búsqueda compartido
+def get_indice_catequizados(config_file='config.json'):
+    global _indice
+    if _indice is None:
+        with _indice_lock:
+            if _indice is None:
+                _indice = IndiceBusquedaCatequizado(**get_busqueda_config(config_file))
+    return _indice
\ No newline at end of file
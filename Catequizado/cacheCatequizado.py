@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# Valores por defecto de la caché (se pueden sobrescribir en la sección "cache" de config.json)
+DEFAULT_CACHE_CONFIG = {
+    "max_size": 1000,   # Máximo de catequizados guardados; al superarlo se descarta el usado hace más tiempo
+    "ttl": 300          # Segundos que un registro se considera vigente
+}
+
+# Franjas de generaciones de invalidación (ver CacheCatequizado.generacion)
+FRANJAS_GENERACION = 1024
+
+# Clase de caché LRU con tiempo de vida para filas de catequizados indexadas por cédula
+class CacheCatequizado:
+    def __init__(self, max_size=1000, ttl=300):
+        if max_size < 1:
+            raise ValueError("El tamaño máximo de la caché debe ser mayor que cero.")
+        self.max_size = max_size
+        self.ttl = ttl
+        # cédula -> (instante de expiración, fila); el orden refleja el uso (el más reciente al final)
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        # Generación de invalidación por franja de claves (hash % FRANJAS_GENERACION): crece con cada invalidación
+        # de una clave de la franja. Memoria fija; dos claves de la misma franja solo hacen que se omita un guardado
+        self._generaciones = [0] * FRANJAS_GENERACION
+        self._contadores = {"aciertos": 0, "fallos": 0, "desalojos": 0, "expiraciones": 0, "invalidaciones": 0,
+                            "omitidos": 0}
+
+    # Devuelve la fila guardada para la cédula o None si no está o ya expiró
+    def obtener(self, cedulaIdentidad):
+        with self._lock:
+            entrada = self._entradas.get(cedulaIdentidad)
+            if entrada is None:
+                self._contadores["fallos"] += 1
+                return None
+            expira, fila = entrada
+            if time.monotonic() >= expira:
+                del self._entradas[cedulaIdentidad]
+                self._contadores["expiraciones"] += 1
+                self._contadores["fallos"] += 1
+                return None
+            self._entradas.move_to_end(cedulaIdentidad)
+            self._contadores["aciertos"] += 1
+            return fila
+
+    # Generación de invalidación de la cédula: se toma antes de leer de la base de datos y se pasa a guardar()
+    def generacion(self, cedulaIdentidad):
+        with self._lock:
+            return self._generaciones[hash(cedulaIdentidad) % FRANJAS_GENERACION]
+
+    # Guarda (o reemplaza) la fila de una cédula, desalojando la menos usada si se supera el tamaño.
+    # Con 'generacion' no se guarda si la cédula se invalidó después de tomarla: la fila se leyó antes de
+    # una actualización o eliminación concurrente y quedaría en la caché hasta que expire
+    def guardar(self, cedulaIdentidad, fila, generacion=None):
+        with self._lock:
+            if generacion is not None and generacion != self._generaciones[hash(cedulaIdentidad) % FRANJAS_GENERACION]:
+                self._contadores["omitidos"] += 1
+                return
+            self._entradas[cedulaIdentidad] = (time.monotonic() + self.ttl, fila)
+            self._entradas.move_to_end(cedulaIdentidad)
+            while len(self._entradas) > self.max_size:
+                self._entradas.popitem(last=False)
+                self._contadores["desalojos"] += 1
+
+    # Elimina de la caché las cédulas indicadas (tras registrar, actualizar o eliminar)
+    def invalidar(self, *cedulas):
+        with self._lock:
+            for cedulaIdentidad in cedulas:
+                self._generaciones[hash(cedulaIdentidad) % FRANJAS_GENERACION] += 1
+                if self._entradas.pop(cedulaIdentidad, None) is not None:
+                    self._contadores["invalidaciones"] += 1
+
+    # Vacía la caché por completo
+    def limpiar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._generaciones = [generacion + 1 for generacion in self._generaciones]
+
+    # Contadores para dimensionar la caché
+    def estadisticas(self):
+        with self._lock:
+            consultas = self._contadores["aciertos"] + self._contadores["fallos"]
+            estadisticas = dict(self._contadores)
+            estadisticas["tamanio"] = len(self._entradas)
+            estadisticas["max_size"] = self.max_size
+            estadisticas["tasa_aciertos"] = self._contadores["aciertos"] / consultas if consultas else 0.0
+            return estadisticas
+
+
+# Caché compartida por todo el proceso (se crea la primera vez que se necesita)
+_cache = None
+_cache_lock = threading.Lock()
+
+# Función para leer la configuración de la caché (usa los valores por defecto si no existe la sección o el archivo)
+def get_cache_config(config_file='config.json'):
+    cache_config = dict(DEFAULT_CACHE_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            cache_config.update(json.load(file).get('cache', {}))
+    except FileNotFoundError:
+        pass
+    return cache_config
+
+# Función que devuelve la caché compartida de catequizados
+def get_cache_catequizados(config_file='config.json'):
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CacheCatequizado(**get_cache_config(config_file))
+    return _cache
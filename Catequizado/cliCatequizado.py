@@ -0,0 +1,324 @@
+import argparse
+import csv
+import json
+import shlex
+import sys
+
+from Catequizado.procedimientosCatequizado import (CODIGO_CEDULA_INVALIDA, CODIGO_EMAIL_INVALIDO,
+                                                   CODIGO_TELEFONO_INVALIDO)
+from Catequizado.validacionesCatequizado import (CAMPOS_CATEQUIZADO, MENSAJE_CEDULA, MENSAJE_EMAIL, MENSAJE_TELEFONO,
+                                                 validar_campos_catequizado, validar_formatos_catequizado)
+
+# Interfaz de línea de comandos sin menú, para scripts, cron o pipelines:
+#   python main.py registrar --json datos.json
+#   python main.py --formato csv listar --parroquia 3 > parroquia3.csv
+#   python main.py lote comandos.txt
+# Solo se importan aquí módulos livianos: el repositorio (y con él el pool, la configuración y pyodbc)
+# se carga dentro de cada comando que llega a la base de datos, así --help y --solo-validar arrancan al instante.
+
+# Códigos de salida. Las operaciones terminan con el código del procedimiento (0 = OK, 1-8 y 50, ver
+# procedimientosCatequizado); los errores del propio comando usan los valores de sysexits.h
+SALIDA_OK = 0
+SALIDA_USO = 64
+SALIDA_DATOS_INVALIDOS = 65
+SALIDA_SIN_ARCHIVO = 66
+SALIDA_BASE_DATOS = 69
+SALIDA_ERROR_INTERNO = 70
+
+# Mismos códigos que usan los procedimientos para datos inválidos (la validación de cliente responde igual)
+CODIGO_DATOS_INVALIDOS = 1
+CODIGOS_FORMATO = {
+    MENSAJE_CEDULA: CODIGO_CEDULA_INVALIDA,
+    MENSAJE_TELEFONO: CODIGO_TELEFONO_INVALIDO,
+    MENSAJE_EMAIL: CODIGO_EMAIL_INVALIDO
+}
+
+# Error de argumentos: se lanza en lugar de terminar el proceso para que un lote pueda seguir con la siguiente línea
+class ErrorUso(Exception):
+    pass
+
+class _Parser(argparse.ArgumentParser):
+    def error(self, message):
+        self.print_usage(sys.stderr)
+        raise ErrorUso(f"{self.prog}: error: {message}")
+
+
+# Escribe los resultados en JSON (un documento por línea) o CSV
+class SalidaComando:
+    def __init__(self, formato='json', flujo=None):
+        self.formato = formato
+        self.flujo = flujo or sys.stdout
+
+    def _json(self, valor):
+        # Fechas y decimales de pyodbc se escriben como texto
+        self.flujo.write(json.dumps(valor, ensure_ascii=False, default=str) + "\n")
+
+    def _csv(self):
+        return csv.writer(self.flujo, lineterminator="\n")
+
+    # Resultado de una operación (ResultadoOperacion o equivalente); devuelve el código de salida
+    def resultado(self, ok, codigo, mensaje, datos=None):
+        if self.formato == 'json':
+            self._json({"ok": ok, "codigo": codigo, "mensaje": mensaje,
+                        "datos": datos._asdict() if datos is not None else None})
+        elif datos is not None:
+            escritor = self._csv()
+            escritor.writerow(datos._fields)
+            escritor.writerow(datos)
+        else:
+            escritor = self._csv()
+            escritor.writerow(("ok", "codigo", "mensaje"))
+            escritor.writerow((ok, codigo, mensaje))
+        return codigo
+
+    # Registros Catequizado a medida que llegan (en JSON, un arreglo escrito elemento por elemento)
+    def registros(self, campos, registros):
+        if self.formato == 'json':
+            self.flujo.write("[")
+            for indice, registro in enumerate(registros):
+                self.flujo.write(("," if indice else "") +
+                                 json.dumps(registro._asdict(), ensure_ascii=False, default=str))
+            self.flujo.write("]\n")
+        else:
+            escritor = self._csv()
+            escritor.writerow(campos)
+            escritor.writerows(registros)
+
+    # Reporte de importación o validación: en CSV solo se escriben las filas rechazadas
+    def reporte(self, reporte):
+        if self.formato == 'json':
+            self._json(reporte)
+        else:
+            escritor = self._csv()
+            escritor.writerow(("fila", "cedula", "mensaje"))
+            # Las advertencias (solo en --solo-validar) van junto a los errores, en el orden del archivo
+            filas = reporte["errores"] + reporte.get("advertencias", [])
+            for error in sorted(filas, key=lambda error: error["fila"]):
+                escritor.writerow((error["fila"], error["cedula"], error["mensaje"]))
+
+
+# --- LECTURA DE DATOS ---
+
+# Datos de un catequizado: primero el objeto JSON de --json (archivo o '-' para stdin), luego las opciones sueltas
+def _datos_catequizado(args, base=None):
+    datos = dict(base or {})
+    if args.json is not None:
+        if args.json == '-':
+            leidos = json.load(sys.stdin)
+        else:
+            with open(args.json, 'r', encoding='utf-8-sig') as archivo:
+                leidos = json.load(archivo)
+        if not isinstance(leidos, dict):
+            raise ErrorUso("El JSON de entrada debe ser un objeto con los campos del catequizado.")
+        datos.update({campo: leidos[campo] for campo in CAMPOS_CATEQUIZADO if campo in leidos})
+    for campo in CAMPOS_CATEQUIZADO:
+        valor = getattr(args, campo)
+        if valor is not None:
+            datos[campo] = valor
+    # Los campos que faltan quedan vacíos para que la validación los informe
+    return {campo: datos.get(campo, "") for campo in CAMPOS_CATEQUIZADO}
+
+# Validación de cliente completa, como la de 'importar --solo-validar': campos y fechas, y después los formatos
+# de cédula, teléfono y correo que también comprueba el procedimiento. Devuelve (es_valido, codigo, mensaje)
+# con el código que habría devuelto el procedimiento (2, 3 o 4 para los formatos)
+def _validar_datos(datos):
+    es_valido, mensaje = validar_campos_catequizado(datos)
+    if not es_valido:
+        return False, CODIGO_DATOS_INVALIDOS, mensaje
+    es_valido, mensaje = validar_formatos_catequizado(datos)
+    if not es_valido:
+        return False, CODIGOS_FORMATO.get(mensaje, CODIGO_DATOS_INVALIDOS), mensaje
+    return True, SALIDA_OK, mensaje
+
+def _repositorio():
+    from Catequizado.repositorioCatequizado import RepositorioCatequizado
+    return RepositorioCatequizado()
+
+
+# --- COMANDOS ---
+
+def comando_registrar(args, salida):
+    datos = _datos_catequizado(args)
+    es_valido, codigo, mensaje = _validar_datos(datos)
+    if not es_valido:
+        return salida.resultado(False, codigo, mensaje)
+    if args.solo_validar:
+        return salida.resultado(True, SALIDA_OK, "OK: Datos válidos.")
+
+    from Catequizado.modeloCatequizado import Catequizado
+    resultado = _repositorio().registrar(Catequizado.desde_diccionario(datos))
+    return salida.resultado(resultado.ok, resultado.codigo, resultado.mensaje)
+
+def comando_buscar(args, salida):
+    resultado = _repositorio().buscarPorCedula(args.cedula)
+    return salida.resultado(resultado.ok, resultado.codigo, resultado.mensaje, resultado.datos)
+
+# Solo se envían los campos que cambian: el resto se toma del registro actual, como en el menú
+def comando_actualizar(args, salida):
+    repositorio = _repositorio()
+    actual = repositorio.buscarPorCedula(args.cedula_actual)
+    if not actual.ok:
+        return salida.resultado(actual.ok, actual.codigo, actual.mensaje)
+
+    datos = _datos_catequizado(args, {campo: getattr(actual.datos, campo) for campo in CAMPOS_CATEQUIZADO})
+    es_valido, codigo, mensaje = _validar_datos(datos)
+    if not es_valido:
+        return salida.resultado(False, codigo, mensaje)
+
+    from Catequizado.modeloCatequizado import Catequizado
+    resultado = repositorio.actualizar(args.cedula_actual, Catequizado.desde_diccionario(datos))
+    return salida.resultado(resultado.ok, resultado.codigo, resultado.mensaje)
+
+def comando_eliminar(args, salida):
+    resultado = _repositorio().eliminar(args.cedula)
+    return salida.resultado(resultado.ok, resultado.codigo, resultado.mensaje)
+
+# Recorre la tabla por páginas y escribe cada registro a medida que llega (no se carga el listado completo)
+def comando_listar(args, salida):
+    from Catequizado.modeloCatequizado import Catequizado
+    salida.registros(Catequizado._fields, _repositorio().iterar(args.parroquia, args.tamanio_pagina))
+    return SALIDA_OK
+
+def comando_importar(args, salida):
+    from Catequizado.importadorCatequizado import ImportadorCatequizado
+    importador = ImportadorCatequizado(args.tamanio_lote)
+    reporte = importador.validar(args.archivo) if args.solo_validar else importador.importar(args.archivo)
+    salida.reporte(reporte)
+    return SALIDA_DATOS_INVALIDOS if reporte["rechazados"] else SALIDA_OK
+
+# Ejecuta un comando por línea (archivo o '-' para stdin) en el mismo proceso. Las operaciones son
+# secuenciales, así que todas reutilizan la misma conexión del pool. Termina con el primer código distinto de 0
+def comando_lote(args, salida):
+    primer_error = SALIDA_OK
+    archivo = sys.stdin if args.archivo == '-' else open(args.archivo, 'r', encoding='utf-8-sig')
+    try:
+        for numero_linea, linea in enumerate(archivo, start=1):
+            linea = linea.strip()
+            if not linea or linea.startswith('#'):
+                continue
+            try:
+                argumentos = shlex.split(linea)
+            except ValueError as e:
+                print(f"Línea {numero_linea}: {e}", file=sys.stderr)
+                codigo = SALIDA_USO
+            else:
+                if argumentos[0] == 'lote':
+                    print(f"Línea {numero_linea}: un lote no puede ejecutar otro lote.", file=sys.stderr)
+                    codigo = SALIDA_USO
+                else:
+                    codigo = ejecutar(argumentos, salida.formato, salida.flujo)
+            if codigo != SALIDA_OK:
+                primer_error = primer_error or codigo
+                if args.detener:
+                    break
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+    return primer_error
+
+
+# --- ARGUMENTOS ---
+
+def _agregar_campos(parser):
+    parser.add_argument('--json', metavar='ARCHIVO',
+                        help="objeto JSON con los campos del catequizado ('-' para leerlo de stdin)")
+    for campo in CAMPOS_CATEQUIZADO:
+        parser.add_argument(f'--{campo}', dest=campo, metavar='VALOR')
+
+def crear_parser():
+    parser = _Parser(prog='main.py', description="Operaciones de catequizados sin menú interactivo. "
+                     "Sin argumentos, main.py abre el menú.",
+                     epilog="Código de salida: 0 = OK; 1-8 y 50 = código del procedimiento almacenado; "
+                            "64 = uso incorrecto, 65 = datos inválidos, 66 = archivo no encontrado, "
+                            "69 = error de base de datos, 70 = error interno.")
+    parser.add_argument('--formato', choices=('json', 'csv'), default='json', help="formato de salida (json)")
+    subparsers = parser.add_subparsers(dest='comando', required=True, metavar='COMANDO', parser_class=_Parser)
+
+    registrar = subparsers.add_parser('registrar', help="registra un catequizado")
+    _agregar_campos(registrar)
+    registrar.add_argument('--solo-validar', action='store_true', help="valida los datos sin conectarse")
+    registrar.set_defaults(funcion=comando_registrar)
+
+    buscar = subparsers.add_parser('buscar', help="busca un catequizado por cédula")
+    buscar.add_argument('cedula')
+    buscar.set_defaults(funcion=comando_buscar)
+
+    actualizar = subparsers.add_parser('actualizar', help="actualiza los campos indicados de un catequizado")
+    actualizar.add_argument('cedula_actual', metavar='CEDULA_ACTUAL')
+    _agregar_campos(actualizar)
+    actualizar.set_defaults(funcion=comando_actualizar)
+
+    eliminar = subparsers.add_parser('eliminar', help="elimina un catequizado por cédula")
+    eliminar.add_argument('cedula')
+    eliminar.set_defaults(funcion=comando_eliminar)
+
+    listar = subparsers.add_parser('listar', help="lista los catequizados (opcionalmente de una parroquia)")
+    listar.add_argument('--parroquia', type=int, help="ID de la parroquia")
+    listar.add_argument('--tamanio-pagina', type=int, default=500, help="filas por página leída (500)")
+    listar.set_defaults(funcion=comando_listar)
+
+    importar = subparsers.add_parser('importar', help="importa un archivo CSV, JSON Lines o arreglo JSON por lotes")
+    importar.add_argument('archivo', metavar='ARCHIVO')
+    importar.add_argument('--tamanio-lote', type=int, default=1000, help="registros por lote (1000)")
+    importar.add_argument('--solo-validar', action='store_true', help="valida el archivo sin conectarse")
+    importar.set_defaults(funcion=comando_importar)
+
+    lote = subparsers.add_parser('lote', help="ejecuta un comando por línea en un solo proceso y conexión")
+    lote.add_argument('archivo', metavar='ARCHIVO', nargs='?', default='-', help="archivo de comandos ('-' = stdin)")
+    lote.add_argument('--detener', action='store_true', help="se detiene en el primer comando con error")
+    lote.set_defaults(funcion=comando_lote)
+    return parser
+
+
+# --- EJECUCIÓN ---
+
+# Ejecuta un comando y devuelve su código de salida (los errores se informan por stderr, no como excepción)
+def ejecutar(argv, formato=None, flujo=None):
+    try:
+        args = crear_parser().parse_args(argv)
+    except ErrorUso as e:
+        print(e, file=sys.stderr)
+        return SALIDA_USO
+    except SystemExit as e:
+        # --help termina con SystemExit(0)
+        return e.code or SALIDA_OK
+
+    # Dentro de un lote se conserva el formato del lote salvo que la línea indique otro
+    if formato is not None and not any(argumento.startswith('--formato') for argumento in argv):
+        args.formato = formato
+    salida = SalidaComando(args.formato, flujo)
+    try:
+        return args.funcion(args, salida)
+    except ErrorUso as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        return SALIDA_USO
+    except (FileNotFoundError, IsADirectoryError) as e:
+        print(f"[ERROR] No se encontró el archivo: {e}", file=sys.stderr)
+        return SALIDA_SIN_ARCHIVO
+    except ValueError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        return SALIDA_DATOS_INVALIDOS
+    except Exception as e:
+        pyodbc = sys.modules.get("pyodbc")
+        if pyodbc is not None and isinstance(e, pyodbc.Error):
+            print(f"[ERROR] Error de base de datos: {e}", file=sys.stderr)
+            return SALIDA_BASE_DATOS
+        print(f"[ERROR] Error inesperado: {e}", file=sys.stderr)
+        return SALIDA_ERROR_INTERNO
+
+# Punto de entrada: ejecuta el comando y libera la auditoría, el pool y las métricas solo si se llegaron a crear
+def main(argv=None):
+    try:
+        return ejecutar(sys.argv[1:] if argv is None else argv)
+    finally:
+        # La auditoría pendiente se envía antes de cerrar el pool que usa para hacerlo
+        if "audit" in sys.modules:
+            sys.modules["audit"].close_audit_writer()
+        if "connection" in sys.modules:
+            sys.modules["connection"].close_connection_pool()
+        if "instrumentation" in sys.modules:
+            sys.modules["instrumentation"].close_instrumentation()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,166 @@
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import connection as conexion
+from Catalogo.cacheCatalogo import get_catalogo_referencia
+from Catequizado.modeloCatequizado import Catequizado
+from Catequizado.repositorioCatequizado import RepositorioCatequizado
+
+# Archivo de texto que calcula el SHA-256 de lo que se escribe (evita releer el archivo al terminar)
+class _ArchivoConHash:
+    def __init__(self, archivo):
+        self._archivo = archivo
+        self.hash = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, texto):
+        datos = texto.encode('utf-8')
+        self.hash.update(datos)
+        self.bytes += len(datos)
+        return self._archivo.write(datos)
+
+# Clase para exportar los catequizados en un archivo por parroquia, en paralelo.
+# Cada parroquia se lee en su propio hilo con una conexión del pool que conserva hasta terminar,
+# por lo que el tiempo total depende de la parroquia más grande y no de la tabla completa
+class ExportadorCatequizado:
+    COLUMNAS = Catequizado._fields
+    FORMATOS = ('csv', 'parquet')
+
+    def __init__(self, formato='csv', max_workers=None, tamanio_pagina=5000, tamanio_bloque=1000):
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato de exportación no soportado: '{formato}'. Use csv o parquet.")
+        if formato == 'parquet':
+            # pyarrow es opcional: solo se necesita para exportar en Parquet
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise ValueError("La exportación a Parquet requiere pyarrow (pip install pyarrow).") from None
+        self.formato = formato
+        self.max_workers = max_workers
+        self.tamanio_pagina = tamanio_pagina
+        self.tamanio_bloque = tamanio_bloque
+        self._repositorio = RepositorioCatequizado()
+
+    # Exporta las parroquias indicadas (por defecto todas las que tienen catequizados) y devuelve el manifiesto
+    def exportar(self, directorio, parroquias=None):
+        os.makedirs(directorio, exist_ok=True)
+        inicio = time.perf_counter()
+
+        # Las parroquias llegan de mayor a menor: las grandes empiezan primero y no quedan rezagadas al final
+        particiones = self._repositorio.contarPorParroquia()
+        if parroquias is not None:
+            parroquias = set(parroquias)
+            particiones = [particion for particion in particiones if particion[0] in parroquias]
+
+        archivos = []
+        if particiones:
+            # Los nombres de parroquia se resuelven una sola vez, antes de que los hilos tomen todas las conexiones
+            catalogos = get_catalogo_referencia().actual()
+            nombres = catalogos.nombresParroquia if catalogos is not None else None
+            # Un hilo por conexión del pool: ningún hilo queda esperando una conexión libre
+            max_workers = self.max_workers or conexion.get_connection_pool().max_size
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(particiones)),
+                                    thread_name_prefix="exportacion") as executor:
+                futuros = [executor.submit(self._exportar_particion, directorio, *particion, nombres)
+                           for particion in particiones]
+                archivos = [futuro.result() for futuro in futuros]
+
+        manifiesto = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "formato": self.formato,
+            "columnas": list(self.COLUMNAS),
+            "total_filas": sum(archivo["filas"] for archivo in archivos),
+            "segundos": round(time.perf_counter() - inicio, 3),
+            "errores": sum(1 for archivo in archivos if "error" in archivo),
+            "archivos": sorted(archivos, key=lambda archivo: archivo["idParroquia"])
+        }
+        with open(os.path.join(directorio, "manifest.json"), 'w', encoding='utf-8') as archivo:
+            json.dump(manifiesto, archivo, indent=2, ensure_ascii=False)
+        return manifiesto
+
+    # Exporta una parroquia; un error no detiene a las demás, queda registrado en su entrada del manifiesto
+    def _exportar_particion(self, directorio, idParroquia, nombreParroquia, filasEsperadas, nombres=None):
+        nombre_archivo = f"catequizados_parroquia_{idParroquia}.{self.formato}"
+        ruta = os.path.join(directorio, nombre_archivo)
+        entrada = {"idParroquia": idParroquia, "nombreParroquia": nombreParroquia, "archivo": nombre_archivo,
+                   "filas_esperadas": filasEsperadas, "filas": 0}
+        inicio = time.perf_counter()
+
+        try:
+            with conexion.get_connection_pool().connection() as (database, cursor):
+                catequizados = self._repositorio.iterar(idParroquia, self.tamanio_pagina, self.tamanio_bloque,
+                                                        cursor=cursor, nombresParroquia=nombres)
+                if self.formato == 'csv':
+                    filas, sha256, tamanio = self._escribir_csv(ruta, catequizados)
+                else:
+                    filas, sha256, tamanio = self._escribir_parquet(ruta, catequizados)
+        except Exception as e:
+            # No se deja un archivo a medias que pueda confundirse con uno completo
+            if os.path.exists(ruta):
+                os.remove(ruta)
+            entrada["error"] = str(e)
+            return entrada
+
+        entrada.update({"filas": filas, "sha256": sha256, "bytes": tamanio,
+                        "segundos": round(time.perf_counter() - inicio, 3)})
+        # El archivo tiene lo que se leyó, pero no coincide con el conteo inicial (cambios durante la exportación
+        # o una lectura incompleta): queda marcado como error para que el manifiesto no parezca válido
+        if filas != filasEsperadas:
+            entrada["error"] = f"Se exportaron {filas} filas de {filasEsperadas} esperadas."
+        return entrada
+
+    # Escribe las filas a medida que llegan del servidor; el SHA-256 se calcula sobre la marcha
+    def _escribir_csv(self, ruta, catequizados):
+        filas = 0
+        with open(ruta, 'wb') as archivo:
+            destino = _ArchivoConHash(archivo)
+            escritor = csv.writer(destino)
+            escritor.writerow(self.COLUMNAS)
+            for catequizado in catequizados:
+                escritor.writerow(catequizado)
+                filas += 1
+        return filas, destino.hash.hexdigest(), destino.bytes
+
+    # Escribe un grupo de filas de Parquet por cada página, sin cargar la parroquia completa en memoria
+    def _escribir_parquet(self, ruta, catequizados):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        filas = 0
+        escritor = None
+        try:
+            pagina = []
+            for catequizado in catequizados:
+                pagina.append(catequizado._asdict())
+                if len(pagina) == self.tamanio_pagina:
+                    escritor = self._escribir_grupo_parquet(pa, pq, ruta, escritor, pagina)
+                    filas += len(pagina)
+                    pagina = []
+            if pagina or escritor is None:
+                escritor = self._escribir_grupo_parquet(pa, pq, ruta, escritor, pagina)
+                filas += len(pagina)
+        finally:
+            if escritor is not None:
+                escritor.close()
+
+        # Parquet escribe metadatos al cerrar, así que el checksum se calcula sobre el archivo terminado
+        sha256 = hashlib.sha256()
+        with open(ruta, 'rb') as archivo:
+            for bloque in iter(lambda: archivo.read(1024 * 1024), b''):
+                sha256.update(bloque)
+        return filas, sha256.hexdigest(), os.path.getsize(ruta)
+
+    def _escribir_grupo_parquet(self, pa, pq, ruta, escritor, pagina):
+        if escritor is None:
+            # El esquema se toma de la primera página (o de las columnas si la parroquia no tiene filas)
+            tabla = pa.Table.from_pylist(pagina) if pagina else pa.table({columna: [] for columna in self.COLUMNAS})
+            escritor = pq.ParquetWriter(ruta, tabla.schema)
+        else:
+            tabla = pa.Table.from_pylist(pagina, schema=escritor.schema)
+        escritor.write_table(tabla)
+        return escritor
\ No newline at end of file
@@ -1,11 +1,16 @@
-import connection as conexion
+from Catequizado.modeloCatequizado import Catequizado, imprimir_catequizado
+from Catequizado.repositorioCatequizado import RepositorioCatequizado
 
-# Clase para gestionar las operaciones CRUD de un catequizado
+# Clase para gestionar las operaciones CRUD de un catequizado desde la consola.
+# El acceso a datos lo hace RepositorioCatequizado; esta clase solo arma el registro y muestra los resultados.
 class GestorCatequizado:
-    def __init__(self, idParroquiaPertenece=None, nombres=None, apellidos=None, cedulaIdentidad=None, 
-                 fechaNacimiento=None, direccionDomicilio=None, nombreRepresentante=None, telefonoRepresentante=None, 
+    # Repositorio sin estado compartido por todas las instancias
+    repositorio = RepositorioCatequizado()
+
+    def __init__(self, idParroquiaPertenece=None, nombres=None, apellidos=None, cedulaIdentidad=None,
+                 fechaNacimiento=None, direccionDomicilio=None, nombreRepresentante=None, telefonoRepresentante=None,
                  emailRepresentante=None, fechaBautismo=None, parroquiaBautismo=None):
-        
+
         self.idParroquiaPertenece = idParroquiaPertenece
         self.nombres = nombres
         self.apellidos = apellidos
@@ -17,16 +22,11 @@ class GestorCatequizado:
         self.emailRepresentante = emailRepresentante
         self.fechaBautismo = fechaBautismo
         self.parroquiaBautismo = parroquiaBautismo
-        
-    # Método para registrar un nuevo catequizado en la base de datos
-    def registrarCatequizado(self):
-        # Definir la sentencia SQL para llamar al procedimiento almacenado
-        SENTENCIA_SQL = """
-        DECLARE @msg VARCHAR(500)
-        {CALL Proceso.sp_RegistrarCatequizado(?,?,?,?,?,?,?,?,?,?,?,@msg OUTPUT)}
-        SELECT @msg AS mensaje_resultado"""
-        # Valores a insertar
-        values = (
+
+    # Registro inmutable con los datos de esta instancia
+    def aCatequizado(self):
+        return Catequizado(
+            None,
             self.idParroquiaPertenece,
             self.nombres,
             self.apellidos,
@@ -39,219 +39,100 @@ class GestorCatequizado:
             self.fechaBautismo,
             self.parroquiaBautismo
         )
-        
-        # Inicializar las variables de conexión
-        database = None
-        cursor = None
-        
-        # Establecer la conexión y ejecutar la consulta
+
+    # --- OPERACIONES SIN SALIDA POR CONSOLA (devuelven ResultadoOperacion) ---
+
+    def ejecutarRegistro(self, cancelacion=None):
+        return self.repositorio.registrar(self.aCatequizado(), cancelacion)
+
+    def ejecutarBusqueda(self, cedulaIdentidad, cancelacion=None):
+        return self.repositorio.buscarPorCedula(cedulaIdentidad, cancelacion)
+
+    def ejecutarActualizacion(self, cedulaIdentidadActualizar, cancelacion=None):
+        return self.repositorio.actualizar(cedulaIdentidadActualizar, self.aCatequizado(), cancelacion)
+
+    def ejecutarEliminacion(self, cedulaIdentidad, cancelacion=None):
+        return self.repositorio.eliminar(cedulaIdentidad, cancelacion)
+
+    # Devuelve una página de registros Catequizado y el ID desde el que empieza la siguiente (None si no hay más)
+    def listarPaginaCatequizados(self, desdeId=0, tamanioPagina=50, idParroquia=None, cancelacion=None):
+        return self.repositorio.listarPagina(desdeId, tamanioPagina, idParroquia, cancelacion)
+
+    # Devuelve una página de registros Catequizado ordenados por relevancia y el total de coincidencias
+    def buscarPaginaPorTexto(self, texto, idParroquia=None, pagina=1, tamanioPagina=20):
+        return self.repositorio.buscarPorTexto(texto, idParroquia, pagina, tamanioPagina)
+
+    # Generador de registros Catequizado que no carga la tabla completa en memoria
+    def iterarCatequizados(self, idParroquia=None, tamanioPagina=500, tamanioBloque=100):
+        return self.repositorio.iterar(idParroquia, tamanioPagina, tamanioBloque)
+
+    # --- OPERACIONES DE CONSOLA ---
+
+    # Método para registrar un nuevo catequizado en la base de datos
+    def registrarCatequizado(self):
         try:
-            connect = conexion.create_db_connection()
+            resultado = self.ejecutarRegistro()
         except Exception as e:
             print("Error durante la ejecución de la consulta:", e)
+            return
+
+        # Procesar el mensaje de resultado
+        if resultado.ok:
+            print(resultado.mensaje)
+            print(f'CATEQUIZADO {self.nombres} {self.apellidos} REGISTRADO EXITOSAMENTE.\n')
         else:
-            # Obtener la base de datos y el cursor
-            database, cursor = connect
-            # Ejecutar la sentencia SQL con los valores proporcionados
-            cursor.execute(SENTENCIA_SQL, values)
-            # Obtener el mensaje de resultado del procedimiento almacenado
-            row = cursor.fetchone()
-            
-            # Procesar el mensaje de resultado
-            if row:
-                mensaje_resultado = row.mensaje_resultado
-                if mensaje_resultado.startswith('OK:'):
-                    print(mensaje_resultado)
-                    print(f'CATEQUIZADO {self.nombres} {self.apellidos} REGISTRADO EXITOSAMENTE.\n')
-                    database.commit()
-                else:
-                    print(mensaje_resultado,"\n")
-                    database.rollback()
-            else:
-                print("\nNo se recibió ningún mensaje de resultado.\n")
-                database.rollback()
-        finally:
-            if cursor:
-                cursor.close()
-            if database:
-                database.close()
-            print("Conexión cerrada.\n")
-            
-    # Método para listar todos los catequizados
-    def listarCatequizados(self):
-        # Definir la sentencia SQL para llamar al procedimiento almacenado
-        SENTENCIA_SQL = "{CALL Proceso.sp_ListarCatequizados}"
-        
-        # Inicializar las variables de conexión
-        database = None
-        cursor = None
-        
-        # Establecer la conexión y ejecutar la consulta
+            print(resultado.mensaje,"\n")
+
+    # Método para listar todos los catequizados (opcionalmente solo los de una parroquia)
+    def listarCatequizados(self, idParroquia=None):
         try:
-            connect = conexion.create_db_connection()
-        except Exception as e:
-            print("\nError durante la ejecución de la consulta:", e)
-        else:
-            # Obtener la base de datos y el cursor
-            database, cursor = connect
-            # Ejecutar la sentencia SQL
-            cursor.execute(SENTENCIA_SQL)
-            # Obtener todos los registros devueltos por el procedimiento almacenado
-            rows = cursor.fetchall()
-            
             print("\n---------- LISTA DE CATEQUIZADOS ----------")
-            for row in rows:
-                for idx, column in enumerate(cursor.description):
-                    print(f"{column[0]}: {row[idx]}")
+            for catequizado in self.iterarCatequizados(idParroquia):
+                imprimir_catequizado(catequizado)
                 print("-------------------------------------------")
-        finally:
-            if cursor:
-                cursor.close()
-            if database:
-                database.close()
-            print("\nConexión cerrada.\n")
-    
-    # Método para buscar un catequizado por su cédula de identidad
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+
+    # Método para buscar un catequizado por su cédula de identidad (devuelve el registro o None)
     def buscarCatequizadoPorCedula(self, cedulaIdentidad):
-        # Definir la sentencia SQL para llamar al procedimiento almacenado
-        SENTENCIA_SQL = """
-        DECLARE @msg VARCHAR(500)
-        {CALL Proceso.sp_BuscarCatequizadoPorCedula(?,@msg OUTPUT)}
-        SELECT @msg AS mensaje_resultado
-        """
-        
-        # Inicializar las variables de conexión
-        database = None
-        cursor = None
-        
-        # Establecer la conexión y ejecutar la consulta
         try:
-            connect = conexion.create_db_connection()
+            resultado = self.ejecutarBusqueda(cedulaIdentidad)
         except Exception as e:
             print("\nError durante la ejecución de la consulta:", e)
-        else:
-            # Obtener la base de datos y el cursor
-            database, cursor = connect
-            # Ejecutar la sentencia SQL con los valores proporcionados
-            cursor.execute(SENTENCIA_SQL, cedulaIdentidad)
-            # Obtener el mensaje de resultado del procedimiento almacenado
-            row = cursor.fetchone()
-            
-            if len(row) > 1:
-                print("\n---------- CATEQUIZADO ENCONTRADO ----------")
-                for idx, column in enumerate(cursor.description):
-                    print(f"{column[0]}: {row[idx]}")
-                print("-------------------------------------------\n")
-                return row
-            else:
-                mensaje_resultado = row.mensaje_resultado
-                print(mensaje_resultado,"\n")
-                return None
-        finally:
-            if cursor:
-                cursor.close()
-            if database:
-                database.close()
-            print("Conexión cerrada.\n")
-            
+            return None
+
+        if resultado.ok:
+            print("\n---------- CATEQUIZADO ENCONTRADO ----------")
+            imprimir_catequizado(resultado.datos)
+            print("-------------------------------------------\n")
+            return resultado.datos
+        print(resultado.mensaje,"\n")
+        return None
+
     # Método para actualizar los datos de un catequizado
     def actualizarCatequizado(self, cedulaIdentidadActualizar):
-        SENTENCIA_SQL = """
-        DECLARE @msg VARCHAR(500)
-        {CALL Proceso.sp_ActualizarCatequizado(?,?,?,?,?,?,?,?,?,?,?,?,@msg OUTPUT)}
-        SELECT @msg AS mensaje_resultado"""
-        values = (
-            cedulaIdentidadActualizar,
-            self.idParroquiaPertenece,
-            self.nombres,
-            self.apellidos,
-            self.cedulaIdentidad,
-            self.fechaNacimiento,
-            self.direccionDomicilio,
-            self.nombreRepresentante,
-            self.telefonoRepresentante,
-            self.emailRepresentante,
-            self.fechaBautismo,
-            self.parroquiaBautismo
-        )
-        
-        # Inicializar las variables de conexión
-        database = None
-        cursor = None
-        
-        # Establecer la conexión y ejecutar la consulta
         try:
-            connect = conexion.create_db_connection()
+            resultado = self.ejecutarActualizacion(cedulaIdentidadActualizar)
         except Exception as e:
             print("Error durante la ejecución de la consulta:", e)
+            return
+
+        if resultado.ok:
+            print(resultado.mensaje)
+            print(f'CATEQUIZADO {self.nombres} {self.apellidos} ACTUALIZADO EXITOSAMENTE.\n')
         else:
-            # Obtener la base de datos y el cursor
-            database, cursor = connect
-            # Ejecutar la sentencia SQL con los valores proporcionados
-            cursor.execute(SENTENCIA_SQL, values)
-            # Obtener el mensaje de resultado del procedimiento almacenado
-            row = cursor.fetchone()
-            
-            # Procesar el mensaje de resultado
-            if row:
-                mensaje_resultado = row.mensaje_resultado
-                if mensaje_resultado.startswith('OK:'):
-                    print(mensaje_resultado)
-                    print(f'CATEQUIZADO {self.nombres} {self.apellidos} ACTUALIZADO EXITOSAMENTE.\n')
-                    database.commit()
-                else:
-                    print(mensaje_resultado,"\n")
-                    database.rollback()
-            else:
-                print("\nNo se recibió ningún mensaje de resultado.\n")
-                database.rollback()
-        finally:
-            if cursor:
-                cursor.close()
-            if database:
-                database.close()
-            print("Conexión cerrada.\n")
-            
+            print(resultado.mensaje,"\n")
+
     # Método para eliminar un catequizado por su cédula de identidad
     def eliminarCatequizado(self, cedulaIdentidad):
-        SENTENCIA_SQL = """
-        DECLARE @msg VARCHAR(500)
-        {CALL Proceso.sp_EliminarCatequizadoPorCedula(?,@msg OUTPUT)}
-        SELECT @msg AS mensaje_resultado"""
-        
-        # Inicializar las variables de conexión
-        database = None
-        cursor = None
-        
-        # Establecer la conexión y ejecutar la consulta
         try:
-            connect = conexion.create_db_connection()
+            resultado = self.ejecutarEliminacion(cedulaIdentidad)
         except Exception as e:
             print("Error durante la ejecución de la consulta:", e)
+            return
+
+        if resultado.ok:
+            print(resultado.mensaje, "\n")
+            print(f'CATEQUIZADO CON CÉDULA {cedulaIdentidad} ELIMINADO EXITOSAMENTE.\n')
         else:
-            # Obtener la base de datos y el cursor
-            database, cursor = connect
-            # Ejecutar la sentencia SQL con los valores proporcionados
-            cursor.execute(SENTENCIA_SQL, cedulaIdentidad)
-            # Obtener el mensaje de resultado del procedimiento almacenado
-            row = cursor.fetchone()
-            
-            # Procesar el mensaje de resultado
-            if row:
-                mensaje_resultado = row.mensaje_resultado
-                if mensaje_resultado.startswith('OK:'):
-                    print(mensaje_resultado, "\n")
-                    print(f'CATEQUIZADO CON CÉDULA {cedulaIdentidad} ELIMINADO EXITOSAMENTE.\n')
-                    database.commit()
-                else:
-                    print(mensaje_resultado,"\n")
-                    database.rollback()
-            else:
-                print("\nNo se recibió ningún mensaje de resultado.\n")
-                database.rollback()
-        finally:
-            if cursor:
-                cursor.close()
-            if database:
-                database.close()
-            print("Conexión cerrada.\n")
\ No newline at end of file
+            print(resultado.mensaje,"\n")
\ No newline at end of file
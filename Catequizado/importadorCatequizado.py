@@ -0,0 +1,188 @@
+import csv
+import json
+import os
+
+import connection as conexion
+from audit import audit_image, get_audit_writer
+from Catalogo.cacheCatalogo import get_catalogo_referencia
+from Catequizado.busquedaCatequizado import get_indice_catequizados
+from Catequizado.modeloCatequizado import Catequizado
+from Catequizado.repositorioCatequizado import RepositorioCatequizado
+from Catequizado.validacionesCatequizado import MENSAJE_PARROQUIA_SIN_VERIFICAR, validar_lote_catequizados
+
+# Clase para registrar catequizados de forma masiva a partir de archivos CSV, JSON Lines o arreglos JSON
+class ImportadorCatequizado:
+    # El lote completo viaja como un parámetro con valores de tabla (TVP) en una sola llamada
+    SENTENCIA_SQL = "{CALL Proceso.sp_RegistrarCatequizadosLote(?)}"
+
+    def __init__(self, tamanio_lote=1000):
+        if tamanio_lote < 1:
+            raise ValueError("El tamaño de lote debe ser mayor que cero.")
+        self.tamanio_lote = tamanio_lote
+
+    # Generador que recorre el archivo registro por registro sin cargarlo completo en memoria
+    # (salvo un .json con un arreglo JSON, que se lee completo)
+    def leer_registros(self, ruta_archivo):
+        extension = os.path.splitext(ruta_archivo)[1].lower()
+        if extension not in ('.csv', '.json', '.jsonl'):
+            raise ValueError(f"Formato de archivo no soportado: '{extension}'. Use .csv, .json o .jsonl.")
+
+        with open(ruta_archivo, 'r', encoding='utf-8-sig', newline='') as archivo:
+            if extension == '.csv':
+                # La fila 1 es el encabezado, los datos empiezan en la fila 2
+                for numero_fila, registro in enumerate(csv.DictReader(archivo), start=2):
+                    yield numero_fila, registro
+            elif extension == '.json' and self._es_arreglo_json(archivo):
+                # Arreglo JSON ([{...}, {...}]): la "fila" es la posición del objeto en el arreglo (desde 1)
+                try:
+                    registros = json.load(archivo)
+                except ValueError as e:
+                    raise ValueError(f"El archivo '{ruta_archivo}' no contiene un arreglo JSON válido: {e}")
+                for numero_fila, registro in enumerate(registros, start=1):
+                    yield numero_fila, registro
+            else:
+                # JSON Lines: un objeto JSON por línea
+                for numero_fila, linea in enumerate(archivo, start=1):
+                    if not linea.strip():
+                        continue
+                    try:
+                        registro = json.loads(linea)
+                    except ValueError:
+                        registro = None
+                    yield numero_fila, registro
+
+    # True si el primer carácter no blanco del archivo es '[' (deja el archivo al inicio)
+    def _es_arreglo_json(self, archivo):
+        caracter = archivo.read(1)
+        while caracter and caracter.isspace():
+            caracter = archivo.read(1)
+        archivo.seek(0)
+        return caracter == '['
+
+    # Agrupa los registros en listas de tamaño fijo
+    def _lotes(self, registros):
+        lote = []
+        for registro in registros:
+            lote.append(registro)
+            if len(lote) == self.tamanio_lote:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+
+    # Valida el lote completo (por columnas) y arma las filas que espera el tipo Proceso.TipoCatequizadoLote.
+    # 'catalogos' (o None) permite rechazar en el cliente las parroquias inexistentes
+    def _preparar_lote(self, lote, reporte, catalogos=None):
+        registros = [registro for _, registro in lote]
+        parroquias = catalogos.nombresParroquia if catalogos is not None else None
+        errores, columnas = validar_lote_catequizados(registros, parroquias)
+
+        filas = []
+        for indice, (numero_fila, registro) in enumerate(lote):
+            if errores[indice] is not None:
+                cedula = registro.get("cedulaIdentidad") if isinstance(registro, dict) else None
+                self._agregar_error(reporte, numero_fila, cedula, errores[indice])
+                continue
+            # Igual que TRIM() en SQL Server: solo se quitan espacios
+            filas.append((
+                numero_fila,
+                columnas["idParroquiaPertenece"][indice],
+                columnas["nombres"][indice].strip(' '),
+                columnas["apellidos"][indice].strip(' '),
+                columnas["cedulaIdentidad"][indice].strip(' '),
+                columnas["fechaNacimiento"][indice],
+                columnas["direccionDomicilio"][indice].strip(' '),
+                columnas["nombreRepresentante"][indice].strip(' '),
+                columnas["telefonoRepresentante"][indice].strip(' '),
+                columnas["emailRepresentante"][indice].strip(' '),
+                columnas["fechaBautismo"][indice],
+                columnas["parroquiaBautismo"][indice].strip(' ')
+            ))
+        return filas
+
+    # Envía un lote validado al servidor y confirma la transacción una sola vez por lote.
+    # Cada lote usa una conexión del pool: si falla, sus filas quedan como rechazadas y se sigue con el siguiente
+    # (los lotes anteriores ya están confirmados y el reporte debe decir cuáles). Con un error del driver
+    # el pool descarta esa conexión y el lote siguiente recibe otra
+    def _enviar_lote(self, filas, reporte):
+        filasPorNumero = {fila[0]: fila for fila in filas}
+        try:
+            with conexion.get_connection_pool().connection(self.SENTENCIA_SQL) as (database, cursor):
+                try:
+                    cursor.execute(self.SENTENCIA_SQL, (filas,))
+                    # El procedimiento devuelve una fila (numeroFila, mensajeResultado, idCatequizado)
+                    # por cada registro del lote; idCatequizado es el ID asignado a los insertados
+                    resultados = cursor.fetchall()
+                except Exception:
+                    database.rollback()
+                    raise
+                database.commit()
+        except Exception as e:
+            reporte["lotes_fallidos"] += 1
+            for fila in filas:
+                self._agregar_error(reporte, fila[0], fila[4], f"ERROR: No se pudo registrar el lote. Detalles: {e}")
+            return
+
+        auditoria = get_audit_writer()
+        for row in resultados:
+            numero_fila, mensaje_resultado = row[0], row[1]
+            if mensaje_resultado.startswith('OK:'):
+                reporte["registrados"] += 1
+                if auditoria.enabled and len(row) > 2 and row[2] is not None:
+                    self._auditar(auditoria, row[2], filasPorNumero[numero_fila])
+            else:
+                fila = filasPorNumero.get(numero_fila)
+                self._agregar_error(reporte, numero_fila, fila[4] if fila else None, mensaje_resultado)
+
+    # Con auditoría habilitada, una imagen INSERT por catequizado importado, como en el registro individual.
+    # La imagen es la fila guardada: el procedimiento aplica TRIM (ya hecho en _preparar_lote) y LOWER al email
+    def _auditar(self, auditoria, idCatequizado, fila):
+        catequizado = Catequizado(idCatequizado, *fila[1:9], fila[9].lower(), *fila[10:])
+        auditoria.record("INSERT", RepositorioCatequizado.TABLA_AUDITORIA, idCatequizado,
+                         audit_image(catequizado, excluir=("nombreParroquia",)))
+
+    def _agregar_error(self, reporte, numero_fila, cedula, mensaje):
+        reporte["rechazados"] += 1
+        reporte["errores"].append({"fila": numero_fila, "cedula": cedula, "mensaje": mensaje})
+
+    # Valida el archivo completo sin conectarse a la base de datos (mismo reporte que importar, sin registrar nada).
+    # Las parroquias no se rechazan: el archivo de catálogos puede ser antiguo y sin conexión no se puede comprobar
+    # su versión, así que las que no están en él se informan en 'advertencias' (sin verificar) y cuentan como válidas
+    def validar(self, ruta_archivo):
+        reporte = {"archivo": ruta_archivo, "total": 0, "validos": 0, "rechazados": 0, "sin_verificar": 0,
+                   "errores": [], "advertencias": []}
+        catalogos = get_catalogo_referencia().local()
+        for lote in self._lotes(self.leer_registros(ruta_archivo)):
+            reporte["total"] += len(lote)
+            filas_validas = self._preparar_lote(lote, reporte)
+            reporte["validos"] += len(filas_validas)
+            if catalogos is not None:
+                for fila in filas_validas:
+                    if fila[1] not in catalogos.nombresParroquia:
+                        reporte["sin_verificar"] += 1
+                        reporte["advertencias"].append(
+                            {"fila": fila[0], "cedula": fila[4], "mensaje": MENSAJE_PARROQUIA_SIN_VERIFICAR})
+        return reporte
+
+    # Método principal: importa el archivo completo y devuelve un reporte con los errores por fila
+    def importar(self, ruta_archivo):
+        reporte = {"archivo": ruta_archivo, "total": 0, "registrados": 0, "rechazados": 0, "lotes_fallidos": 0,
+                   "errores": []}
+        # Una comprobación de versión al empezar: una parroquia creada hace poco no se rechaza por error
+        catalogos = get_catalogo_referencia().refrescar()
+
+        for lote in self._lotes(self.leer_registros(ruta_archivo)):
+            reporte["total"] += len(lote)
+            filas_validas = self._preparar_lote(lote, reporte, catalogos)
+
+            # Las filas rechazadas en el cliente nunca llegan al servidor
+            if filas_validas:
+                self._enviar_lote(filas_validas, reporte)
+
+        # Releer miles de cédulas una por una costaría más que reconstruir el índice de búsqueda en la próxima consulta
+        if reporte["registrados"]:
+            get_indice_catequizados().invalidar()
+
+        # Los errores del cliente y del servidor se reportan en el orden del archivo
+        reporte["errores"].sort(key=lambda error: error["fila"])
+        return reporte
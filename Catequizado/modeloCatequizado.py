@@ -0,0 +1,85 @@
+from typing import NamedTuple
+
+# Registro inmutable y compacto de un catequizado (columnas de Proceso.Catequizado + nombre de la parroquia).
+# Al ser una tupla no tiene __dict__ por instancia: el costo por fila es fijo y predecible.
+class Catequizado(NamedTuple):
+    idCatequizado: int
+    idParroquiaPertenece: int
+    nombres: str
+    apellidos: str
+    cedulaIdentidad: str
+    fechaNacimiento: object
+    direccionDomicilio: str
+    nombreRepresentante: str
+    telefonoRepresentante: str
+    emailRepresentante: str
+    fechaBautismo: object
+    parroquiaBautismo: str
+    # Solo lectura: lo resuelve el JOIN con Configuracion.Parroquia o el catálogo local de parroquias
+    nombreParroquia: str = None
+
+    # Construye el registro a partir de una fila de sp_BuscarCatequizadoPorCedula o sp_ListarCatequizadosPaginado.
+    # Ambos procedimientos devuelven: ID_Catequizado, ID_Parroquia, Nombre_Parroquia, Nombres, ... Parroquia_Bautismo,
+    # por lo que se usan posiciones fijas en lugar de buscar cada columna en cursor.description.
+    # Con 'nombresParroquia' (ID -> nombre) el nombre sale de ese diccionario y no de la fila
+    @classmethod
+    def desde_fila(cls, row, nombresParroquia=None):
+        nombreParroquia = row[2] if nombresParroquia is None else nombresParroquia.get(row[1])
+        return cls._make((row[0], row[1]) + tuple(row[3:13]) + (nombreParroquia,))
+
+    # Construye el registro a partir de un diccionario con los campos del catequizado (sin ID asignado)
+    @classmethod
+    def desde_diccionario(cls, datos, idCatequizado=None):
+        return cls(
+            idCatequizado,
+            datos["idParroquiaPertenece"],
+            datos["nombres"],
+            datos["apellidos"],
+            datos["cedulaIdentidad"],
+            datos["fechaNacimiento"],
+            datos["direccionDomicilio"],
+            datos["nombreRepresentante"],
+            datos["telefonoRepresentante"],
+            datos["emailRepresentante"],
+            datos["fechaBautismo"],
+            datos["parroquiaBautismo"],
+            datos.get("nombreParroquia")
+        )
+
+    # Valores en el orden que esperan sp_RegistrarCatequizado y sp_ActualizarCatequizado
+    def valores_procedimiento(self):
+        return (
+            self.idParroquiaPertenece,
+            self.nombres,
+            self.apellidos,
+            self.cedulaIdentidad,
+            self.fechaNacimiento,
+            self.direccionDomicilio,
+            self.nombreRepresentante,
+            self.telefonoRepresentante,
+            self.emailRepresentante,
+            self.fechaBautismo,
+            self.parroquiaBautismo
+        )
+
+# Etiquetas para mostrar un catequizado por consola (mismos nombres que los alias de los procedimientos)
+ETIQUETAS_CATEQUIZADO = (
+    ("ID_Catequizado", "idCatequizado"),
+    ("ID_Parroquia", "idParroquiaPertenece"),
+    ("Nombre_Parroquia", "nombreParroquia"),
+    ("Nombres", "nombres"),
+    ("Apellidos", "apellidos"),
+    ("Cedula", "cedulaIdentidad"),
+    ("Fecha_Nacimiento", "fechaNacimiento"),
+    ("Direccion", "direccionDomicilio"),
+    ("Nombre_Representante", "nombreRepresentante"),
+    ("Telefono_Representante", "telefonoRepresentante"),
+    ("Email_Representante", "emailRepresentante"),
+    ("Fecha_Bautismo", "fechaBautismo"),
+    ("Parroquia_Bautismo", "parroquiaBautismo")
+)
+
+# Función para mostrar un catequizado por consola
+def imprimir_catequizado(catequizado):
+    for etiqueta, campo in ETIQUETAS_CATEQUIZADO:
+        print(f"{etiqueta}: {getattr(catequizado, campo)}")
@@ -1,12 +1,25 @@
-from datetime import datetime
+import os
+
 # Importamos la clase GestorCatequizado
+from Asistencia.operacionesAsistencia import OperacionesAsistencia
+from Certificado.operacionesCertificado import OperacionesCertificado
+from Catequizado.exportadorCatequizado import ExportadorCatequizado
 from Catequizado.gestorCatequizado import GestorCatequizado
+from Catequizado.importadorCatequizado import ImportadorCatequizado
+from Catequizado.modeloCatequizado import imprimir_catequizado
+from Catequizado.validacionesCatequizado import validar_campos_catequizado
+from Inscripcion.operacionesInscripcion import OperacionesInscripcion
+from Traslado.operacionesTraslado import OperacionesTraslado
 
 # Clase que maneja las operaciones del menú para catequizados
 class OperacionesCatequizado:
     
     def __init__(self):
         self.gestor_herramienta = GestorCatequizado()
+        self.operaciones_asistencia = OperacionesAsistencia()
+        self.operaciones_certificado = OperacionesCertificado()
+        self.operaciones_traslado = OperacionesTraslado()
+        self.operaciones_inscripcion = OperacionesInscripcion()
 
     def mostrar_menu(self):
         print("\n--- Sistema de Gestión de Catequesis ---")
@@ -15,7 +28,14 @@ class OperacionesCatequizado:
         print("3. Actualizar catequizado")
         print("4. Eliminar catequizado")
         print("5. Listar todos los catequizados")
-        print("6. Salir")
+        print("6. Importar catequizados desde archivo (CSV/JSON)")
+        print("7. Exportar catequizados por parroquia (CSV/Parquet)")
+        print("8. Buscar catequizados por nombre, representante o parroquia")
+        print("9. Tomar asistencia de un grupo")
+        print("10. Elegibilidad para certificado (por grupo o parroquia)")
+        print("11. Traslados de parroquia (solicitar, aprobar o rechazar)")
+        print("12. Inscribir catequizados en un grupo (por lotes, con control de cupos)")
+        print("13. Salir")
         return input("Seleccione una opción: ")
     
     # Método principal para iniciar las operaciones
@@ -34,6 +54,20 @@ class OperacionesCatequizado:
             elif opcion == '5':
                 self.operacion_listar()
             elif opcion == '6':
+                self.operacion_importar()
+            elif opcion == '7':
+                self.operacion_exportar()
+            elif opcion == '8':
+                self.operacion_buscar_texto()
+            elif opcion == '9':
+                self.operaciones_asistencia.operacion_tomar_asistencia()
+            elif opcion == '10':
+                self.operaciones_certificado.operacion_elegibilidad()
+            elif opcion == '11':
+                self.operaciones_traslado.operacion_traslados()
+            elif opcion == '12':
+                self.operaciones_inscripcion.operacion_inscribir()
+            elif opcion == '13':
                 print("Saliendo del sistema...")
                 break # Rompe el bucle while True
             else:
@@ -42,29 +76,8 @@ class OperacionesCatequizado:
     # --- MÉTODO PRIVADO DE VALIDACIÓN ---
     
     def _validar_campos(self, datos):
-        # 1. Validación de campos vacíos
-        for campo, valor in datos.items():
-            if not str(valor).strip(): # .strip() quita espacios en blanco
-                return False, f"[ERROR] El campo '{campo}' no puede estar vacío."
-
-        # 2. Validación de formatos
-        try:
-            # a) ID de Parroquia
-            datos["idParroquiaPertenece"] = int(datos["idParroquiaPertenece"])
-            
-            # b) Fechas (YYYY-MM-DD)
-            fecha_nac = datetime.strptime(datos["fechaNacimiento"], '%Y-%m-%d')
-            fecha_baut = datetime.strptime(datos["fechaBautismo"], '%Y-%m-%d')
-            
-            # c) Lógica de Fechas
-            if fecha_baut < fecha_nac:
-                return False, "[ERROR] La fecha de bautismo no puede ser anterior a la de nacimiento."
-            
-
-        except ValueError:
-            return False, "[ERROR] ID de Parroquia o Formato de Fecha incorrecto. Use YYYY-MM-DD."
-        
-        return True, "OK" # Si todo pasó, es válido
+        # Las reglas viven en validacionesCatequizado para que el importador masivo use las mismas
+        return validar_campos_catequizado(datos)
 
     # --- OPERACIONES DEL MENÚ ---
 
@@ -92,20 +105,8 @@ class OperacionesCatequizado:
             print(mensaje)
             return # Detiene la operación
 
-        # Si es válido, crear el objeto Gestor "lleno"
-        catequizado_nuevo = GestorCatequizado(
-            idParroquiaPertenece=datos_nuevos["idParroquiaPertenece"],
-            nombres=datos_nuevos["nombres"],
-            apellidos=datos_nuevos["apellidos"],
-            cedulaIdentidad=datos_nuevos["cedulaIdentidad"],
-            fechaNacimiento=datos_nuevos["fechaNacimiento"],
-            direccionDomicilio=datos_nuevos["direccionDomicilio"],
-            nombreRepresentante=datos_nuevos["nombreRepresentante"],
-            telefonoRepresentante=datos_nuevos["telefonoRepresentante"],
-            emailRepresentante=datos_nuevos["emailRepresentante"],
-            fechaBautismo=datos_nuevos["fechaBautismo"],
-            parroquiaBautismo=datos_nuevos["parroquiaBautismo"]
-        )
+        # Si es válido, crear el objeto Gestor "lleno" (las claves coinciden con sus parámetros)
+        catequizado_nuevo = GestorCatequizado(**datos_nuevos)
         
         # Usar el gestor "herramienta" para registrar el nuevo catequizado
         catequizado_nuevo.registrarCatequizado()
@@ -140,17 +141,17 @@ class OperacionesCatequizado:
         print("\nIngrese los nuevos datos (Presione Enter para dejar el valor actual):")
         
         datos_actualizados = {
-            "idParroquiaPertenece": input(f"ID Parroquia [{datos_actuales[2]}]: ") or datos_actuales[1],
-            "nombres": input(f"Nombres [{datos_actuales[3]}]: ") or datos_actuales[3],
-            "apellidos": input(f"Apellidos [{datos_actuales[4]}]: ") or datos_actuales[4],
-            "cedulaIdentidad": input(f"Cédula [{datos_actuales[5]}]: ") or datos_actuales[5],
-            "fechaNacimiento": input(f"Fecha Nacimiento [{datos_actuales[6]}]: ") or datos_actuales[6],
-            "direccionDomicilio": input(f"Dirección [{datos_actuales[7]}]: ") or datos_actuales[7],
-            "nombreRepresentante": input(f"Representante [{datos_actuales[8]}]: ") or datos_actuales[8],
-            "telefonoRepresentante": input(f"Teléfono [{datos_actuales[9]}]: ") or datos_actuales[9],
-            "emailRepresentante": input(f"Email [{datos_actuales[10]}]: ") or datos_actuales[10],
-            "fechaBautismo": input(f"Fecha Bautismo [{datos_actuales[11]}]: ") or datos_actuales[11],
-            "parroquiaBautismo": input(f"Parroquia Bautismo [{datos_actuales[12]}]: ") or datos_actuales[12]
+            "idParroquiaPertenece": input(f"ID Parroquia [{datos_actuales.idParroquiaPertenece} - {datos_actuales.nombreParroquia}]: ") or datos_actuales.idParroquiaPertenece,
+            "nombres": input(f"Nombres [{datos_actuales.nombres}]: ") or datos_actuales.nombres,
+            "apellidos": input(f"Apellidos [{datos_actuales.apellidos}]: ") or datos_actuales.apellidos,
+            "cedulaIdentidad": input(f"Cédula [{datos_actuales.cedulaIdentidad}]: ") or datos_actuales.cedulaIdentidad,
+            "fechaNacimiento": input(f"Fecha Nacimiento [{datos_actuales.fechaNacimiento}]: ") or datos_actuales.fechaNacimiento,
+            "direccionDomicilio": input(f"Dirección [{datos_actuales.direccionDomicilio}]: ") or datos_actuales.direccionDomicilio,
+            "nombreRepresentante": input(f"Representante [{datos_actuales.nombreRepresentante}]: ") or datos_actuales.nombreRepresentante,
+            "telefonoRepresentante": input(f"Teléfono [{datos_actuales.telefonoRepresentante}]: ") or datos_actuales.telefonoRepresentante,
+            "emailRepresentante": input(f"Email [{datos_actuales.emailRepresentante}]: ") or datos_actuales.emailRepresentante,
+            "fechaBautismo": input(f"Fecha Bautismo [{datos_actuales.fechaBautismo}]: ") or datos_actuales.fechaBautismo,
+            "parroquiaBautismo": input(f"Parroquia Bautismo [{datos_actuales.parroquiaBautismo}]: ") or datos_actuales.parroquiaBautismo
         }
         
         # Validar los datos nuevos
@@ -160,19 +161,7 @@ class OperacionesCatequizado:
             return
 
         # --- PASO 3: GUARDAR ---
-        gestor_actualizado = GestorCatequizado(
-            idParroquiaPertenece=datos_actualizados["idParroquiaPertenece"],
-            nombres=datos_actualizados["nombres"],
-            apellidos=datos_actualizados["apellidos"],
-            cedulaIdentidad=datos_actualizados["cedulaIdentidad"],
-            fechaNacimiento=datos_actualizados["fechaNacimiento"],
-            direccionDomicilio=datos_actualizados["direccionDomicilio"],
-            nombreRepresentante=datos_actualizados["nombreRepresentante"],
-            telefonoRepresentante=datos_actualizados["telefonoRepresentante"],
-            emailRepresentante=datos_actualizados["emailRepresentante"],
-            fechaBautismo=datos_actualizados["fechaBautismo"],
-            parroquiaBautismo=datos_actualizados["parroquiaBautismo"]
-        )
+        gestor_actualizado = GestorCatequizado(**datos_actualizados)
         
         # Usar el gestor "herramienta" para actualizar
         gestor_actualizado.actualizarCatequizado(cedula_actual)
@@ -198,5 +187,123 @@ class OperacionesCatequizado:
 
     def operacion_listar(self):
         print("\n--- 5. Listado de Catequizados ---")
-        # Usar el gestor "herramienta" para listar todos los catequizados
-        self.gestor_herramienta.listarCatequizados()
\ No newline at end of file
+        filtro = input("ID de Parroquia para filtrar (Enter para todas): ").strip()
+        try:
+            idParroquia = int(filtro) if filtro else None
+        except ValueError:
+            print("[ERROR] El ID de Parroquia debe ser numérico.")
+            return
+
+        # Usar el gestor "herramienta" para mostrar el listado página por página
+        desdeId = 0
+        print("\n---------- LISTA DE CATEQUIZADOS ----------")
+        while desdeId is not None:
+            try:
+                catequizados, desdeId = self.gestor_herramienta.listarPaginaCatequizados(desdeId, idParroquia=idParroquia)
+            except Exception as e:
+                print("\nError durante la ejecución de la consulta:", e)
+                return
+
+            for catequizado in catequizados:
+                imprimir_catequizado(catequizado)
+                print("-------------------------------------------")
+
+            if desdeId is not None and input("Enter para ver más, 'q' para terminar: ").strip().lower() == 'q':
+                break
+
+    def operacion_importar(self):
+        print("\n--- 6. Importar Catequizados desde Archivo ---")
+        ruta = input("Ruta del archivo (.csv, .json o .jsonl): ").strip()
+        if not ruta:
+            print("[ERROR] La ruta del archivo no puede estar vacía.")
+            return
+
+        # Usar el importador para registrar el archivo por lotes
+        try:
+            reporte = ImportadorCatequizado().importar(ruta)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] No se pudo leer el archivo: {e}")
+            return
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return
+
+        print("\n---------- RESULTADO DE LA IMPORTACIÓN ----------")
+        print(f"Registros leídos: {reporte['total']}")
+        print(f"Registrados: {reporte['registrados']}")
+        print(f"Rechazados: {reporte['rechazados']}")
+        if reporte["lotes_fallidos"]:
+            print(f"Lotes que no se pudieron enviar: {reporte['lotes_fallidos']}")
+        for error in reporte["errores"]:
+            print(f"Fila {error['fila']} (cédula {error['cedula']}): {error['mensaje']}")
+        print("-------------------------------------------------\n")
+
+    def operacion_exportar(self):
+        print("\n--- 7. Exportar Catequizados por Parroquia ---")
+        directorio = input("Carpeta de destino: ").strip()
+        if not directorio:
+            print("[ERROR] La carpeta de destino no puede estar vacía.")
+            return
+        formato = input("Formato (csv/parquet, Enter para csv): ").strip().lower() or 'csv'
+        filtro = input("IDs de Parroquia separados por coma (Enter para todas): ").strip()
+        try:
+            parroquias = [int(idParroquia) for idParroquia in filtro.split(',')] if filtro else None
+        except ValueError:
+            print("[ERROR] Los IDs de Parroquia deben ser numéricos.")
+            return
+
+        # Usar el exportador para generar un archivo por parroquia en paralelo
+        try:
+            manifiesto = ExportadorCatequizado(formato).exportar(directorio, parroquias)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] No se pudo exportar: {e}")
+            return
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return
+
+        print("\n---------- RESULTADO DE LA EXPORTACIÓN ----------")
+        for archivo in manifiesto["archivos"]:
+            if "error" in archivo:
+                print(f"Parroquia {archivo['idParroquia']}: [ERROR] {archivo['error']}")
+            else:
+                print(f"Parroquia {archivo['idParroquia']} ({archivo['nombreParroquia']}): "
+                      f"{archivo['filas']} filas -> {archivo['archivo']}")
+        print(f"Total exportado: {manifiesto['total_filas']} filas en {manifiesto['segundos']} s")
+        print(f"Manifiesto: {os.path.join(directorio, 'manifest.json')}")
+        print("-------------------------------------------------\n")
+
+    def operacion_buscar_texto(self):
+        print("\n--- 8. Buscar Catequizados por Nombre, Representante o Parroquia ---")
+        texto = input("Texto a buscar (no importan tildes ni mayúsculas): ").strip()
+        if not texto:
+            print("[ERROR] El texto a buscar no puede estar vacío.")
+            return
+        filtro = input("ID de Parroquia para filtrar (Enter para todas): ").strip()
+        try:
+            idParroquia = int(filtro) if filtro else None
+        except ValueError:
+            print("[ERROR] El ID de Parroquia debe ser numérico.")
+            return
+
+        # Usar el gestor "herramienta" para mostrar los resultados página por página, los más relevantes primero
+        pagina, tamanioPagina = 1, 20
+        while True:
+            try:
+                catequizados, total = self.gestor_herramienta.buscarPaginaPorTexto(texto, idParroquia, pagina,
+                                                                                   tamanioPagina)
+            except Exception as e:
+                print("\nError durante la ejecución de la consulta:", e)
+                return
+
+            if pagina == 1:
+                print(f"\n---------- {total} CATEQUIZADOS ENCONTRADOS ----------")
+            for catequizado in catequizados:
+                imprimir_catequizado(catequizado)
+                print("-------------------------------------------")
+
+            if pagina * tamanioPagina >= total:
+                break
+            if input("Enter para ver más, 'q' para terminar: ").strip().lower() == 'q':
+                break
+            pagina += 1
\ No newline at end of file
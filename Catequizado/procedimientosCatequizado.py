@@ -0,0 +1,90 @@
+# Protocolo de llamada con código de resultado: cada procedimiento ...ConCodigo devuelve una fila
+# que empieza con (codigo, mensaje); el código se traduce a una excepción estructurada
+
+# Códigos que devuelven los procedimientos (RETURN y columna 'codigo')
+CODIGO_OK = 0
+CODIGO_CAMPOS_OBLIGATORIOS = 1
+CODIGO_CEDULA_INVALIDA = 2
+CODIGO_TELEFONO_INVALIDO = 3
+CODIGO_EMAIL_INVALIDO = 4
+CODIGO_PARROQUIA_INEXISTENTE = 5
+CODIGO_CEDULA_DUPLICADA = 6
+CODIGO_NO_ENCONTRADO = 7
+CODIGO_INSCRIPCION_INVALIDA = 8
+CODIGO_TRASLADO_INVALIDO = 9
+CODIGO_ERROR_SQL = 50
+
+# Error informado por un procedimiento almacenado (o por la llamada)
+class ErrorCatequizado(Exception):
+    codigo = CODIGO_ERROR_SQL
+
+    def __init__(self, mensaje, codigo=None):
+        super().__init__(mensaje)
+        self.mensaje = mensaje
+        if codigo is not None:
+            self.codigo = codigo
+
+# Campos vacíos o con formato inválido (cédula, teléfono, email)
+class DatosInvalidos(ErrorCatequizado):
+    codigo = CODIGO_CAMPOS_OBLIGATORIOS
+
+class ParroquiaInexistente(ErrorCatequizado):
+    codigo = CODIGO_PARROQUIA_INEXISTENTE
+
+class CatequizadoDuplicado(ErrorCatequizado):
+    codigo = CODIGO_CEDULA_DUPLICADA
+
+class CatequizadoNoEncontrado(ErrorCatequizado):
+    codigo = CODIGO_NO_ENCONTRADO
+
+# Error de SQL Server dentro del procedimiento o respuesta inesperada
+class ErrorBaseDatos(ErrorCatequizado):
+    codigo = CODIGO_ERROR_SQL
+
+EXCEPCIONES_POR_CODIGO = {
+    CODIGO_CAMPOS_OBLIGATORIOS: DatosInvalidos,
+    CODIGO_CEDULA_INVALIDA: DatosInvalidos,
+    CODIGO_TELEFONO_INVALIDO: DatosInvalidos,
+    CODIGO_EMAIL_INVALIDO: DatosInvalidos,
+    CODIGO_PARROQUIA_INEXISTENTE: ParroquiaInexistente,
+    CODIGO_CEDULA_DUPLICADA: CatequizadoDuplicado,
+    CODIGO_NO_ENCONTRADO: CatequizadoNoEncontrado,
+    CODIGO_INSCRIPCION_INVALIDA: DatosInvalidos,
+    CODIGO_TRASLADO_INVALIDO: DatosInvalidos
+}
+
+# Construye la excepción que corresponde al código (los códigos desconocidos se tratan como error de SQL)
+def error_desde_codigo(codigo, mensaje):
+    return EXCEPCIONES_POR_CODIGO.get(codigo, ErrorBaseDatos)(mensaje, codigo)
+
+# Descarta los resultados que quedan en el cursor. Sin MARS (DRIVER={SQL Server}) una llamada con resultados
+# sin leer deja la conexión ocupada: el COMMIT y el siguiente cursor fallarían con "Connection is busy"
+def descartar_resultados(cursor):
+    while cursor.nextset():
+        pass
+
+# Llamada a un procedimiento con código de resultado.
+# La sentencia es siempre el mismo texto {CALL ...(?,...)}: pyodbc la prepara la primera vez que se ejecuta
+# en un cursor y la reutiliza en las siguientes, por eso el pool guarda un cursor por conexión y sentencia
+class LlamadaProcedimiento:
+    def __init__(self, nombre, numeroParametros):
+        self.nombre = nombre
+        self.sql = "{CALL %s(%s)}" % (nombre, ",".join("?" * numeroParametros))
+
+    # Ejecuta la llamada y devuelve la fila de resultado; si el código no es 0 lanza la excepción correspondiente.
+    # Con 'descartarResto' en False el llamador lee los conjuntos siguientes y luego llama a descartar_resultados
+    def ejecutar(self, cursor, parametros, descartarResto=True):
+        cursor.execute(self.sql, parametros)
+        row = cursor.fetchone()
+        if descartarResto:
+            descartar_resultados(cursor)
+        if row is None:
+            raise ErrorBaseDatos(f"No se recibió ningún resultado de {self.nombre}.")
+        if row[0] != CODIGO_OK:
+            raise error_desde_codigo(row[0], row[1])
+        return row
+
+REGISTRAR = LlamadaProcedimiento("Proceso.sp_RegistrarCatequizadoConCodigo", 11)
+BUSCAR_POR_CEDULA = LlamadaProcedimiento("Proceso.sp_BuscarCatequizadoPorCedulaConCodigo", 1)
+ACTUALIZAR = LlamadaProcedimiento("Proceso.sp_ActualizarCatequizadoConCodigo", 12)
+ELIMINAR = LlamadaProcedimiento("Proceso.sp_EliminarCatequizadoPorCedulaConCodigo", 1)
\ No newline at end of file
@@ -0,0 +1,246 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import connection as conexion
+from audit import audit_image, get_audit_writer
+from instrumentation import instrumented
+from Catalogo.cacheCatalogo import get_catalogo_referencia
+from Catequizado import procedimientosCatequizado as procedimientos
+from Catequizado.busquedaCatequizado import get_indice_catequizados
+from Catequizado.cacheCatequizado import get_cache_catequizados
+from Catequizado.modeloCatequizado import Catequizado
+from Catequizado.procedimientosCatequizado import CODIGO_OK, ErrorCatequizado, error_desde_codigo
+from Catequizado.validacionesCatequizado import MENSAJE_PARROQUIA_INEXISTENTE, validar_formatos_catequizado
+
+# Resultado estructurado de una operación del repositorio (no imprime nada)
+@dataclass
+class ResultadoOperacion:
+    ok: bool
+    mensaje: str
+    datos: object = None
+    # Código numérico del procedimiento (0 = OK; ver procedimientosCatequizado)
+    codigo: int = CODIGO_OK
+
+    # Devuelve los datos si la operación fue exitosa; si no, lanza la excepción que corresponde al código
+    def verificar(self):
+        if not self.ok:
+            raise error_desde_codigo(self.codigo, self.mensaje)
+        return self.datos
+
+# Imagen JSON de un catequizado para Seguridad.Auditoria (solo columnas de Proceso.Catequizado)
+def _imagenAuditoria(catequizado):
+    return audit_image(catequizado, excluir=("nombreParroquia",))
+
+# Repositorio sin estado para Proceso.Catequizado: recibe y devuelve registros Catequizado
+class RepositorioCatequizado:
+    TABLA_AUDITORIA = "Proceso.Catequizado"
+    SQL_LISTAR_PAGINA = "{CALL Proceso.sp_ListarCatequizadosPaginado(?,?,?,?)}"
+    SQL_CONTAR_POR_PARROQUIA = "{CALL Proceso.sp_ContarCatequizadosPorParroquia}"
+    # Mismos límites de página que sp_ListarCatequizadosPaginado: una página "incompleta" solo indica el final
+    # de los datos si se pidió un tamaño que el procedimiento no recorta
+    TAMANIO_PAGINA_DEFECTO = 500
+    TAMANIO_PAGINA_MAXIMO = 5000
+
+    # --- MÉTODOS AUXILIARES ---
+
+    # Ajusta el tamaño de página igual que el procedimiento (vacío o menor que 1 -> 500; más de 5000 -> 5000)
+    def _tamanioPagina(self, tamanioPagina):
+        if tamanioPagina is None or tamanioPagina < 1:
+            return self.TAMANIO_PAGINA_DEFECTO
+        return min(tamanioPagina, self.TAMANIO_PAGINA_MAXIMO)
+
+    # Ejecuta un procedimiento de escritura: confirma la transacción si el código es 0 y la deshace si no.
+    # Si el procedimiento devuelve una tercera columna (el ID asignado al registrar), va en 'datos'
+    def _ejecutarEscritura(self, llamada, parametros, cancelacion, *cedulasInvalidar):
+        with conexion.get_connection_pool().connection(llamada.sql, cancelacion) as (database, cursor):
+            try:
+                row = llamada.ejecutar(cursor, parametros)
+            except ErrorCatequizado as e:
+                database.rollback()
+                return ResultadoOperacion(False, e.mensaje, codigo=e.codigo)
+            database.commit()
+
+        get_cache_catequizados().invalidar(*cedulasInvalidar)
+        # Solo si el índice de búsqueda ya está cargado: vuelve a leer esas cédulas y actualiza sus palabras
+        get_indice_catequizados().actualizar(cedulasInvalidar, self._resolverCedula)
+        return ResultadoOperacion(True, row[1], row[2] if len(row) > 2 else None)
+
+    # Registro actual de una cédula, o None si ya no existe (para mantener al día el índice de búsqueda)
+    def _resolverCedula(self, cedulaIdentidad):
+        resultado = self.buscarPorCedula(cedulaIdentidad)
+        if resultado.ok:
+            return resultado.datos
+        if resultado.codigo == procedimientos.CODIGO_NO_ENCONTRADO:
+            return None
+        raise error_desde_codigo(resultado.codigo, resultado.mensaje)
+
+    # Nombres de las parroquias del catálogo local (ID -> nombre), o None si no está disponible:
+    # en ese caso el listado pide los nombres al procedimiento (JOIN con Configuracion.Parroquia)
+    def _nombresParroquia(self):
+        catalogos = get_catalogo_referencia().actual()
+        return None if catalogos is None else catalogos.nombresParroquia
+
+    # Rechaza sin llamar al procedimiento un registro cuya parroquia no está en el catálogo local.
+    # Solo se adelanta ese error si el procedimiento no encontraría antes otro (campos vacíos o formatos),
+    # para que el código y el mensaje sean los mismos que habría devuelto el servidor
+    def _parroquiaInexistente(self, catequizado):
+        if any(valor is None or not str(valor).strip() for valor in catequizado.valores_procedimiento()):
+            return None
+        if not validar_formatos_catequizado(catequizado._asdict())[0]:
+            return None
+        if get_catalogo_referencia().validarParroquia(catequizado.idParroquiaPertenece) is not False:
+            return None
+        return ResultadoOperacion(False, MENSAJE_PARROQUIA_INEXISTENTE,
+                                  codigo=procedimientos.CODIGO_PARROQUIA_INEXISTENTE)
+
+    # --- OPERACIONES ---
+
+    # Registra un catequizado nuevo (el idCatequizado del registro se ignora: lo asigna el procedimiento).
+    # En 'datos' devuelve el registro con el ID asignado (y el nombre de la parroquia, si está en el catálogo local)
+    @instrumented("registrar", procedimientos.REGISTRAR.nombre)
+    def registrar(self, catequizado, cancelacion=None):
+        rechazo = self._parroquiaInexistente(catequizado)
+        if rechazo is not None:
+            return rechazo
+        resultado = self._ejecutarEscritura(procedimientos.REGISTRAR, catequizado.valores_procedimiento(),
+                                            cancelacion, catequizado.cedulaIdentidad)
+        if resultado.ok:
+            nombres = self._nombresParroquia() or {}
+            resultado.datos = catequizado._replace(
+                idCatequizado=resultado.datos,
+                nombreParroquia=nombres.get(catequizado.idParroquiaPertenece, catequizado.nombreParroquia))
+            auditoria = get_audit_writer()
+            if auditoria.enabled:
+                auditoria.record("INSERT", self.TABLA_AUDITORIA, resultado.datos.idCatequizado,
+                                 _imagenAuditoria(resultado.datos))
+        return resultado
+
+    # Busca un catequizado por cédula (primero en la caché); en 'datos' devuelve el registro encontrado
+    @instrumented("buscar", procedimientos.BUSCAR_POR_CEDULA.nombre)
+    def buscarPorCedula(self, cedulaIdentidad, cancelacion=None):
+        # Consultar primero la caché: las búsquedas repetidas no llegan a la base de datos
+        cache = get_cache_catequizados()
+        catequizado = cache.obtener(cedulaIdentidad)
+        if catequizado is not None:
+            return ResultadoOperacion(True, "OK: Catequizado encontrado.", catequizado)
+
+        # Si una escritura invalida la cédula mientras se lee, la fila leída no se guarda
+        generacion = cache.generacion(cedulaIdentidad)
+        try:
+            with conexion.get_connection_pool().connection(procedimientos.BUSCAR_POR_CEDULA.sql,
+                                                           cancelacion) as (database, cursor):
+                row = procedimientos.BUSCAR_POR_CEDULA.ejecutar(cursor, (cedulaIdentidad,))
+        except ErrorCatequizado as e:
+            return ResultadoOperacion(False, e.mensaje, codigo=e.codigo)
+
+        # La fila trae (codigo, mensaje) seguidos de las columnas de sp_BuscarCatequizadoPorCedula.
+        # Solo se guardan los catequizados encontrados (los mensajes de error no se cachean)
+        catequizado = Catequizado.desde_fila(row[2:])
+        cache.guardar(cedulaIdentidad, catequizado, generacion)
+        return ResultadoOperacion(True, row[1], catequizado)
+
+    # Actualiza el catequizado identificado por 'cedulaIdentidadActualizar' con los datos del registro
+    @instrumented("actualizar", procedimientos.ACTUALIZAR.nombre)
+    def actualizar(self, cedulaIdentidadActualizar, catequizado, cancelacion=None):
+        # Con auditoría, la imagen anterior sale de la caché: el menú y la línea de comandos ya buscaron
+        # ese registro antes de pedir los datos nuevos, así que normalmente no hay una consulta extra
+        antes = self._imagenAnterior(cedulaIdentidadActualizar, cancelacion)
+        parametros = (cedulaIdentidadActualizar,) + catequizado.valores_procedimiento()
+        # La cédula anterior y la nueva pueden ser distintas: se invalidan ambas
+        resultado = self._ejecutarEscritura(procedimientos.ACTUALIZAR, parametros, cancelacion,
+                                            cedulaIdentidadActualizar, catequizado.cedulaIdentidad)
+        if resultado.ok and antes is not None:
+            despues = catequizado._replace(idCatequizado=antes.idCatequizado)
+            get_audit_writer().record("UPDATE", self.TABLA_AUDITORIA, antes.idCatequizado,
+                                      _imagenAuditoria(despues), _imagenAuditoria(antes))
+        return resultado
+
+    # Elimina el catequizado con la cédula indicada
+    @instrumented("eliminar", procedimientos.ELIMINAR.nombre)
+    def eliminar(self, cedulaIdentidad, cancelacion=None):
+        antes = self._imagenAnterior(cedulaIdentidad, cancelacion)
+        resultado = self._ejecutarEscritura(procedimientos.ELIMINAR, (cedulaIdentidad,), cancelacion,
+                                            cedulaIdentidad)
+        if resultado.ok and antes is not None:
+            get_audit_writer().record("DELETE", self.TABLA_AUDITORIA, antes.idCatequizado,
+                                      antiguos=_imagenAuditoria(antes))
+        return resultado
+
+    # Registro actual de la cédula para la imagen 'antes' de la auditoría (None si la auditoría está
+    # deshabilitada o el registro no existe; en ese caso el procedimiento tampoco modificará nada)
+    def _imagenAnterior(self, cedulaIdentidad, cancelacion=None):
+        if not get_audit_writer().enabled:
+            return None
+        resultado = self.buscarPorCedula(cedulaIdentidad, cancelacion)
+        return resultado.datos if resultado.ok else None
+
+    # Devuelve una página de registros (paginación por ID, opcionalmente filtrada por parroquia)
+    # y el ID desde el que empieza la página siguiente (None si no hay más).
+    # Con el catálogo local el procedimiento no hace el JOIN con Parroquia: los nombres se resuelven aquí
+    @instrumented("listar_pagina", "Proceso.sp_ListarCatequizadosPaginado")
+    def listarPagina(self, desdeId=0, tamanioPagina=50, idParroquia=None, cancelacion=None):
+        tamanioPagina = self._tamanioPagina(tamanioPagina)
+        nombres = self._nombresParroquia()
+        with conexion.get_connection_pool().connection(self.SQL_LISTAR_PAGINA, cancelacion) as (database, cursor):
+            cursor.execute(self.SQL_LISTAR_PAGINA, (desdeId, tamanioPagina, idParroquia, nombres is None))
+            catequizados = [Catequizado.desde_fila(row, nombres) for row in cursor.fetchall()]
+
+        # Si la página vino completa puede haber más registros después del último ID
+        siguienteId = catequizados[-1].idCatequizado if len(catequizados) == tamanioPagina else None
+        return catequizados, siguienteId
+
+    # Busca por nombres, apellidos, representante o parroquia, sin distinguir tildes ni mayúsculas y tolerando
+    # errores de escritura. Devuelve la página pedida (empezando en 1) ordenada por relevancia y el total.
+    # La primera búsqueda construye el índice en memoria recorriendo la tabla por páginas; las siguientes
+    # solo consultan el índice, que se mantiene al día con cada registro, actualización o eliminación
+    @instrumented("buscar_texto")
+    def buscarPorTexto(self, texto, idParroquia=None, pagina=1, tamanioPagina=20):
+        indice = get_indice_catequizados()
+        indice.cargar(lambda: self.iterar(tamanioPagina=5000, tamanioBloque=1000), self._resolverCedula)
+        return indice.buscar(texto, idParroquia, pagina, tamanioPagina)
+
+    # Devuelve (idParroquia, nombreParroquia, total) de cada parroquia con catequizados, de mayor a menor total
+    @instrumented("contar_por_parroquia", "Proceso.sp_ContarCatequizadosPorParroquia")
+    def contarPorParroquia(self, cancelacion=None):
+        with conexion.get_connection_pool().connection(cancellation=cancelacion) as (database, cursor):
+            cursor.execute(self.SQL_CONTAR_POR_PARROQUIA)
+            return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+
+    # Usa el cursor recibido o, si no hay, presta una conexión del pool solo para una página
+    @contextmanager
+    def _cursorPagina(self, cursor=None):
+        if cursor is not None:
+            yield cursor
+        else:
+            with conexion.get_connection_pool().connection(self.SQL_LISTAR_PAGINA) as (database, cursorPrestado):
+                yield cursorPrestado
+
+    # Generador que recorre todos los catequizados página por página sin cargarlos completos en memoria.
+    # Sin 'cursor', cada página usa una conexión prestada que se devuelve al pool antes de pedir la siguiente;
+    # con 'cursor', todas las páginas se leen en esa misma conexión (p. ej. un hilo de exportación por parroquia).
+    # Con 'cursor' no se consulta el catálogo: comprobar su versión prestaría otra conexión mientras el llamador
+    # ya tiene una (con todas prestadas, esperaría hasta agotar el tiempo). Los nombres de parroquia llegan
+    # resueltos en 'nombresParroquia' o, si es None, los devuelve el procedimiento
+    def iterar(self, idParroquia=None, tamanioPagina=500, tamanioBloque=100, cursor=None, nombresParroquia=None):
+        tamanioPagina = self._tamanioPagina(tamanioPagina)
+        desdeId = 0
+
+        while desdeId is not None:
+            leidas = 0
+            nombres = nombresParroquia if cursor is not None or nombresParroquia is not None \
+                else self._nombresParroquia()
+            with self._cursorPagina(cursor) as cursorPagina:
+                cursorPagina.execute(self.SQL_LISTAR_PAGINA, (desdeId, tamanioPagina, idParroquia, nombres is None))
+                while True:
+                    rows = cursorPagina.fetchmany(tamanioBloque)
+                    if not rows:
+                        break
+                    for row in rows:
+                        leidas += 1
+                        catequizado = Catequizado.desde_fila(row, nombres)
+                        desdeId = catequizado.idCatequizado
+                        yield catequizado
+
+            # Una página incompleta indica que ya no quedan registros
+            if leidas < tamanioPagina:
+                desdeId = None
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import connection as conexion
+from Catequizado.modeloCatequizado import Catequizado
+from Catequizado.repositorioCatequizado import RepositorioCatequizado
+
+# Excepción que indica que la operación se canceló antes o durante la consulta
+class OperacionCancelada(Exception):
+    pass
+
+# Token que permite a la tarea asyncio interrumpir la consulta que corre en el hilo del ejecutor
+class TokenCancelacion:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cursor = None
+        self.cancelado = False
+
+    # El pool entrega aquí el cursor al prestar la conexión (ver ConnectionPool.connection)
+    def registrar(self, cursor):
+        with self._lock:
+            if self.cancelado:
+                raise OperacionCancelada("La operación fue cancelada antes de ejecutarse.")
+            self._cursor = cursor
+
+    # El pool lo llama al devolver la conexión: desde entonces el cursor puede ser de otra solicitud
+    def liberar(self, cursor):
+        with self._lock:
+            if self._cursor is cursor:
+                self._cursor = None
+
+    # Pide al driver que cancele la consulta en curso (SQLCancel); pyodbc lo permite desde otro hilo.
+    # Se llama con el lock tomado para que liberar() espere a que termine y no se cancele la consulta de otro
+    def cancelar(self):
+        with self._lock:
+            self.cancelado = True
+            if self._cursor is not None:
+                try:
+                    self._cursor.cancel()
+                except Exception:
+                    pass
+
+# Servicio asíncrono con las cinco operaciones CRUD; las llamadas a pyodbc corren en un ejecutor
+# de hilos acotado para no bloquear el event loop
+class ServicioCatequizadoAsync:
+    def __init__(self, max_workers=None, timeout=30):
+        # Por defecto tantos hilos como conexiones tiene el pool: ningún hilo queda esperando conexión
+        if max_workers is None:
+            max_workers = conexion.get_connection_pool().max_size
+        self.timeout = timeout
+        self._repositorio = RepositorioCatequizado()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="catequizado")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cerrar()
+
+    # Ejecuta 'funcion' en el ejecutor con tiempo límite; si la tarea se cancela o vence el tiempo,
+    # se cancela también la consulta en el servidor
+    async def _ejecutar(self, funcion, *args, timeout=None):
+        loop = asyncio.get_running_loop()
+        cancelacion = TokenCancelacion()
+        futuro = loop.run_in_executor(self._executor, lambda: funcion(*args, cancelacion=cancelacion))
+        try:
+            return await asyncio.wait_for(futuro, self.timeout if timeout is None else timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            cancelacion.cancelar()
+            raise
+
+    # Acepta un registro Catequizado o un diccionario con sus campos
+    def _catequizado(self, datos):
+        if isinstance(datos, Catequizado):
+            return datos
+        return Catequizado.desde_diccionario(datos)
+
+    # Convierte el registro del resultado en diccionario para que sea serializable
+    def _resultado_con_diccionario(self, resultado):
+        if isinstance(resultado.datos, Catequizado):
+            return replace(resultado, datos=resultado.datos._asdict())
+        return resultado
+
+    async def registrar(self, datos, timeout=None):
+        resultado = await self._ejecutar(self._repositorio.registrar, self._catequizado(datos), timeout=timeout)
+        return self._resultado_con_diccionario(resultado)
+
+    async def buscar(self, cedulaIdentidad, timeout=None):
+        resultado = await self._ejecutar(self._repositorio.buscarPorCedula, cedulaIdentidad, timeout=timeout)
+        return self._resultado_con_diccionario(resultado)
+
+    async def actualizar(self, cedulaIdentidadActualizar, datos, timeout=None):
+        resultado = await self._ejecutar(self._repositorio.actualizar, cedulaIdentidadActualizar,
+                                         self._catequizado(datos), timeout=timeout)
+        return self._resultado_con_diccionario(resultado)
+
+    async def eliminar(self, cedulaIdentidad, timeout=None):
+        return await self._ejecutar(self._repositorio.eliminar, cedulaIdentidad, timeout=timeout)
+
+    # Devuelve una página del listado: {"filas": [...], "siguienteId": id o None}
+    async def listar(self, desdeId=0, tamanioPagina=50, idParroquia=None, timeout=None):
+        catequizados, siguienteId = await self._ejecutar(self._repositorio.listarPagina,
+                                                         desdeId, tamanioPagina, idParroquia, timeout=timeout)
+        return {"filas": [catequizado._asdict() for catequizado in catequizados], "siguienteId": siguienteId}
+
+    # Espera a que terminen las operaciones en curso y libera los hilos
+    async def cerrar(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown, True)
@@ -0,0 +1,169 @@
+import re
+from datetime import datetime
+
+# Campos de un catequizado en el orden que esperan los procedimientos almacenados
+CAMPOS_CATEQUIZADO = (
+    "idParroquiaPertenece",
+    "nombres",
+    "apellidos",
+    "cedulaIdentidad",
+    "fechaNacimiento",
+    "direccionDomicilio",
+    "nombreRepresentante",
+    "telefonoRepresentante",
+    "emailRepresentante",
+    "fechaBautismo",
+    "parroquiaBautismo"
+)
+
+# Validación de cliente: campos vacíos, ID de parroquia y fechas (modifica 'datos' convirtiendo el ID a entero)
+def validar_campos_catequizado(datos):
+    # 1. Validación de campos vacíos
+    for campo, valor in datos.items():
+        if not str(valor).strip(): # .strip() quita espacios en blanco
+            return False, f"[ERROR] El campo '{campo}' no puede estar vacío."
+
+    # 2. Validación de formatos
+    try:
+        # a) ID de Parroquia
+        datos["idParroquiaPertenece"] = int(datos["idParroquiaPertenece"])
+
+        # b) Fechas (YYYY-MM-DD)
+        fecha_nac = datetime.strptime(str(datos["fechaNacimiento"]), '%Y-%m-%d')
+        fecha_baut = datetime.strptime(str(datos["fechaBautismo"]), '%Y-%m-%d')
+
+        # c) Lógica de Fechas
+        if fecha_baut < fecha_nac:
+            return False, "[ERROR] La fecha de bautismo no puede ser anterior a la de nacimiento."
+
+    except ValueError:
+        return False, "[ERROR] ID de Parroquia o Formato de Fecha incorrecto. Use YYYY-MM-DD."
+
+    return True, "OK" # Si todo pasó, es válido
+
+# Expresiones equivalentes a las validaciones de formato de sp_RegistrarCatequizado.
+# SQL Server ignora los espacios finales al evaluar LEN() y LIKE, por eso se comparan los valores sin ellos.
+# Cédula: LEN(@c) != 10 OR @c LIKE '%[^0-9]%'
+PATRON_CEDULA = re.compile(r"[0-9]{10}")
+# Teléfono: LEN(@t) != 10 OR @t NOT LIKE '09%' OR @t LIKE '%[^0-9]%'
+PATRON_TELEFONO = re.compile(r"09[0-9]{8}")
+# Email: @e NOT LIKE '%_@__%.__%'
+PATRON_EMAIL = re.compile(r".+@.{2,}\..{2,}", re.DOTALL)
+
+# Longitud máxima de las columnas de texto de Proceso.TipoCatequizadoLote (VARCHAR(n))
+LONGITUDES_MAXIMAS = {
+    "nombres": 255,
+    "apellidos": 255,
+    "cedulaIdentidad": 10,
+    "direccionDomicilio": 255,
+    "nombreRepresentante": 255,
+    "telefonoRepresentante": 255,
+    "emailRepresentante": 255,
+    "parroquiaBautismo": 255
+}
+
+MENSAJE_CEDULA = "[ERROR] La cédula debe tener 10 dígitos numéricos."
+MENSAJE_TELEFONO = "[ERROR] El teléfono celular debe empezar con 09 y tener 10 dígitos."
+MENSAJE_EMAIL = "[ERROR] El formato del correo electrónico no es válido."
+MENSAJE_PARROQUIA_FECHA = "[ERROR] ID de Parroquia o Formato de Fecha incorrecto. Use YYYY-MM-DD."
+MENSAJE_BAUTISMO = "[ERROR] La fecha de bautismo no puede ser anterior a la de nacimiento."
+# Mismo texto que el procedimiento: el rechazo se ve igual si lo hace el cliente (con el catálogo local) o el servidor
+MENSAJE_PARROQUIA_INEXISTENTE = "ERROR: La parroquia seleccionada no existe en el sistema."
+# Advertencia de la validación sin conexión: el archivo de catálogos puede no incluir las parroquias más recientes
+MENSAJE_PARROQUIA_SIN_VERIFICAR = "[ADVERTENCIA] La parroquia no está en el catálogo local; se verificará al importar."
+
+# Validaciones de formato que también hace sp_RegistrarCatequizado (cédula, teléfono y email)
+def validar_formatos_catequizado(datos):
+    if not PATRON_CEDULA.fullmatch(str(datos["cedulaIdentidad"]).rstrip(' ')):
+        return False, MENSAJE_CEDULA
+    if not PATRON_TELEFONO.fullmatch(str(datos["telefonoRepresentante"]).rstrip(' ')):
+        return False, MENSAJE_TELEFONO
+    if not PATRON_EMAIL.fullmatch(str(datos["emailRepresentante"]).rstrip(' ')):
+        return False, MENSAJE_EMAIL
+    return True, "OK"
+
+# --- VALIDACIÓN POR LOTES ---
+
+# Marca con 'mensaje' las filas inválidas que todavía no tienen error (se conserva el primer error, como en el SP)
+def _marcar(errores, invalidos, mensaje):
+    for indice, invalido in enumerate(invalidos):
+        if invalido and errores[indice] is None:
+            errores[indice] = mensaje
+
+# Convierte cada valor distinto de la columna una sola vez (en un lote se repiten mucho fechas e IDs)
+def _convertir_columna(columna, conversor):
+    convertidos = {}
+    for valor in set(columna):
+        try:
+            convertidos[valor] = conversor(valor)
+        except ValueError:
+            convertidos[valor] = None
+    return [convertidos[valor] for valor in columna]
+
+def _convertir_fecha(texto):
+    return datetime.strptime(texto, '%Y-%m-%d').date()
+
+# Valida un lote completo columna por columna con las mismas reglas y en el mismo orden que sp_RegistrarCatequizado
+# (campos obligatorios, cédula, teléfono, email) más las reglas de cliente (ID de parroquia, fechas y bautismo).
+# Con 'parroquias' (colección de IDs existentes, p. ej. del catálogo local) también se rechazan las parroquias
+# inexistentes, que de otro modo rechazaría el procedimiento. Devuelve:
+#   errores  -> lista con None para las filas válidas o el primer mensaje de error de cada fila (la máscara)
+#   columnas -> diccionario campo -> lista de valores normalizados (ID de parroquia entero y fechas como date)
+def validar_lote_catequizados(registros, parroquias=None):
+    total = len(registros)
+    errores = [None] * total
+
+    # Filas que no son objetos (p. ej. líneas JSON inválidas)
+    _marcar(errores, [not isinstance(registro, dict) for registro in registros],
+            "[ERROR] La línea no contiene un objeto JSON válido.")
+
+    # Transponer el lote a columnas de texto
+    columnas = {}
+    for campo in CAMPOS_CATEQUIZADO:
+        columna = []
+        for registro in registros:
+            valor = registro.get(campo) if isinstance(registro, dict) else None
+            columna.append('' if valor is None else str(valor))
+        columnas[campo] = columna
+
+    # 1. Campos obligatorios (LTRIM/RTRIM solo quitan espacios)
+    for campo in CAMPOS_CATEQUIZADO:
+        _marcar(errores, [not valor.strip(' ') for valor in columnas[campo]],
+                f"[ERROR] El campo '{campo}' no puede estar vacío.")
+
+    # 1b. Longitudes de las columnas (se comparan sin los espacios que quita TRIM). En un lote, un valor que no cabe
+    # en el tipo de tabla haría fallar la llamada completa en el servidor: se rechaza solo esa fila
+    for campo, longitud in LONGITUDES_MAXIMAS.items():
+        _marcar(errores, [len(valor.strip(' ')) > longitud for valor in columnas[campo]],
+                f"[ERROR] El campo '{campo}' no puede tener más de {longitud} caracteres.")
+
+    # 2. Formatos (cédula, teléfono y email)
+    _marcar(errores, [not PATRON_CEDULA.fullmatch(valor.rstrip(' ')) for valor in columnas["cedulaIdentidad"]],
+            MENSAJE_CEDULA)
+    _marcar(errores, [not PATRON_TELEFONO.fullmatch(valor.rstrip(' ')) for valor in columnas["telefonoRepresentante"]],
+            MENSAJE_TELEFONO)
+    _marcar(errores, [not PATRON_EMAIL.fullmatch(valor.rstrip(' ')) for valor in columnas["emailRepresentante"]],
+            MENSAJE_EMAIL)
+
+    # 3. ID de parroquia y fechas
+    columnas["idParroquiaPertenece"] = _convertir_columna(columnas["idParroquiaPertenece"], int)
+    columnas["fechaNacimiento"] = _convertir_columna(columnas["fechaNacimiento"], _convertir_fecha)
+    columnas["fechaBautismo"] = _convertir_columna(columnas["fechaBautismo"], _convertir_fecha)
+    _marcar(errores, [id_parroquia is None or nacimiento is None or bautismo is None
+                      for id_parroquia, nacimiento, bautismo in zip(columnas["idParroquiaPertenece"],
+                                                                     columnas["fechaNacimiento"],
+                                                                     columnas["fechaBautismo"])],
+            MENSAJE_PARROQUIA_FECHA)
+
+    # 4. El bautismo no puede ser anterior al nacimiento
+    _marcar(errores, [nacimiento is not None and bautismo is not None and bautismo < nacimiento
+                      for nacimiento, bautismo in zip(columnas["fechaNacimiento"], columnas["fechaBautismo"])],
+            MENSAJE_BAUTISMO)
+
+    # 5. Parroquia existente (la misma regla del procedimiento, sin la llamada)
+    if parroquias is not None:
+        _marcar(errores, [id_parroquia is not None and id_parroquia not in parroquias
+                          for id_parroquia in columnas["idParroquiaPertenece"]],
+                MENSAJE_PARROQUIA_INEXISTENTE)
+
+    return errores, columnas
@@ -0,0 +1,32 @@
+from typing import NamedTuple
+
+# Registro inmutable con la elegibilidad de una inscripción para recibir el certificado
+# (mismas columnas y orden que sp_ElegibilidadCertificado)
+class ElegibilidadInscripcion(NamedTuple):
+    idInscripcion: int
+    idGrupo: int
+    idCatequizado: int
+    nombres: str
+    apellidos: str
+    cedulaIdentidad: str
+    numeroNotas: int
+    # None si la inscripción no tiene notas o clases registradas
+    promedio: object
+    clasesRegistradas: int
+    tasaAsistencia: object
+    tieneCertificado: bool
+    elegible: bool
+
+    @classmethod
+    def desde_fila(cls, row):
+        return cls._make(tuple(row))
+
+# Diferencia entre el resumen guardado de una inscripción y el recalculado desde Calificacion y Asistencia
+class DiferenciaResumen(NamedTuple):
+    idInscripcion: int
+    sumaNotasGuardada: object
+    sumaNotasCalculada: object
+    numeroNotasGuardado: int
+    numeroNotasCalculado: int
+    clasesGuardadas: int
+    clasesCalculadas: int
\ No newline at end of file
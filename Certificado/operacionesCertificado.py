@@ -0,0 +1,41 @@
+from Certificado.repositorioElegibilidad import RepositorioElegibilidad
+
+# Clase que muestra por consola la elegibilidad para certificado de un grupo o de una parroquia
+class OperacionesCertificado:
+
+    def __init__(self):
+        self.repositorio = RepositorioElegibilidad()
+
+    def operacion_elegibilidad(self):
+        print("\n--- Elegibilidad para Certificado ---")
+        filtro = input("Consultar por (g)rupo o (p)arroquia: ").strip().lower()
+        if filtro not in ('g', 'p'):
+            print("[ERROR] Opción no válida. Use g o p.")
+            return
+        try:
+            idFiltro = int(input("ID del Grupo: " if filtro == 'g' else "ID de la Parroquia: ").strip())
+        except ValueError:
+            print("[ERROR] El ID debe ser numérico.")
+            return
+
+        try:
+            if filtro == 'g':
+                inscripciones = self.repositorio.elegibilidadGrupo(idFiltro)
+            else:
+                inscripciones = self.repositorio.elegibilidadParroquia(idFiltro)
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return
+
+        print("\n---------- ELEGIBILIDAD PARA CERTIFICADO ----------")
+        for inscripcion in inscripciones:
+            promedio = "-" if inscripcion.promedio is None else inscripcion.promedio
+            asistencia = "-" if inscripcion.tasaAsistencia is None else f"{float(inscripcion.tasaAsistencia):.0%}"
+            estado = "CERTIFICADO EMITIDO" if inscripcion.tieneCertificado else \
+                ("ELEGIBLE" if inscripcion.elegible else "NO ELEGIBLE")
+            print(f"Grupo {inscripcion.idGrupo} | {inscripcion.apellidos} {inscripcion.nombres} "
+                  f"({inscripcion.cedulaIdentidad}) | Promedio: {promedio} ({inscripcion.numeroNotas} notas) | "
+                  f"Asistencia: {asistencia} ({inscripcion.clasesRegistradas} clases) | {estado}")
+        elegibles = sum(1 for inscripcion in inscripciones if inscripcion.elegible)
+        print(f"Elegibles: {elegibles} de {len(inscripciones)} inscripciones")
+        print("---------------------------------------------------\n")
\ No newline at end of file
@@ -0,0 +1,65 @@
+import json
+
+import connection as conexion
+from instrumentation import instrumented
+from Certificado.modeloElegibilidad import DiferenciaResumen, ElegibilidadInscripcion
+
+# Valores por defecto de los mínimos para el certificado (sección "certificado" de config.json)
+DEFAULT_CERTIFICADO_CONFIG = {
+    "nota_minima": 7.0,        # Promedio mínimo sobre 10
+    "asistencia_minima": 0.8   # Fracción mínima de clases asistidas (las faltas justificadas cuentan como asistidas)
+}
+
+# Función para leer los mínimos del certificado (usa los valores por defecto si no existe la sección o el archivo)
+def get_certificado_config(config_file='config.json'):
+    certificado_config = dict(DEFAULT_CERTIFICADO_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            certificado_config.update(json.load(file).get('certificado', {}))
+    except FileNotFoundError:
+        pass
+    return certificado_config
+
+# Repositorio sin estado para la elegibilidad de certificados.
+# Los promedios y tasas de asistencia salen de Proceso.ResumenInscripcion, que los triggers de Calificacion
+# y Asistencia mantienen al día, por lo que una consulta recorre inscripciones y no notas ni clases
+class RepositorioElegibilidad:
+    SQL_ELEGIBILIDAD = "{CALL Proceso.sp_ElegibilidadCertificado(?,?,?,?)}"
+    SQL_RECONSTRUIR_RESUMEN = "{CALL Proceso.sp_ReconstruirResumenInscripcion(?)}"
+
+    # Devuelve la elegibilidad de cada inscripción no retirada del grupo y/o parroquia indicados.
+    # Sin mínimos explícitos se usan los de config.json
+    @instrumented("elegibilidad", "Proceso.sp_ElegibilidadCertificado")
+    def elegibilidad(self, idGrupo=None, idParroquia=None, notaMinima=None, asistenciaMinima=None, cancelacion=None):
+        if idGrupo is None and idParroquia is None:
+            raise ValueError("Indique un grupo o una parroquia.")
+        config = get_certificado_config()
+        notaMinima = config["nota_minima"] if notaMinima is None else notaMinima
+        asistenciaMinima = config["asistencia_minima"] if asistenciaMinima is None else asistenciaMinima
+
+        with conexion.get_connection_pool().connection(self.SQL_ELEGIBILIDAD, cancelacion) as (database, cursor):
+            cursor.execute(self.SQL_ELEGIBILIDAD, (idGrupo, idParroquia, notaMinima, asistenciaMinima))
+            return [ElegibilidadInscripcion.desde_fila(row) for row in cursor.fetchall()]
+
+    def elegibilidadGrupo(self, idGrupo, notaMinima=None, asistenciaMinima=None, cancelacion=None):
+        return self.elegibilidad(idGrupo, None, notaMinima, asistenciaMinima, cancelacion)
+
+    def elegibilidadParroquia(self, idParroquia, notaMinima=None, asistenciaMinima=None, cancelacion=None):
+        return self.elegibilidad(None, idParroquia, notaMinima, asistenciaMinima, cancelacion)
+
+    # Recalcula el resumen desde Calificacion y Asistencia (recorrido completo) y devuelve las inscripciones
+    # cuyo resumen no coincidía. Con 'soloVerificar' no modifica nada; si no, corrige las diferencias
+    @instrumented("reconstruir_resumen", "Proceso.sp_ReconstruirResumenInscripcion")
+    def reconstruirResumen(self, soloVerificar=False, cancelacion=None):
+        with conexion.get_connection_pool().connection(cancellation=cancelacion) as (database, cursor):
+            try:
+                cursor.execute(self.SQL_RECONSTRUIR_RESUMEN, (1 if soloVerificar else 0,))
+                diferencias = [DiferenciaResumen._make(tuple(row)) for row in cursor.fetchall()]
+            except Exception:
+                database.rollback()
+                raise
+            database.commit()
+        return diferencias
+
+    def verificarResumen(self, cancelacion=None):
+        return self.reconstruirResumen(True, cancelacion)
\ No newline at end of file
@@ -0,0 +1,55 @@
+import json
+import threading
+import time
+
+from Catequizado.cacheCatequizado import CacheCatequizado
+
+# Valores por defecto de las inscripciones (sección "inscripcion" de config.json)
+DEFAULT_INSCRIPCION_CONFIG = {
+    "max_grupos": 500,    # Máximo de contadores de cupos guardados
+    "ttl_cupos": 30,      # Segundos que un contador guardado se considera vigente
+    "tamanio_lote": 500   # Solicitudes por llamada a sp_InscribirLote (un lote mayor se divide)
+}
+
+# Contadores de cupos por grupo (idGrupo -> CuposGrupo). Es la caché LRU/TTL de los catequizados, pero un contador
+# solo reemplaza al guardado si su versión es más reciente: con varios hilos inscribiendo en el mismo grupo,
+# las respuestas pueden llegar en otro orden que el de las reservas
+class ContadoresCupos(CacheCatequizado):
+    def guardar(self, idGrupo, cupos):
+        with self._lock:
+            entrada = self._entradas.get(idGrupo)
+            if entrada is not None and _mas_reciente(entrada[1], cupos):
+                return
+            self._entradas[idGrupo] = (time.monotonic() + self.ttl, cupos)
+            self._entradas.move_to_end(idGrupo)
+            while len(self._entradas) > self.max_size:
+                self._entradas.popitem(last=False)
+                self._contadores["desalojos"] += 1
+
+# True si el contador 'guardado' es posterior a 'nuevo' (sin versión no se puede comparar: gana el nuevo)
+def _mas_reciente(guardado, nuevo):
+    return guardado.version is not None and nuevo.version is not None and guardado.version > nuevo.version
+
+# Contadores compartidos por todo el proceso (se crean la primera vez que se necesitan)
+_contadores = None
+_contadores_lock = threading.Lock()
+
+# Función para leer la configuración de inscripciones (usa los valores por defecto si no existe la sección)
+def get_inscripcion_config(config_file='config.json'):
+    inscripcion_config = dict(DEFAULT_INSCRIPCION_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            inscripcion_config.update(json.load(file).get('inscripcion', {}))
+    except FileNotFoundError:
+        pass
+    return inscripcion_config
+
+# Función que devuelve los contadores de cupos compartidos
+def get_contadores_cupos(config_file='config.json'):
+    global _contadores
+    if _contadores is None:
+        with _contadores_lock:
+            if _contadores is None:
+                config = get_inscripcion_config(config_file)
+                _contadores = ContadoresCupos(max_size=config["max_grupos"], ttl=config["ttl_cupos"])
+    return _contadores
\ No newline at end of file
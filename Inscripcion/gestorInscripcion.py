@@ -0,0 +1,69 @@
+from Inscripcion.modeloInscripcion import DUPLICADO, INSCRITO, INVALIDO, NO_ENCONTRADO, SIN_CUPO
+from Inscripcion.repositorioInscripcion import RepositorioInscripcion
+
+# Texto de cada resultado en el reporte por consola
+DESCRIPCION_RESULTADOS = {
+    INSCRITO: "INSCRITO",
+    SIN_CUPO: "SIN CUPO",
+    DUPLICADO: "YA INSCRITO EN EL GRUPO",
+    NO_ENCONTRADO: "CÉDULA NO REGISTRADA",
+    INVALIDO: "DATOS INVÁLIDOS"
+}
+
+# Clase para gestionar las inscripciones de catequizados en grupos desde la consola.
+# El acceso a datos lo hace RepositorioInscripcion; esta clase solo delega y muestra los resultados.
+class GestorInscripcion:
+    # Repositorio sin estado compartido por todas las instancias
+    repositorio = RepositorioInscripcion()
+
+    # --- OPERACIONES SIN SALIDA POR CONSOLA ---
+
+    def ejecutarConsultaCupos(self, idGrupo, refrescar=False, cancelacion=None):
+        return self.repositorio.cupos(idGrupo, refrescar, cancelacion)
+
+    def ejecutarInscripcionLote(self, idGrupo, solicitudes, cancelacion=None):
+        return self.repositorio.inscribirLote(idGrupo, solicitudes, cancelacion)
+
+    # --- OPERACIONES DE CONSOLA ---
+
+    # Método para mostrar los cupos de un grupo (devuelve el contador o None)
+    def mostrarCupos(self, idGrupo, refrescar=True):
+        try:
+            cupos = self.ejecutarConsultaCupos(idGrupo, refrescar)
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return None
+
+        if cupos is None:
+            print(f"No existe ningún grupo con el ID {idGrupo}\n")
+            return None
+        print(f"Grupo {idGrupo}: {cupos.cuposOcupados} de {cupos.cuposMaximos} cupos ocupados "
+              f"({cupos.cuposLibres} libres).")
+        return cupos
+
+    # Método para inscribir un lote de catequizados en un grupo y mostrar el reporte,
+    # incluidos los que no alcanzaron cupo
+    def inscribirCatequizados(self, idGrupo, solicitudes):
+        try:
+            resultado = self.ejecutarInscripcionLote(idGrupo, solicitudes)
+        except Exception as e:
+            print("Error durante la ejecución de la consulta:", e)
+            return
+
+        print(resultado.mensaje)
+        reporte = resultado.datos
+        if reporte is None:
+            print()
+            return
+
+        print("\n---------- REPORTE DE INSCRIPCIÓN ----------")
+        for fila in reporte.resultados:
+            descripcion = DESCRIPCION_RESULTADOS.get(fila.resultado, fila.resultado)
+            codigo = f" (inscripción {fila.idInscripcion})" if fila.idInscripcion is not None else ""
+            print(f"{fila.orden}. {fila.cedulaIdentidad}: {descripcion}{codigo}")
+        if reporte.desbordados:
+            print(f"\n{len(reporte.desbordados)} catequizado(s) sin cupo: "
+                  f"{', '.join(fila.cedulaIdentidad for fila in reporte.desbordados)}")
+        if reporte.cupos is not None:
+            print(f"Cupos ocupados: {reporte.cupos.cuposOcupados} de {reporte.cupos.cuposMaximos}")
+        print("--------------------------------------------\n")
\ No newline at end of file
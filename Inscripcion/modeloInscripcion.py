@@ -0,0 +1,68 @@
+from typing import NamedTuple
+
+# Estados de pago que acepta Proceso.Inscripcion (CK_Inscripcion_estadoPago)
+ESTADOS_PAGO = ("Pendiente", "Pagado", "Exonerado")
+
+# Resultado de cada solicitud de un lote (columna Resultado de sp_InscribirLote)
+INSCRITO = "Inscrito"
+SIN_CUPO = "SinCupo"
+DUPLICADO = "Duplicado"
+NO_ENCONTRADO = "NoEncontrado"
+INVALIDO = "Invalido"
+
+# Solicitud de inscripción de un catequizado (identificado por su cédula) en un grupo
+class SolicitudInscripcion(NamedTuple):
+    cedulaIdentidad: str
+    presentoFeBautismo: bool = False
+    estadoPago: str = "Pendiente"
+    montoPago: object = 0
+
+    # Fila del parámetro con valores de tabla Proceso.TipoInscripcionLote (orden = posición en el lote)
+    def fila_lote(self, orden):
+        return (orden, self.cedulaIdentidad, bool(self.presentoFeBautismo), self.estadoPago, self.montoPago)
+
+# Resultado de una solicitud: 'orden' es su posición en el lote (empezando en 1)
+class ResultadoInscripcion(NamedTuple):
+    orden: int
+    cedulaIdentidad: str
+    resultado: str
+    idInscripcion: int = None
+
+    # Construye el registro a partir de una fila del segundo resultado de sp_InscribirLote
+    @classmethod
+    def desde_fila(cls, row):
+        return cls._make(tuple(row[:4]))
+
+# Contador de cupos de un grupo; 'version' es el rowversion de Proceso.CupoGrupo (crece con cada cambio)
+class CuposGrupo(NamedTuple):
+    idGrupo: int
+    cuposMaximos: int
+    cuposOcupados: int
+    version: bytes = None
+
+    @property
+    def cuposLibres(self):
+        return max(self.cuposMaximos - self.cuposOcupados, 0)
+
+    # Construye el registro a partir de una fila de sp_CuposGrupo (mismas columnas y orden)
+    @classmethod
+    def desde_fila(cls, row):
+        return cls._make(tuple(row[:4]))
+
+# Reporte de un lote: el resultado de cada solicitud y el contador del grupo después del lote
+class ReporteInscripcion(NamedTuple):
+    idGrupo: int
+    resultados: tuple
+    cupos: CuposGrupo
+
+    def con_resultado(self, resultado):
+        return [fila for fila in self.resultados if fila.resultado == resultado]
+
+    @property
+    def inscritos(self):
+        return self.con_resultado(INSCRITO)
+
+    # Solicitudes válidas que no alcanzaron cupo
+    @property
+    def desbordados(self):
+        return self.con_resultado(SIN_CUPO)
\ No newline at end of file
@@ -0,0 +1,43 @@
+import re
+
+from Inscripcion.gestorInscripcion import GestorInscripcion
+from Inscripcion.modeloInscripcion import ESTADOS_PAGO, SolicitudInscripcion
+
+# Clase que maneja la inscripción de catequizados en un grupo desde la consola
+class OperacionesInscripcion:
+
+    def __init__(self):
+        self.gestor = GestorInscripcion()
+
+    def operacion_inscribir(self):
+        print("\n--- Inscribir Catequizados en un Grupo ---")
+        try:
+            idGrupo = int(input("ID del Grupo: ").strip())
+        except ValueError:
+            print("[ERROR] El ID del grupo debe ser numérico.")
+            return
+
+        if self.gestor.mostrarCupos(idGrupo) is None:
+            return
+
+        # Se pueden pegar varias cédulas a la vez (separadas por comas, espacios o saltos de línea)
+        print("Ingrese las cédulas a inscribir (línea vacía para terminar):")
+        cedulas = []
+        while True:
+            linea = input().strip()
+            if not linea:
+                break
+            cedulas.extend(valor for valor in re.split(r"[,;\s]+", linea) if valor)
+        if not cedulas:
+            print("No se ingresó ninguna cédula.")
+            return
+
+        # Los datos de pago se aplican a todo el lote
+        presentoFeBautismo = input("¿Presentaron fe de bautismo? (s/n): ").strip().lower() == 's'
+        estadoPago = input(f"Estado del pago ({'/'.join(ESTADOS_PAGO)}, Enter = Pendiente): ").strip().capitalize()
+        estadoPago = estadoPago or "Pendiente"
+        monto = input("Monto del pago (Enter = 0): ").strip()
+        montoPago = monto or "0"
+
+        solicitudes = [SolicitudInscripcion(cedula, presentoFeBautismo, estadoPago, montoPago) for cedula in cedulas]
+        self.gestor.inscribirCatequizados(idGrupo, solicitudes)
\ No newline at end of file
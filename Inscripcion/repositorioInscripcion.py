@@ -0,0 +1,154 @@
+from decimal import Decimal, InvalidOperation
+import sys
+
+import connection as conexion
+from audit import audit_image, get_audit_writer
+from instrumentation import instrumented
+from Asistencia.repositorioAsistencia import RepositorioAsistencia
+from Catequizado.procedimientosCatequizado import (CODIGO_CAMPOS_OBLIGATORIOS, CODIGO_ERROR_SQL, ErrorCatequizado,
+                                                   LlamadaProcedimiento, descartar_resultados)
+from Catequizado.repositorioCatequizado import ResultadoOperacion
+from Catequizado.validacionesCatequizado import PATRON_CEDULA
+from Inscripcion.cacheInscripcion import get_contadores_cupos, get_inscripcion_config
+from Inscripcion.modeloInscripcion import (ESTADOS_PAGO, INSCRITO, INVALIDO, CuposGrupo, ReporteInscripcion,
+                                           ResultadoInscripcion)
+
+# Repositorio sin estado para Proceso.Inscripcion: inscripción por lotes con control de cupos.
+# El cupo se reserva en el servidor con una actualización condicional del contador del grupo
+# (Proceso.CupoGrupo), así que varias personas pueden inscribir a la vez en el mismo grupo sin sobrepasarlo
+class RepositorioInscripcion:
+    SQL_CUPOS = "{CALL Proceso.sp_CuposGrupo(?)}"
+    # Las solicitudes viajan como un parámetro con valores de tabla (TVP): ver SolicitudInscripcion.fila_lote
+    INSCRIBIR_LOTE = LlamadaProcedimiento("Proceso.sp_InscribirLote", 2)
+
+    # --- MÉTODOS AUXILIARES ---
+
+    # Validación de cliente: las solicitudes inválidas se informan sin enviarlas
+    def _solicitudValida(self, solicitud):
+        if not PATRON_CEDULA.fullmatch(str(solicitud.cedulaIdentidad or "").strip()):
+            return False
+        if solicitud.estadoPago not in ESTADOS_PAGO:
+            return False
+        try:
+            return Decimal(str(solicitud.montoPago)) >= 0
+        except InvalidOperation:
+            return False
+
+    # --- OPERACIONES ---
+
+    # Devuelve el contador de cupos del grupo (CuposGrupo) o None si el grupo no existe.
+    # Se sirve desde los contadores en memoria, que cada inscripción actualiza; 'refrescar' lo vuelve a leer
+    @instrumented("cupos_grupo", "Proceso.sp_CuposGrupo")
+    def cupos(self, idGrupo, refrescar=False, cancelacion=None):
+        contadores = get_contadores_cupos()
+        if not refrescar:
+            cupos = contadores.obtener(idGrupo)
+            if cupos is not None:
+                return cupos
+
+        with conexion.get_connection_pool().connection(self.SQL_CUPOS, cancelacion) as (database, cursor):
+            cursor.execute(self.SQL_CUPOS, (idGrupo,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        cupos = CuposGrupo.desde_fila(row)
+        contadores.guardar(idGrupo, cupos)
+        return cupos
+
+    # Inscribe en el grupo los catequizados de 'solicitudes' (SolicitudInscripcion), en ese orden, hasta llenar
+    # los cupos. Quedarse sin cupo no es un error: en 'datos' va un ReporteInscripcion con el resultado de cada
+    # solicitud (Inscrito, SinCupo, Duplicado, NoEncontrado o Invalido) y el contador del grupo.
+    # Cada lote de 'tamanio_lote' solicitudes es una sola llamada y un solo COMMIT
+    @instrumented("inscribir_lote", INSCRIBIR_LOTE.nombre)
+    def inscribirLote(self, idGrupo, solicitudes, cancelacion=None):
+        solicitudes = list(solicitudes)
+        if not solicitudes:
+            return ResultadoOperacion(False, "ERROR: No hay solicitudes de inscripción.",
+                                      codigo=CODIGO_CAMPOS_OBLIGATORIOS)
+
+        resultados = []
+        filas = []
+        for orden, solicitud in enumerate(solicitudes, 1):
+            if self._solicitudValida(solicitud):
+                filas.append(solicitud.fila_lote(orden))
+            else:
+                resultados.append(ResultadoInscripcion(orden, solicitud.cedulaIdentidad, INVALIDO))
+
+        cupos = None
+        tamanioLote = get_inscripcion_config()["tamanio_lote"]
+        for inicio in range(0, len(filas), tamanioLote):
+            try:
+                cuposLote, resultadosLote = self._inscribir(idGrupo, filas[inicio:inicio + tamanioLote], cancelacion)
+            except ErrorCatequizado as e:
+                # Los lotes anteriores ya quedaron confirmados y van en el reporte
+                reporte = self._reporte(idGrupo, resultados, cupos)
+                return ResultadoOperacion(False, e.mensaje, reporte, codigo=e.codigo)
+            except Exception as e:
+                # Un error del driver (caída de la conexión, timeout) tampoco deshace los lotes ya confirmados;
+                # la conexión ya la descartó el pool
+                pyodbc = sys.modules.get("pyodbc")
+                if pyodbc is None or not isinstance(e, pyodbc.Error):
+                    raise
+                reporte = self._reporte(idGrupo, resultados, cupos)
+                return ResultadoOperacion(False, f"ERROR: Error de base de datos: {e}", reporte,
+                                          codigo=CODIGO_ERROR_SQL)
+            cupos = cuposLote
+            resultados.extend(resultadosLote)
+
+        reporte = self._reporte(idGrupo, resultados, cupos)
+        otros = len(reporte.resultados) - len(reporte.inscritos) - len(reporte.desbordados)
+        mensaje = f"OK: Inscritos: {len(reporte.inscritos)}, sin cupo: {len(reporte.desbordados)}, " \
+                  f"no inscritos por otros motivos: {otros}."
+        return ResultadoOperacion(True, mensaje, reporte)
+
+    # Inscribe en el grupo las solicitudes indicadas por grupo ({idGrupo: [SolicitudInscripcion, ...]}).
+    # Cada grupo es independiente (su propia llamada y transacción); devuelve {idGrupo: ResultadoOperacion}
+    def inscribirPorGrupo(self, solicitudesPorGrupo, cancelacion=None):
+        return {idGrupo: self.inscribirLote(idGrupo, solicitudesPorGrupo[idGrupo], cancelacion)
+                for idGrupo in sorted(solicitudesPorGrupo)}
+
+    # Una llamada a sp_InscribirLote; devuelve el contador después del lote y el resultado de cada fila
+    def _inscribir(self, idGrupo, filas, cancelacion=None):
+        with conexion.get_connection_pool().connection(self.INSCRIBIR_LOTE.sql, cancelacion) as (database, cursor):
+            try:
+                row = self.INSCRIBIR_LOTE.ejecutar(cursor, (idGrupo, filas), descartarResto=False)
+                resultados = [ResultadoInscripcion.desde_fila(fila) for fila in cursor.fetchall()] \
+                    if cursor.nextset() else []
+                descartar_resultados(cursor)
+            except Exception:
+                # Un código distinto de 0 (ErrorCatequizado) o un error del driver: no se inscribe nadie del lote
+                database.rollback()
+                raise
+            database.commit()
+
+        # La fila de resultado es (codigo, mensaje, inscritos, sinCupo, cuposMaximos, cuposOcupados, version)
+        cupos = CuposGrupo(idGrupo, row[4], row[5], row[6])
+        get_contadores_cupos().guardar(idGrupo, cupos)
+        if row[2]:
+            # La lista de clase del grupo cambió
+            RepositorioAsistencia().invalidarGrupos(idGrupo)
+            self._auditar(idGrupo, filas, resultados)
+        return cupos, resultados
+
+    def _reporte(self, idGrupo, resultados, cupos):
+        return ReporteInscripcion(idGrupo, tuple(sorted(resultados)), cupos)
+
+    # Con auditoría habilitada: una imagen por inscripción creada
+    def _auditar(self, idGrupo, filas, resultados):
+        auditoria = get_audit_writer()
+        if not auditoria.enabled:
+            return
+        solicitudes = {fila[0]: fila for fila in filas}
+        for resultado in resultados:
+            if resultado.resultado != INSCRITO:
+                continue
+            orden, cedulaIdentidad, presentoFeBautismo, estadoPago, montoPago = solicitudes[resultado.orden]
+            auditoria.record("INSERT", "Proceso.Inscripcion", resultado.idInscripcion, audit_image({
+                "idInscripcion": resultado.idInscripcion,
+                "cedulaIdentidad": cedulaIdentidad,
+                "idGrupoPertenece": idGrupo,
+                "estadoInscripcion": "Cursando",
+                "presentoFeBautismo": presentoFeBautismo,
+                "estadoPago": estadoPago,
+                "montoPago": montoPago
+            }))
\ No newline at end of file
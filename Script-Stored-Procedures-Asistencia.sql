@@ -0,0 +1,149 @@
+/* Establece el contexto de la base de datos a 'CATEQUESIS' */
+USE CATEQUESIS
+GO
+
+/* --------------------------------------------------------------------------
+-- ndices para la toma de asistencia por grupo
+-- IX_Inscripcion_Grupo_Estado: lista de clase de un grupo sin recorrer
+-- todas las inscripciones.
+-- IX_Asistencia_Inscripcion_Fecha: localiza la marca de un estudiante en
+-- una fecha de clase (la actualiza en lugar de duplicarla).
+--------------------------------------------------------------------------
+*/
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Inscripcion_Grupo_Estado' AND object_id = OBJECT_ID('Proceso.Inscripcion'))
+    CREATE NONCLUSTERED INDEX IX_Inscripcion_Grupo_Estado
+        ON Proceso.Inscripcion (idGrupoPertenece, estadoInscripcion)
+        INCLUDE (idCatequizadoRealiza);
+GO
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Asistencia_Inscripcion_Fecha' AND object_id = OBJECT_ID('Proceso.Asistencia'))
+    CREATE NONCLUSTERED INDEX IX_Asistencia_Inscripcion_Fecha
+        ON Proceso.Asistencia (idInscripcionRegistra, fechaClase)
+        INCLUDE (estadoAsistencia);
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Listar los Inscritos Activos de un Grupo
+-- Devuelve en una sola consulta las inscripciones 'Cursando' del grupo con
+-- los datos del catequizado, ordenadas por apellidos y nombres.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ListarInscritosGrupo
+    @idGrupo INTEGER
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT
+        I.idInscripcion AS ID_Inscripcion,
+        C.idCatequizado AS ID_Catequizado,
+        C.nombres AS Nombres,
+        C.apellidos AS Apellidos,
+        C.cedulaIdentidad AS Cedula
+    FROM Proceso.Inscripcion AS I
+    INNER JOIN Proceso.Catequizado AS C ON C.idCatequizado = I.idCatequizadoRealiza
+    WHERE I.idGrupoPertenece = @idGrupo
+      AND I.estadoInscripcion = 'Cursando'
+    ORDER BY C.apellidos, C.nombres;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- Tipo de tabla para las marcas de asistencia de una clase
+-- Una fila por inscripcin: la clave primaria impide marcar dos veces al
+-- mismo estudiante en la misma llamada.
+--------------------------------------------------------------------------
+*/
+IF TYPE_ID('Proceso.TipoAsistenciaLote') IS NULL
+    CREATE TYPE Proceso.TipoAsistenciaLote AS TABLE (
+        idInscripcion INTEGER NOT NULL PRIMARY KEY,
+        estadoAsistencia VARCHAR(11)
+    );
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Registrar la Asistencia de un Grupo en una Fecha de Clase
+-- Recibe todas las marcas de la clase y las guarda con dos sentencias sobre
+-- el conjunto completo: actualiza las que ya existan para esa fecha e
+-- inserta las nuevas. Si alguna marca no es vlida no se guarda ninguna.
+-- Devuelve una fila (codigo, mensaje) y el mismo cdigo con RETURN
+-- (mismos cdigos que los procedimientos ...ConCodigo; 8 = inscripcin
+-- que no est cursando en el grupo).
+-- La transaccin la confirma el cliente (un COMMIT por clase).
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_RegistrarAsistenciaGrupo
+    @idGrupo INTEGER,
+    @fechaClase DATE,
+    @marcas Proceso.TipoAsistenciaLote READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    /* 1. VALIDACIN DE CAMPOS OBLIGATORIOS */
+    IF @idGrupo IS NULL OR @fechaClase IS NULL OR NOT EXISTS (SELECT 1 FROM @marcas)
+    BEGIN
+        SELECT 1 AS codigo, 'ERROR: El grupo, la fecha de clase y las marcas de asistencia son obligatorios.' AS mensaje;
+        RETURN 1;
+    END
+
+    IF EXISTS (SELECT 1 FROM @marcas WHERE ISNULL(estadoAsistencia, '') NOT IN ('Presente', 'Ausente', 'Justificado'))
+    BEGIN
+        SELECT 1 AS codigo, 'ERROR: El estado de asistencia debe ser Presente, Ausente o Justificado.' AS mensaje;
+        RETURN 1;
+    END
+
+    /* 2. VALIDACIONES DE NEGOCIO */
+    IF NOT EXISTS (SELECT 1 FROM Proceso.Grupo WHERE idGrupo = @idGrupo)
+    BEGIN
+        SELECT 7 AS codigo, 'ERROR: No existe ningn grupo con el ID ' + CAST(@idGrupo AS VARCHAR) AS mensaje;
+        RETURN 7;
+    END
+
+    DECLARE @inscripcionInvalida INTEGER;
+    SELECT TOP (1) @inscripcionInvalida = M.idInscripcion
+    FROM @marcas AS M
+    WHERE NOT EXISTS (SELECT 1 FROM Proceso.Inscripcion AS I
+                      WHERE I.idInscripcion = M.idInscripcion
+                        AND I.idGrupoPertenece = @idGrupo
+                        AND I.estadoInscripcion = 'Cursando');
+
+    IF @inscripcionInvalida IS NOT NULL
+    BEGIN
+        SELECT 8 AS codigo, 'ERROR: La inscripcin ' + CAST(@inscripcionInvalida AS VARCHAR) + ' no est cursando en el grupo ' + CAST(@idGrupo AS VARCHAR) AS mensaje;
+        RETURN 8;
+    END
+
+    /* 3. BLOQUE DE ESCRITURA (una sentencia para las marcas existentes y otra para las nuevas) */
+    BEGIN TRY
+        DECLARE @actualizadas INTEGER, @insertadas INTEGER;
+
+        /* Bloquea el rango para que dos clases registradas a la vez no calculen los mismos IDs. */
+        DECLARE @UltimoID INTEGER;
+        SELECT @UltimoID = ISNULL(MAX(idAsistencia), 0) FROM Proceso.Asistencia WITH (UPDLOCK, HOLDLOCK);
+
+        UPDATE A
+        SET A.estadoAsistencia = M.estadoAsistencia
+        FROM Proceso.Asistencia AS A
+        INNER JOIN @marcas AS M ON M.idInscripcion = A.idInscripcionRegistra
+        WHERE A.fechaClase = @fechaClase;
+        SET @actualizadas = @@ROWCOUNT;
+
+        INSERT INTO Proceso.Asistencia (idAsistencia, idInscripcionRegistra, fechaClase, estadoAsistencia)
+        SELECT @UltimoID + ROW_NUMBER() OVER (ORDER BY M.idInscripcion), M.idInscripcion, @fechaClase, M.estadoAsistencia
+        FROM @marcas AS M
+        WHERE NOT EXISTS (SELECT 1 FROM Proceso.Asistencia AS A
+                          WHERE A.idInscripcionRegistra = M.idInscripcion
+                            AND A.fechaClase = @fechaClase);
+        SET @insertadas = @@ROWCOUNT;
+
+        SELECT 0 AS codigo,
+               'OK: Asistencia registrada. Nuevas: ' + CAST(@insertadas AS VARCHAR) + ', actualizadas: ' + CAST(@actualizadas AS VARCHAR) AS mensaje;
+        RETURN 0;
+    END TRY
+    BEGIN CATCH
+        SELECT 50 AS codigo, 'ERROR CRTICO SQL: ' + ERROR_MESSAGE() AS mensaje;
+        RETURN 50;
+    END CATCH
+END
+GO
\ No newline at end of file
@@ -0,0 +1,66 @@
+/* Establece el contexto de la base de datos a 'CATEQUESIS' */
+USE CATEQUESIS
+GO
+
+/* --------------------------------------------------------------------------
+-- Tipo de tabla para un lote de registros de auditora
+-- Una fila por cambio auditado, con las columnas de Seguridad.Auditoria
+-- salvo el ID (lo asigna el procedimiento) y 'orden', la posicin del
+-- registro en el lote.
+--------------------------------------------------------------------------
+*/
+IF TYPE_ID('Seguridad.TipoAuditoriaLote') IS NULL
+    CREATE TYPE Seguridad.TipoAuditoriaLote AS TABLE (
+        orden INTEGER NOT NULL PRIMARY KEY,
+        idUsuarioRealiza INTEGER NOT NULL,
+        fechaHoraAccion DATETIME NOT NULL,
+        accionRealizada VARCHAR(10) NOT NULL,
+        tablaAfectada VARCHAR(255) NOT NULL,
+        idRegistroAfectado INTEGER NOT NULL,
+        datosNuevos VARCHAR(MAX) NOT NULL,
+        datosAntiguos VARCHAR(MAX) NOT NULL
+    );
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Registrar un Lote de Auditora
+-- Lo llama el hilo de auditora de la aplicacin (audit.py) con los
+-- cambios acumulados: un solo INSERT para todo el lote, en el orden en que
+-- ocurrieron. Devuelve una fila (codigo, mensaje) y el mismo cdigo con
+-- RETURN (0 = OK, 1 = lote vaco, 50 = error SQL).
+-- La transaccin la confirma el cliente (un COMMIT por lote).
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Seguridad.sp_RegistrarAuditoriaLote
+    @registros Seguridad.TipoAuditoriaLote READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF NOT EXISTS (SELECT 1 FROM @registros)
+    BEGIN
+        SELECT 1 AS codigo, 'ERROR: El lote de auditora est vaco.' AS mensaje;
+        RETURN 1;
+    END
+
+    BEGIN TRY
+        /* Bloquea el rango para que dos lotes enviados a la vez no calculen los mismos IDs. */
+        DECLARE @UltimoID INTEGER, @insertados INTEGER;
+        SELECT @UltimoID = ISNULL(MAX(idAuditoria), 0) FROM Seguridad.Auditoria WITH (UPDLOCK, HOLDLOCK);
+
+        INSERT INTO Seguridad.Auditoria (idAuditoria, idUsuarioRealiza, fechaHoraAccion, accionRealizada,
+                                         tablaAfectada, idRegistroAfectado, datosNuevos, datosAntiguos)
+        SELECT @UltimoID + ROW_NUMBER() OVER (ORDER BY R.orden), R.idUsuarioRealiza, R.fechaHoraAccion,
+               R.accionRealizada, R.tablaAfectada, R.idRegistroAfectado, R.datosNuevos, R.datosAntiguos
+        FROM @registros AS R;
+        SET @insertados = @@ROWCOUNT;
+
+        SELECT 0 AS codigo, 'OK: Auditora registrada. Registros: ' + CAST(@insertados AS VARCHAR) AS mensaje;
+        RETURN 0;
+    END TRY
+    BEGIN CATCH
+        SELECT 50 AS codigo, 'ERROR CRTICO SQL: ' + ERROR_MESSAGE() AS mensaje;
+        RETURN 50;
+    END CATCH
+END
+GO
\ No newline at end of file
@@ -43,7 +43,7 @@ BEGIN
     BEGIN
         /* Si falla la validacin, asigna el mensaje de error y detiene la ejecucin. */
         SET @MensajeSalida = 'ERROR: Todos los campos son obligatorios. Por favor, complete la informacin faltante.';
-        RETURN;
+        RETURN 1;
     END
 
     /* 2. VALIDACIONES DE FORMATO */
@@ -51,21 +51,21 @@ BEGIN
     IF LEN(@cedulaIdentidad) != 10 OR @cedulaIdentidad LIKE '%[^0-9]%'
     BEGIN
         SET @MensajeSalida = 'ERROR: La cdula debe tener 10 dgitos numricos.';
-        RETURN;
+        RETURN 2;
     END
 
     /* 2b. Telfono: Valida el formato de celular de Ecuador (10 dgitos, empieza con '09'). */
     IF LEN(@telefonoRepresentante) != 10 OR @telefonoRepresentante NOT LIKE '09%' OR @telefonoRepresentante LIKE '%[^0-9]%'
     BEGIN
         SET @MensajeSalida = 'ERROR: El telfono celular debe empezar con 09 y tener 10 dgitos.';
-        RETURN;
+        RETURN 3;
     END
 
     /* 2c. Email: Validacin bsica de formato (debe contener '@' y '.'). */
     IF @emailRepresentante NOT LIKE '%_@__%.__%'
     BEGIN
         SET @MensajeSalida = 'ERROR: El formato del correo electrnico no es vlido.';
-        RETURN;
+        RETURN 4;
     END
 
     /* 3. VALIDACIONES DE NEGOCIO (Integridad de Datos) */
@@ -73,14 +73,14 @@ BEGIN
     IF NOT EXISTS (SELECT 1 FROM Configuracion.Parroquia WHERE idParroquia = @idParroquiaPertenece)
     BEGIN
         SET @MensajeSalida = 'ERROR: La parroquia seleccionada no existe en el sistema.';
-        RETURN;
+        RETURN 5;
     END
 
     /* 3b. Duplicidad de Cdula: Asegura que la cdula no est registrada previamente. */
     IF EXISTS (SELECT 1 FROM Proceso.Catequizado WHERE cedulaIdentidad = @cedulaIdentidad)
     BEGIN
         SET @MensajeSalida = 'ERROR: El estudiante con cdula ' + @cedulaIdentidad + ' ya se encuentra registrado.';
-        RETURN;
+        RETURN 6;
     END
 
     /* 4. BLOQUE DE INSERCIN */
@@ -108,6 +108,7 @@ BEGIN
     BEGIN CATCH
         /* En caso de un error inesperado (ej. fallo de constraint), captura el error. */
         SET @MensajeSalida = 'ERROR CRTICO SQL: ' + ERROR_MESSAGE();
+        RETURN 50;
     END CATCH
 END
 GO
@@ -160,14 +161,14 @@ BEGIN
     IF ISNULL(LTRIM(RTRIM(@cedulaIdentidad)), '') = ''
     BEGIN
         SET @MensajeSalida = 'ERROR: El campo cdula de identidad es obligatorio. Por favor, complete la informacin faltante.';
-        RETURN;
+        RETURN 1;
     END
 
     /* 2. Validacin de formato de cdula (10 dgitos numricos). */
     IF LEN(@cedulaIdentidad) != 10 OR @cedulaIdentidad LIKE '%[^0-9]%'
     BEGIN
         SET @MensajeSalida = 'ERROR: La cdula debe tener 10 dgitos numricos.';
-        RETURN;
+        RETURN 2;
     END
     
     /* 3. Validacin de existencia: Verifica que el catequizado exista. */
@@ -175,7 +176,7 @@ BEGIN
     BEGIN
         /* Si no existe, asigna el error y detiene la ejecucin. */
         SET @MensajeSalida = 'ERROR: No existe ningn catequizado registrado con la cdula ' + @cedulaIdentidad;
-        RETURN;
+        RETURN 7;
     END
     
     /* Si pasa todas las validaciones, selecciona y devuelve la fila completa del catequizado. */
@@ -240,7 +241,7 @@ BEGIN
        ISNULL(LTRIM(RTRIM(@parroquiaBautismo)), '') = ''
     BEGIN
         SET @MensajeSalida = 'ERROR: Todos los campos son obligatorios. Por favor, complete la informacin faltante.';
-        RETURN;
+        RETURN 1;
     END
 
     /* 2. VALIDACIONES DE FORMATO */
@@ -248,28 +249,28 @@ BEGIN
     IF LEN(@cedulaIdentidadActualizar) != 10 OR @cedulaIdentidadActualizar LIKE '%[^0-9]%'
     BEGIN
         SET @MensajeSalida = 'ERROR: La cdula a actualizar debe tener 10 dgitos numricos.';
-        RETURN;
+        RETURN 2;
     END
 
     /* 2b. Cdula Nueva: Valida el formato de la nueva cdula. */
     IF LEN(@cedulaIdentidad) != 10 OR @cedulaIdentidad LIKE '%[^0-9]%'
     BEGIN
         SET @MensajeSalida = 'ERROR: La cdula debe tener 10 dgitos numricos.';
-        RETURN;
+        RETURN 2;
     END
 
     /* 2c. Telfono: Valida el formato del nuevo telfono. */
     IF LEN(@telefonoRepresentante) != 10 OR @telefonoRepresentante NOT LIKE '09%' OR @telefonoRepresentante LIKE '%[^0-9]%'
     BEGIN
         SET @MensajeSalida = 'ERROR: El telfono celular debe empezar con 09 y tener 10 dgitos.';
-        RETURN;
+        RETURN 3;
     END
 
     /* 2d. Email: Valida el formato del nuevo email. */
     IF @emailRepresentante NOT LIKE '%_@__%.__%'
     BEGIN
         SET @MensajeSalida = 'ERROR: El formato del correo electrnico no es vlido.';
-        RETURN;
+        RETURN 4;
     END
 
     /* 3. VALIDACIN DE NEGOCIO (Integridad) */
@@ -286,7 +287,7 @@ BEGIN
     IF @idCatequizado IS NULL
     BEGIN
         SET @MensajeSalida = 'ERROR: No se encontr ningn catequizado con la cdula ' + @cedulaIdentidadActualizar;
-        RETURN;
+        RETURN 7;
     END
     
     /* 3c. Duplicidad: Verifica que la *nueva* cdula no est en uso por OTRO registro (excluyendo el actual). */
@@ -295,14 +296,14 @@ BEGIN
                  AND idCatequizado != @idCatequizado)
     BEGIN
         SET @MensajeSalida = 'ERROR: La cdula ya est registrada con otro estudiante.';
-        RETURN;
+        RETURN 6;
     END
 
     /* 3d. Integridad: Valida que la parroquia exista. */
     IF NOT EXISTS (SELECT 1 FROM Configuracion.Parroquia WHERE idParroquia = @idParroquiaPertenece)
     BEGIN
         SET @MensajeSalida = 'ERROR: La parroquia seleccionada no existe en el sistema.';
-        RETURN;
+        RETURN 5;
     END
 
     /* 4. BLOQUE DE ACTUALIZACIN */
@@ -331,6 +332,7 @@ BEGIN
     BEGIN CATCH
         /* Captura errores en caso de fallo del UPDATE. */
         SET @MensajeSalida = 'ERROR CRTICO SQL: ' + ERROR_MESSAGE();
+        RETURN 50;
     END CATCH
 END
 GO
@@ -352,21 +354,21 @@ BEGIN
     IF ISNULL(LTRIM(RTRIM(@cedulaIdentidad)), '') = ''
     BEGIN
         SET @MensajeSalida = 'ERROR: El campo cdula de identidad es obligatorio. Por favor, complete la informacin faltante.';
-        RETURN;
+        RETURN 1;
     END
 
     /* 2. Validacin de formato de cdula (10 dgitos numricos). */
     IF LEN(@cedulaIdentidad) != 10 OR @cedulaIdentidad LIKE '%[^0-9]%'
     BEGIN
         SET @MensajeSalida = 'ERROR: La cdula debe tener 10 dgitos numricos.';
-        RETURN;
+        RETURN 2;
     END
     
     /* 3. Validacin de existencia (no se puede borrar lo que no existe). */
     IF NOT EXISTS (SELECT 1 FROM Proceso.Catequizado WHERE cedulaIdentidad = @cedulaIdentidad)
     BEGIN
         SET @MensajeSalida = 'ERROR: No existe ningn catequizado registrado con la cdula ' + @cedulaIdentidad;
-        RETURN;
+        RETURN 7;
     END
     
     /* 4. BLOQUE DE ELIMINACIN */
@@ -381,6 +383,381 @@ BEGIN
     BEGIN CATCH
         /* Captura errores, especialmente de llaves forneas (FK). */
         SET @MensajeSalida = 'ERROR SQL: No se pudo eliminar. Es posible que tenga registros asociados (inscripciones, etc.). Detalles: ' + ERROR_MESSAGE();
+        RETURN 50;
     END CATCH
 END
+GO
+
+/* --------------------------------------------------------------------------
+-- Tipo de tabla para el Registro Masivo de Catequizados
+-- Cada fila lleva el nmero de fila del archivo de origen para poder
+-- devolver el resultado individual al cliente.
+--------------------------------------------------------------------------
+*/
+IF TYPE_ID('Proceso.TipoCatequizadoLote') IS NULL
+    CREATE TYPE Proceso.TipoCatequizadoLote AS TABLE (
+        numeroFila INTEGER NOT NULL PRIMARY KEY,
+        idParroquiaPertenece INTEGER,
+        nombres VARCHAR(255),
+        apellidos VARCHAR(255),
+        cedulaIdentidad VARCHAR(10),
+        fechaNacimiento DATE,
+        direccionDomicilio VARCHAR(255),
+        nombreRepresentante VARCHAR(255),
+        telefonoRepresentante VARCHAR(255),
+        emailRepresentante VARCHAR(255),
+        fechaBautismo DATE,
+        parroquiaBautismo VARCHAR(255),
+        INDEX IX_TipoCatequizadoLote_cedula (cedulaIdentidad)
+    );
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Registrar Catequizados por Lotes
+-- Aplica las mismas validaciones que sp_RegistrarCatequizado, pero sobre
+-- todo el lote a la vez, e inserta las filas vlidas en una sola sentencia.
+-- Devuelve un resultado (OK/ERROR) por cada fila recibida.
+-- La transaccin la confirma el cliente (un COMMIT por lote).
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_RegistrarCatequizadosLote
+    @lote Proceso.TipoCatequizadoLote READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    /* Resultado por fila; una fila con mensaje ya no se vuelve a validar ni se inserta.
+       idCatequizado es el ID asignado a las filas insertadas (el cliente lo usa para la auditora). */
+    DECLARE @resultado TABLE (
+        numeroFila INTEGER NOT NULL PRIMARY KEY,
+        mensajeResultado VARCHAR(500) NOT NULL,
+        idCatequizado INTEGER NULL
+    );
+
+    /* 1. VALIDACIN DE CAMPOS OBLIGATORIOS */
+    INSERT INTO @resultado (numeroFila, mensajeResultado)
+    SELECT numeroFila, 'ERROR: Todos los campos son obligatorios. Por favor, complete la informacin faltante.'
+    FROM @lote
+    WHERE ISNULL(LTRIM(RTRIM(nombres)), '') = '' OR
+          ISNULL(LTRIM(RTRIM(apellidos)), '') = '' OR
+          ISNULL(LTRIM(RTRIM(cedulaIdentidad)), '') = '' OR
+          fechaNacimiento IS NULL OR
+          ISNULL(LTRIM(RTRIM(direccionDomicilio)), '') = '' OR
+          ISNULL(LTRIM(RTRIM(nombreRepresentante)), '') = '' OR
+          ISNULL(LTRIM(RTRIM(telefonoRepresentante)), '') = '' OR
+          ISNULL(LTRIM(RTRIM(emailRepresentante)), '') = '' OR
+          fechaBautismo IS NULL OR
+          ISNULL(LTRIM(RTRIM(parroquiaBautismo)), '') = '';
+
+    /* 2. VALIDACIONES DE FORMATO */
+    /* 2a. Cdula: 10 caracteres numricos. */
+    INSERT INTO @resultado (numeroFila, mensajeResultado)
+    SELECT L.numeroFila, 'ERROR: La cdula debe tener 10 dgitos numricos.'
+    FROM @lote AS L
+    WHERE (LEN(L.cedulaIdentidad) != 10 OR L.cedulaIdentidad LIKE '%[^0-9]%')
+      AND NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+
+    /* 2b. Telfono: celular de Ecuador (10 dgitos, empieza con '09'). */
+    INSERT INTO @resultado (numeroFila, mensajeResultado)
+    SELECT L.numeroFila, 'ERROR: El telfono celular debe empezar con 09 y tener 10 dgitos.'
+    FROM @lote AS L
+    WHERE (LEN(L.telefonoRepresentante) != 10 OR L.telefonoRepresentante NOT LIKE '09%' OR L.telefonoRepresentante LIKE '%[^0-9]%')
+      AND NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+
+    /* 2c. Email: validacin bsica de formato. */
+    INSERT INTO @resultado (numeroFila, mensajeResultado)
+    SELECT L.numeroFila, 'ERROR: El formato del correo electrnico no es vlido.'
+    FROM @lote AS L
+    WHERE L.emailRepresentante NOT LIKE '%_@__%.__%'
+      AND NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+
+    /* 3. VALIDACIONES DE NEGOCIO */
+    /* 3a. Parroquia existente. */
+    INSERT INTO @resultado (numeroFila, mensajeResultado)
+    SELECT L.numeroFila, 'ERROR: La parroquia seleccionada no existe en el sistema.'
+    FROM @lote AS L
+    WHERE NOT EXISTS (SELECT 1 FROM Configuracion.Parroquia WHERE idParroquia = L.idParroquiaPertenece)
+      AND NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+
+    /* 3b. Duplicidad contra la tabla: la cdula ya est registrada. */
+    INSERT INTO @resultado (numeroFila, mensajeResultado)
+    SELECT L.numeroFila, 'ERROR: El estudiante con cdula ' + L.cedulaIdentidad + ' ya se encuentra registrado.'
+    FROM @lote AS L
+    WHERE EXISTS (SELECT 1 FROM Proceso.Catequizado AS C WHERE C.cedulaIdentidad = L.cedulaIdentidad)
+      AND NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+
+    /* 3c. Duplicidad dentro del lote: solo se acepta la primera aparicin de cada cdula. */
+    INSERT INTO @resultado (numeroFila, mensajeResultado)
+    SELECT L.numeroFila, 'ERROR: La cdula ' + L.cedulaIdentidad + ' est repetida en el archivo.'
+    FROM @lote AS L
+    WHERE EXISTS (SELECT 1 FROM @lote AS O
+                  WHERE O.cedulaIdentidad = L.cedulaIdentidad
+                    AND O.numeroFila < L.numeroFila
+                    AND NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = O.numeroFila))
+      AND NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+
+    /* 4. BLOQUE DE INSERCIN (una sola sentencia para todas las filas vlidas) */
+    BEGIN TRY
+        /* Bloquea el rango para que dos lotes concurrentes no calculen los mismos IDs. */
+        DECLARE @UltimoID INTEGER;
+        SELECT @UltimoID = ISNULL(MAX(idCatequizado), 0) FROM Proceso.Catequizado WITH (UPDLOCK, HOLDLOCK);
+
+        DECLARE @insertados TABLE (idCatequizado INTEGER NOT NULL, cedulaIdentidad VARCHAR(10) NOT NULL);
+
+        INSERT INTO Proceso.Catequizado (
+            idCatequizado, idParroquiaPertenece, nombres, apellidos, cedulaIdentidad,
+            fechaNacimiento, direccionDomicilio, nombreRepresentante, telefonoRepresentante,
+            emailRepresentante, fechaBautismo, parroquiaBautismo
+        )
+        OUTPUT inserted.idCatequizado, inserted.cedulaIdentidad INTO @insertados
+        SELECT
+            @UltimoID + ROW_NUMBER() OVER (ORDER BY L.numeroFila), L.idParroquiaPertenece, TRIM(L.nombres), TRIM(L.apellidos),
+            L.cedulaIdentidad, L.fechaNacimiento, TRIM(L.direccionDomicilio), TRIM(L.nombreRepresentante),
+            TRIM(L.telefonoRepresentante), LOWER(TRIM(L.emailRepresentante)), L.fechaBautismo, TRIM(L.parroquiaBautismo)
+        FROM @lote AS L
+        WHERE NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+
+        INSERT INTO @resultado (numeroFila, mensajeResultado, idCatequizado)
+        SELECT L.numeroFila, 'OK: Registro exitoso. Cdigo asignado: ' + CAST(I.idCatequizado AS VARCHAR), I.idCatequizado
+        FROM @lote AS L
+        INNER JOIN @insertados AS I ON I.cedulaIdentidad = L.cedulaIdentidad
+        WHERE NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+    END TRY
+    BEGIN CATCH
+        /* Si la insercin falla no se inserta ninguna fila: todas las pendientes se marcan con el error. */
+        INSERT INTO @resultado (numeroFila, mensajeResultado)
+        SELECT L.numeroFila, 'ERROR CRTICO SQL: ' + ERROR_MESSAGE()
+        FROM @lote AS L
+        WHERE NOT EXISTS (SELECT 1 FROM @resultado AS R WHERE R.numeroFila = L.numeroFila);
+    END CATCH
+
+    /* Devuelve el resultado de cada fila del lote. */
+    SELECT numeroFila, mensajeResultado, idCatequizado FROM @resultado ORDER BY numeroFila;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- ndice de apoyo para el listado paginado filtrado por parroquia
+-- Permite buscar directamente los catequizados de una parroquia en orden de ID.
+--------------------------------------------------------------------------
+*/
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Catequizado_Parroquia_Id' AND object_id = OBJECT_ID('Proceso.Catequizado'))
+    CREATE INDEX IX_Catequizado_Parroquia_Id ON Proceso.Catequizado (idParroquiaPertenece, idCatequizado);
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Listar Catequizados por Pginas
+-- Devuelve una pgina de catequizados ordenada por ID, empezando despus de
+-- @desdeId (paginacin por clave: no usa OFFSET, el costo de cada pgina
+-- no depende de cuntas pginas se hayan ledo antes).
+-- @idParroquia es opcional: si es NULL se listan todas las parroquias.
+-- Con @incluirNombreParroquia = 0 la columna Nombre_Parroquia viene en NULL
+-- y no se hace el JOIN con Configuracion.Parroquia: el cliente que tiene
+-- los catlogos en memoria resuelve el nombre por su cuenta.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ListarCatequizadosPaginado
+    @desdeId INTEGER = 0,
+    @tamanioPagina INTEGER = 500,
+    @idParroquia INTEGER = NULL,
+    @incluirNombreParroquia BIT = 1
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    /* Limita el tamao de pgina a un rango razonable. */
+    IF @desdeId IS NULL SET @desdeId = 0;
+    IF @tamanioPagina IS NULL OR @tamanioPagina < 1 SET @tamanioPagina = 500;
+    IF @tamanioPagina > 5000 SET @tamanioPagina = 5000;
+
+    /* Mismas columnas (y en el mismo orden) que sp_BuscarCatequizadoPorCedula: el cliente las lee por posicin. */
+    SELECT TOP (@tamanioPagina)
+        idCatequizado AS ID_Catequizado,
+        idParroquiaPertenece AS ID_Parroquia,
+        CPA.nombreParroquia AS Nombre_Parroquia,
+        nombres AS Nombres,
+        apellidos AS Apellidos,
+        cedulaIdentidad AS Cedula,
+        fechaNacimiento AS Fecha_Nacimiento,
+        direccionDomicilio AS Direccion,
+        nombreRepresentante AS Nombre_Representante,
+        telefonoRepresentante AS Telefono_Representante,
+        emailRepresentante AS Email_Representante,
+        fechaBautismo AS Fecha_Bautismo,
+        parroquiaBautismo AS Parroquia_Bautismo
+    FROM 
+        Proceso.Catequizado
+    /* Con @incluirNombreParroquia = 0 la condicin es falsa de antemano y el plan (recompilado) no lee la tabla. */
+    LEFT JOIN Configuracion.Parroquia AS CPA ON @incluirNombreParroquia = 1 AND CPA.idParroquia = idParroquiaPertenece
+    WHERE 
+        idCatequizado > @desdeId
+        AND (@idParroquia IS NULL OR idParroquiaPertenece = @idParroquia)
+    ORDER BY 
+        idCatequizado
+    /* Recompila para que el filtro opcional use el ndice adecuado en cada caso. */
+    OPTION (RECOMPILE);
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Contar Catequizados por Parroquia
+-- Devuelve cuntos catequizados tiene cada parroquia (solo las que tienen
+-- alguno), de mayor a menor. La exportacin lo usa para repartir el trabajo
+-- por parroquia empezando por las ms grandes. Se resuelve con el ndice
+-- IX_Catequizado_Parroquia_Id sin leer la tabla completa.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ContarCatequizadosPorParroquia
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT 
+        CPA.idParroquia AS ID_Parroquia,
+        CPA.nombreParroquia AS Nombre_Parroquia,
+        T.totalCatequizados AS Total_Catequizados
+    FROM 
+        (SELECT idParroquiaPertenece, COUNT(*) AS totalCatequizados
+         FROM Proceso.Catequizado
+         GROUP BY idParroquiaPertenece) AS T
+    INNER JOIN Configuracion.Parroquia AS CPA ON CPA.idParroquia = T.idParroquiaPertenece
+    ORDER BY 
+        T.totalCatequizados DESC, CPA.idParroquia;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- Protocolo de llamada con cdigo de resultado
+-- Los procedimientos CRUD devuelven con RETURN un cdigo numrico adems del
+-- mensaje en @MensajeSalida:
+--    0 = OK                          5 = Parroquia inexistente
+--    1 = Campos obligatorios         6 = Cdula ya registrada
+--    2 = Formato de cdula           7 = Catequizado no encontrado
+--    3 = Formato de telfono        50 = Error de SQL Server
+--    4 = Formato de email
+-- Los siguientes procedimientos los llaman y devuelven una sola fila
+-- (codigo, mensaje), de modo que el cliente hace una nica llamada RPC
+-- parametrizada (que el driver prepara una vez por conexin), sin el lote
+-- DECLARE / OUTPUT / SELECT ni un conjunto de resultados adicional.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_RegistrarCatequizadoConCodigo
+    @idParroquiaPertenece INTEGER,
+    @nombres VARCHAR(255),
+    @apellidos VARCHAR(255),
+    @cedulaIdentidad VARCHAR(10),
+    @fechaNacimiento DATE,
+    @direccionDomicilio VARCHAR(255),
+    @nombreRepresentante VARCHAR(255),
+    @telefonoRepresentante VARCHAR(255),
+    @emailRepresentante VARCHAR(255),
+    @fechaBautismo DATE,
+    @parroquiaBautismo VARCHAR(255)
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @codigo INTEGER, @mensaje VARCHAR(500);
+    EXEC @codigo = Proceso.sp_RegistrarCatequizado
+        @idParroquiaPertenece, @nombres, @apellidos, @cedulaIdentidad, @fechaNacimiento,
+        @direccionDomicilio, @nombreRepresentante, @telefonoRepresentante, @emailRepresentante,
+        @fechaBautismo, @parroquiaBautismo, @mensaje OUTPUT;
+
+    /* El registro adems devuelve el ID asignado (NULL si no se registr), buscado por la cdula nica. */
+    SELECT @codigo AS codigo, @mensaje AS mensaje,
+           (SELECT idCatequizado FROM Proceso.Catequizado
+            WHERE @codigo = 0 AND cedulaIdentidad = @cedulaIdentidad) AS idCatequizado;
+    RETURN @codigo;
+END
+GO
+
+CREATE OR ALTER PROCEDURE Proceso.sp_ActualizarCatequizadoConCodigo
+    @cedulaIdentidadActualizar VARCHAR(10),
+    @idParroquiaPertenece INTEGER,
+    @nombres VARCHAR(255),
+    @apellidos VARCHAR(255),
+    @cedulaIdentidad VARCHAR(10),
+    @fechaNacimiento DATE,
+    @direccionDomicilio VARCHAR(255),
+    @nombreRepresentante VARCHAR(255),
+    @telefonoRepresentante VARCHAR(255),
+    @emailRepresentante VARCHAR(255),
+    @fechaBautismo DATE,
+    @parroquiaBautismo VARCHAR(255)
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @codigo INTEGER, @mensaje VARCHAR(500);
+    EXEC @codigo = Proceso.sp_ActualizarCatequizado
+        @cedulaIdentidadActualizar, @idParroquiaPertenece, @nombres, @apellidos, @cedulaIdentidad,
+        @fechaNacimiento, @direccionDomicilio, @nombreRepresentante, @telefonoRepresentante,
+        @emailRepresentante, @fechaBautismo, @parroquiaBautismo, @mensaje OUTPUT;
+
+    SELECT @codigo AS codigo, @mensaje AS mensaje;
+    RETURN @codigo;
+END
+GO
+
+CREATE OR ALTER PROCEDURE Proceso.sp_EliminarCatequizadoPorCedulaConCodigo
+    @cedulaIdentidad VARCHAR(10)
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @codigo INTEGER, @mensaje VARCHAR(500);
+    EXEC @codigo = Proceso.sp_EliminarCatequizadoPorCedula @cedulaIdentidad, @mensaje OUTPUT;
+
+    SELECT @codigo AS codigo, @mensaje AS mensaje;
+    RETURN @codigo;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Buscar un Catequizado por Cdula (con cdigo de resultado)
+-- Devuelve siempre una fila: (codigo, mensaje) seguidos de las mismas
+-- columnas que sp_BuscarCatequizadoPorCedula, en NULL si no se encontr.
+-- As el cliente ya no distingue una fila de datos de una de mensaje por su
+-- nmero de columnas.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_BuscarCatequizadoPorCedulaConCodigo
+    @cedulaIdentidad VARCHAR(10)
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @codigo INTEGER = 0, @mensaje VARCHAR(500) = 'OK: Catequizado encontrado.';
+
+    /* Mismas validaciones que sp_BuscarCatequizadoPorCedula. */
+    IF ISNULL(LTRIM(RTRIM(@cedulaIdentidad)), '') = ''
+        SELECT @codigo = 1, @mensaje = 'ERROR: El campo cdula de identidad es obligatorio. Por favor, complete la informacin faltante.';
+    ELSE IF LEN(@cedulaIdentidad) != 10 OR @cedulaIdentidad LIKE '%[^0-9]%'
+        SELECT @codigo = 2, @mensaje = 'ERROR: La cdula debe tener 10 dgitos numricos.';
+    ELSE IF NOT EXISTS (SELECT 1 FROM Proceso.Catequizado WHERE cedulaIdentidad = @cedulaIdentidad)
+        SELECT @codigo = 7, @mensaje = 'ERROR: No existe ningn catequizado registrado con la cdula ' + @cedulaIdentidad;
+
+    SELECT 
+        @codigo AS codigo,
+        @mensaje AS mensaje,
+        C.idCatequizado AS ID_Catequizado,
+        C.idParroquiaPertenece AS ID_Parroquia,
+        CPA.nombreParroquia AS Nombre_Parroquia,
+        C.nombres AS Nombres,
+        C.apellidos AS Apellidos,
+        C.cedulaIdentidad AS Cedula,
+        C.fechaNacimiento AS Fecha_Nacimiento,
+        C.direccionDomicilio AS Direccion,
+        C.nombreRepresentante AS Nombre_Representante,
+        C.telefonoRepresentante AS Telefono_Representante,
+        C.emailRepresentante AS Email_Representante,
+        C.fechaBautismo AS Fecha_Bautismo,
+        C.parroquiaBautismo AS Parroquia_Bautismo
+    FROM 
+        (SELECT 1 AS fila) AS R
+    LEFT JOIN Proceso.Catequizado AS C ON @codigo = 0 AND C.cedulaIdentidad = @cedulaIdentidad
+    LEFT JOIN Configuracion.Parroquia AS CPA ON CPA.idParroquia = C.idParroquiaPertenece;
+
+    RETURN @codigo;
+END
 GO
\ No newline at end of file
@@ -0,0 +1,138 @@
+/* Establece el contexto de la base de datos a 'CATEQUESIS' */
+USE CATEQUESIS
+GO
+
+/* --------------------------------------------------------------------------
+-- Versin de los Catlogos
+-- Una sola fila con un nmero que crece con cada cambio en Parroquia,
+-- Nivel, Sacramento o Rol. El cliente guarda los catlogos en memoria (y en
+-- un archivo local) y solo los vuelve a leer cuando este nmero cambia:
+-- comprobarlo es una consulta de una fila.
+--------------------------------------------------------------------------
+*/
+IF OBJECT_ID('Configuracion.VersionCatalogo') IS NULL
+    CREATE TABLE Configuracion.VersionCatalogo (
+        idVersion TINYINT NOT NULL,
+        version BIGINT NOT NULL,
+        fechaCambio DATETIME2(0) NOT NULL,
+        CONSTRAINT VersionCatalogo_PK PRIMARY KEY (idVersion),
+        CONSTRAINT CK_VersionCatalogo_idVersion CHECK (idVersion = 1)
+    );
+GO
+
+IF NOT EXISTS (SELECT 1 FROM Configuracion.VersionCatalogo)
+    INSERT INTO Configuracion.VersionCatalogo (idVersion, version, fechaCambio) VALUES (1, 1, SYSDATETIME());
+GO
+
+/* --------------------------------------------------------------------------
+-- Triggers de los Catlogos
+-- Cualquier INSERT, UPDATE o DELETE en un catlogo incrementa la versin
+-- (una vez por sentencia, no por fila).
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER TRIGGER Configuracion.tr_Parroquia_VersionCatalogo
+ON Configuracion.Parroquia
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF NOT EXISTS (SELECT 1 FROM inserted) AND NOT EXISTS (SELECT 1 FROM deleted)
+        RETURN;
+    UPDATE Configuracion.VersionCatalogo SET version = version + 1, fechaCambio = SYSDATETIME() WHERE idVersion = 1;
+END
+GO
+
+CREATE OR ALTER TRIGGER Configuracion.tr_Nivel_VersionCatalogo
+ON Configuracion.Nivel
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF NOT EXISTS (SELECT 1 FROM inserted) AND NOT EXISTS (SELECT 1 FROM deleted)
+        RETURN;
+    UPDATE Configuracion.VersionCatalogo SET version = version + 1, fechaCambio = SYSDATETIME() WHERE idVersion = 1;
+END
+GO
+
+CREATE OR ALTER TRIGGER Configuracion.tr_Sacramento_VersionCatalogo
+ON Configuracion.Sacramento
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF NOT EXISTS (SELECT 1 FROM inserted) AND NOT EXISTS (SELECT 1 FROM deleted)
+        RETURN;
+    UPDATE Configuracion.VersionCatalogo SET version = version + 1, fechaCambio = SYSDATETIME() WHERE idVersion = 1;
+END
+GO
+
+CREATE OR ALTER TRIGGER Configuracion.tr_Rol_VersionCatalogo
+ON Configuracion.Rol
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF NOT EXISTS (SELECT 1 FROM inserted) AND NOT EXISTS (SELECT 1 FROM deleted)
+        RETURN;
+    UPDATE Configuracion.VersionCatalogo SET version = version + 1, fechaCambio = SYSDATETIME() WHERE idVersion = 1;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Consultar la Versin de los Catlogos
+-- Devuelve una fila: (Version, Fecha_Cambio).
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Configuracion.sp_VersionCatalogos
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT version AS Version, fechaCambio AS Fecha_Cambio
+    FROM Configuracion.VersionCatalogo
+    WHERE idVersion = 1;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Listar los Catlogos
+-- Devuelve cinco conjuntos de resultados en una sola llamada: la versin
+-- (igual que sp_VersionCatalogos) y las filas de Parroquia, Nivel,
+-- Sacramento y Rol, ordenadas por ID. La versin se lee primero: si un
+-- catlogo cambia mientras se leen los dems, el cliente guarda una versin
+-- anterior a los datos y en la siguiente comprobacin los vuelve a leer.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Configuracion.sp_ListarCatalogos
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT version AS Version, fechaCambio AS Fecha_Cambio
+    FROM Configuracion.VersionCatalogo
+    WHERE idVersion = 1;
+
+    SELECT idParroquia AS ID_Parroquia, nombreParroquia AS Nombre_Parroquia, direccion AS Direccion,
+           telefonoContacto AS Telefono_Contacto, emailContacto AS Email_Contacto
+    FROM Configuracion.Parroquia
+    ORDER BY idParroquia;
+
+    SELECT idNivel AS ID_Nivel, nombreNivel AS Nombre_Nivel, descripcionNivel AS Descripcion_Nivel,
+           ordenProgresion AS Orden_Progresion, idSacramentoOtorga AS ID_Sacramento_Otorga
+    FROM Configuracion.Nivel
+    ORDER BY idNivel;
+
+    SELECT idSacramento AS ID_Sacramento, nombreSacramento AS Nombre_Sacramento,
+           descripcionSacramento AS Descripcion_Sacramento
+    FROM Configuracion.Sacramento
+    ORDER BY idSacramento;
+
+    SELECT idRol AS ID_Rol, nombreRol AS Nombre_Rol, descripcionPermisos AS Descripcion_Permisos
+    FROM Configuracion.Rol
+    ORDER BY idRol;
+END
+GO
\ No newline at end of file
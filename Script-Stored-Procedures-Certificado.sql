@@ -0,0 +1,231 @@
+/* Establece el contexto de la base de datos a 'CATEQUESIS' */
+USE CATEQUESIS
+GO
+
+/* --------------------------------------------------------------------------
+-- Tabla de Resumen por Inscripcin
+-- Acumulados de notas y asistencia de cada inscripcin (suma y cantidad),
+-- mantenidos por los triggers de Proceso.Calificacion y Proceso.Asistencia.
+-- El promedio y la tasa de asistencia se calculan a partir de ellos, sin
+-- recorrer las tablas de notas y asistencias.
+--------------------------------------------------------------------------
+*/
+IF OBJECT_ID('Proceso.ResumenInscripcion') IS NULL
+    CREATE TABLE Proceso.ResumenInscripcion (
+        idInscripcion INTEGER NOT NULL,
+        sumaNotas DECIMAL(12,2) NOT NULL,
+        numeroNotas INTEGER NOT NULL,
+        clasesPresente INTEGER NOT NULL,
+        clasesAusente INTEGER NOT NULL,
+        clasesJustificado INTEGER NOT NULL,
+        fechaActualizacion DATETIME NOT NULL,
+        CONSTRAINT ResumenInscripcion_PK PRIMARY KEY (idInscripcion),
+        /* Al eliminar una inscripcin su resumen se elimina con ella. */
+        CONSTRAINT ResumenInscripcion_Inscripcion_FK FOREIGN KEY (idInscripcion) REFERENCES Proceso.Inscripcion (idInscripcion) ON DELETE CASCADE
+    );
+GO
+
+/* --------------------------------------------------------------------------
+-- Trigger de Calificaciones
+-- Suma las notas insertadas y resta las eliminadas (una actualizacin es
+-- ambas cosas), agrupadas por inscripcin, en una sola sentencia.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER TRIGGER Proceso.tr_Calificacion_Resumen
+ON Proceso.Calificacion
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    MERGE Proceso.ResumenInscripcion WITH (HOLDLOCK) AS R
+    USING (
+        SELECT idInscripcion, SUM(sumaNotas) AS sumaNotas, SUM(numeroNotas) AS numeroNotas
+        FROM (
+            SELECT idInscripcionAcumula AS idInscripcion, notaObtenida AS sumaNotas, 1 AS numeroNotas FROM inserted
+            UNION ALL
+            SELECT idInscripcionAcumula, -notaObtenida, -1 FROM deleted
+        ) AS C
+        GROUP BY idInscripcion
+    ) AS D ON R.idInscripcion = D.idInscripcion
+    WHEN MATCHED THEN
+        UPDATE SET R.sumaNotas = R.sumaNotas + D.sumaNotas,
+                   R.numeroNotas = R.numeroNotas + D.numeroNotas,
+                   R.fechaActualizacion = GETDATE()
+    WHEN NOT MATCHED THEN
+        INSERT (idInscripcion, sumaNotas, numeroNotas, clasesPresente, clasesAusente, clasesJustificado, fechaActualizacion)
+        VALUES (D.idInscripcion, D.sumaNotas, D.numeroNotas, 0, 0, 0, GETDATE());
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- Trigger de Asistencias
+-- Mismo esquema que el de calificaciones, contando las clases por estado.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER TRIGGER Proceso.tr_Asistencia_Resumen
+ON Proceso.Asistencia
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    MERGE Proceso.ResumenInscripcion WITH (HOLDLOCK) AS R
+    USING (
+        SELECT idInscripcion,
+               SUM(CASE WHEN estadoAsistencia = 'Presente' THEN signo ELSE 0 END) AS clasesPresente,
+               SUM(CASE WHEN estadoAsistencia = 'Ausente' THEN signo ELSE 0 END) AS clasesAusente,
+               SUM(CASE WHEN estadoAsistencia = 'Justificado' THEN signo ELSE 0 END) AS clasesJustificado
+        FROM (
+            SELECT idInscripcionRegistra AS idInscripcion, estadoAsistencia, 1 AS signo FROM inserted
+            UNION ALL
+            SELECT idInscripcionRegistra, estadoAsistencia, -1 FROM deleted
+        ) AS C
+        GROUP BY idInscripcion
+    ) AS D ON R.idInscripcion = D.idInscripcion
+    WHEN MATCHED THEN
+        UPDATE SET R.clasesPresente = R.clasesPresente + D.clasesPresente,
+                   R.clasesAusente = R.clasesAusente + D.clasesAusente,
+                   R.clasesJustificado = R.clasesJustificado + D.clasesJustificado,
+                   R.fechaActualizacion = GETDATE()
+    WHEN NOT MATCHED THEN
+        INSERT (idInscripcion, sumaNotas, numeroNotas, clasesPresente, clasesAusente, clasesJustificado, fechaActualizacion)
+        VALUES (D.idInscripcion, 0, 0, D.clasesPresente, D.clasesAusente, D.clasesJustificado, GETDATE());
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Reconstruir el Resumen por Inscripcin
+-- Recalcula los acumulados desde Calificacion y Asistencia (recorrido
+-- completo) y devuelve las inscripciones cuyo resumen no coincida.
+-- Con @soloVerificar = 1 solo informa las diferencias; si no, las corrige.
+-- Las notas y asistencias quedan bloqueadas para escritura hasta que el
+-- cliente confirme, para que los triggers no cambien el resumen a la vez.
+-- La transaccin la confirma el cliente.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ReconstruirResumenInscripcion
+    @soloVerificar BIT = 0
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @calculado TABLE (
+        idInscripcion INTEGER NOT NULL PRIMARY KEY,
+        sumaNotas DECIMAL(12,2) NOT NULL,
+        numeroNotas INTEGER NOT NULL,
+        clasesPresente INTEGER NOT NULL,
+        clasesAusente INTEGER NOT NULL,
+        clasesJustificado INTEGER NOT NULL
+    );
+
+    INSERT INTO @calculado (idInscripcion, sumaNotas, numeroNotas, clasesPresente, clasesAusente, clasesJustificado)
+    SELECT
+        I.idInscripcion,
+        ISNULL(N.sumaNotas, 0), ISNULL(N.numeroNotas, 0),
+        ISNULL(A.clasesPresente, 0), ISNULL(A.clasesAusente, 0), ISNULL(A.clasesJustificado, 0)
+    FROM Proceso.Inscripcion AS I
+    LEFT JOIN (
+        SELECT idInscripcionAcumula, SUM(notaObtenida) AS sumaNotas, COUNT(*) AS numeroNotas
+        FROM Proceso.Calificacion WITH (TABLOCK, HOLDLOCK)
+        GROUP BY idInscripcionAcumula
+    ) AS N ON N.idInscripcionAcumula = I.idInscripcion
+    LEFT JOIN (
+        SELECT idInscripcionRegistra,
+               SUM(CASE WHEN estadoAsistencia = 'Presente' THEN 1 ELSE 0 END) AS clasesPresente,
+               SUM(CASE WHEN estadoAsistencia = 'Ausente' THEN 1 ELSE 0 END) AS clasesAusente,
+               SUM(CASE WHEN estadoAsistencia = 'Justificado' THEN 1 ELSE 0 END) AS clasesJustificado
+        FROM Proceso.Asistencia WITH (TABLOCK, HOLDLOCK)
+        GROUP BY idInscripcionRegistra
+    ) AS A ON A.idInscripcionRegistra = I.idInscripcion;
+
+    /* Diferencias entre lo guardado y lo recalculado (una inscripcin sin fila de resumen cuenta como ceros). */
+    SELECT
+        C.idInscripcion AS ID_Inscripcion,
+        ISNULL(R.sumaNotas, 0) AS Suma_Notas_Guardada, C.sumaNotas AS Suma_Notas_Calculada,
+        ISNULL(R.numeroNotas, 0) AS Numero_Notas_Guardado, C.numeroNotas AS Numero_Notas_Calculado,
+        ISNULL(R.clasesPresente + R.clasesAusente + R.clasesJustificado, 0) AS Clases_Guardadas,
+        C.clasesPresente + C.clasesAusente + C.clasesJustificado AS Clases_Calculadas
+    FROM @calculado AS C
+    LEFT JOIN Proceso.ResumenInscripcion AS R ON R.idInscripcion = C.idInscripcion
+    WHERE ISNULL(R.sumaNotas, 0) != C.sumaNotas
+       OR ISNULL(R.numeroNotas, 0) != C.numeroNotas
+       OR ISNULL(R.clasesPresente, 0) != C.clasesPresente
+       OR ISNULL(R.clasesAusente, 0) != C.clasesAusente
+       OR ISNULL(R.clasesJustificado, 0) != C.clasesJustificado
+    ORDER BY C.idInscripcion;
+
+    IF @soloVerificar = 1
+        RETURN 0;
+
+    MERGE Proceso.ResumenInscripcion WITH (HOLDLOCK) AS R
+    USING @calculado AS C ON R.idInscripcion = C.idInscripcion
+    WHEN MATCHED AND (R.sumaNotas != C.sumaNotas OR R.numeroNotas != C.numeroNotas OR
+                      R.clasesPresente != C.clasesPresente OR R.clasesAusente != C.clasesAusente OR
+                      R.clasesJustificado != C.clasesJustificado) THEN
+        UPDATE SET R.sumaNotas = C.sumaNotas, R.numeroNotas = C.numeroNotas,
+                   R.clasesPresente = C.clasesPresente, R.clasesAusente = C.clasesAusente,
+                   R.clasesJustificado = C.clasesJustificado, R.fechaActualizacion = GETDATE()
+    WHEN NOT MATCHED BY TARGET THEN
+        INSERT (idInscripcion, sumaNotas, numeroNotas, clasesPresente, clasesAusente, clasesJustificado, fechaActualizacion)
+        VALUES (C.idInscripcion, C.sumaNotas, C.numeroNotas, C.clasesPresente, C.clasesAusente, C.clasesJustificado, GETDATE());
+    RETURN 0;
+END
+GO
+
+/* Carga inicial del resumen con las notas y asistencias existentes. */
+BEGIN TRANSACTION;
+EXEC Proceso.sp_ReconstruirResumenInscripcion;
+COMMIT TRANSACTION;
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Consultar la Elegibilidad de Certificado
+-- Devuelve, por cada inscripcin no retirada del grupo o de la parroquia
+-- indicados, el promedio de notas y la tasa de asistencia tomados del
+-- resumen, y si cumple los mnimos para recibir el certificado.
+-- La tasa de asistencia cuenta las faltas justificadas como asistidas.
+-- El costo depende del nmero de inscripciones, no del de notas o clases.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ElegibilidadCertificado
+    @idGrupo INTEGER = NULL,
+    @idParroquia INTEGER = NULL,
+    @notaMinima DECIMAL(4,2) = 7.00,
+    @asistenciaMinima DECIMAL(5,4) = 0.8000
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT
+        I.idInscripcion AS ID_Inscripcion,
+        I.idGrupoPertenece AS ID_Grupo,
+        C.idCatequizado AS ID_Catequizado,
+        C.nombres AS Nombres,
+        C.apellidos AS Apellidos,
+        C.cedulaIdentidad AS Cedula,
+        ISNULL(R.numeroNotas, 0) AS Numero_Notas,
+        CAST(R.sumaNotas / NULLIF(R.numeroNotas, 0) AS DECIMAL(4,2)) AS Promedio,
+        ISNULL(R.clasesPresente + R.clasesAusente + R.clasesJustificado, 0) AS Clases_Registradas,
+        CAST(1.0 * (R.clasesPresente + R.clasesJustificado)
+             / NULLIF(R.clasesPresente + R.clasesAusente + R.clasesJustificado, 0) AS DECIMAL(5,4)) AS Tasa_Asistencia,
+        CAST(CASE WHEN CE.idCertificado IS NULL THEN 0 ELSE 1 END AS BIT) AS Tiene_Certificado,
+        CAST(CASE WHEN R.numeroNotas > 0
+                   AND R.sumaNotas / R.numeroNotas >= @notaMinima
+                   AND R.clasesPresente + R.clasesAusente + R.clasesJustificado > 0
+                   AND 1.0 * (R.clasesPresente + R.clasesJustificado)
+                       / (R.clasesPresente + R.clasesAusente + R.clasesJustificado) >= @asistenciaMinima
+                  THEN 1 ELSE 0 END AS BIT) AS Elegible
+    FROM Proceso.Inscripcion AS I
+    INNER JOIN Proceso.Grupo AS G ON G.idGrupo = I.idGrupoPertenece
+    INNER JOIN Proceso.Catequizado AS C ON C.idCatequizado = I.idCatequizadoRealiza
+    LEFT JOIN Proceso.ResumenInscripcion AS R ON R.idInscripcion = I.idInscripcion
+    LEFT JOIN Proceso.Certificado AS CE ON CE.idInscripcionValida = I.idInscripcion
+    WHERE I.estadoInscripcion != 'Retirado'
+      AND (@idGrupo IS NULL OR I.idGrupoPertenece = @idGrupo)
+      AND (@idParroquia IS NULL OR G.idParroquiaPertenece = @idParroquia)
+    ORDER BY I.idGrupoPertenece, C.apellidos, C.nombres
+    /* El filtro cambia segn se pida un grupo o una parroquia: cada llamada usa su propio plan. */
+    OPTION (RECOMPILE);
+END
+GO
\ No newline at end of file
@@ -0,0 +1,381 @@
+/* Establece el contexto de la base de datos a 'CATEQUESIS' */
+USE CATEQUESIS
+GO
+
+/* --------------------------------------------------------------------------
+-- Tabla de Cupos por Grupo
+-- Contador de inscripciones que ocupan cupo (todas salvo las 'Retirado') de
+-- cada grupo. sp_InscribirLote reserva cupos sobre este contador con una
+-- actualizacin condicional, en lugar de contar las inscripciones del grupo
+-- y luego insertar (dos inscripciones simultneas podan ver el mismo cupo
+-- libre). 'version' cambia con cada modificacin: el cliente la usa para no
+-- reemplazar un contador guardado por otro ms antiguo.
+--------------------------------------------------------------------------
+*/
+IF OBJECT_ID('Proceso.CupoGrupo') IS NULL
+    CREATE TABLE Proceso.CupoGrupo (
+        idGrupo INTEGER NOT NULL,
+        cuposOcupados INTEGER NOT NULL,
+        version ROWVERSION NOT NULL,
+        CONSTRAINT CupoGrupo_PK PRIMARY KEY (idGrupo),
+        CONSTRAINT CupoGrupo_Grupo_FK FOREIGN KEY (idGrupo) REFERENCES Proceso.Grupo (idGrupo) ON DELETE CASCADE,
+        CONSTRAINT CK_CupoGrupo_cuposOcupados CHECK (cuposOcupados >= 0)
+    );
+GO
+
+/* --------------------------------------------------------------------------
+-- Secuencia de IDs de Inscripcin
+-- Reemplaza MAX(idInscripcion) + 1, que bloquea el final de la tabla y
+-- obliga a todas las inscripciones (de cualquier grupo) a esperar su turno.
+-- Empieza despus del mayor ID existente.
+--------------------------------------------------------------------------
+*/
+IF OBJECT_ID('Proceso.SecuenciaInscripcion') IS NULL
+BEGIN
+    DECLARE @inicio INTEGER, @sql NVARCHAR(200);
+    SELECT @inicio = ISNULL(MAX(idInscripcion), 0) + 1 FROM Proceso.Inscripcion;
+    SET @sql = N'CREATE SEQUENCE Proceso.SecuenciaInscripcion AS INTEGER START WITH ' + CAST(@inicio AS NVARCHAR(12)) + N' INCREMENT BY 1 CACHE 50;';
+    EXEC sp_executesql @sql;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- Trigger de Grupos
+-- Cada grupo nuevo empieza con su contador de cupos en cero.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER TRIGGER Proceso.tr_Grupo_Cupos
+ON Proceso.Grupo
+AFTER INSERT
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    INSERT INTO Proceso.CupoGrupo (idGrupo, cuposOcupados)
+    SELECT I.idGrupo, 0
+    FROM inserted AS I
+    WHERE NOT EXISTS (SELECT 1 FROM Proceso.CupoGrupo AS C WHERE C.idGrupo = I.idGrupo);
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- Trigger de Inscripciones
+-- Ocupa, libera o vuelve a ocupar cupos cuando se crea una inscripcin,
+-- cambia de estado (p. ej. pasa a 'Retirado') o de grupo, o se elimina:
+-- suma las filas nuevas que ocupan cupo y resta las anteriores, por grupo,
+-- en una sola sentencia. Las inscripciones que crea sp_InscribirLote ya
+-- las cont el procedimiento al reservar el cupo: las marca con
+-- SESSION_CONTEXT(N'inscripcionConCupo') = 1 y aqu no se cuentan de nuevo.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER TRIGGER Proceso.tr_Inscripcion_Cupos
+ON Proceso.Inscripcion
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF NOT EXISTS (SELECT 1 FROM deleted)
+    BEGIN
+        IF CAST(SESSION_CONTEXT(N'inscripcionConCupo') AS BIT) = 1
+            RETURN;
+    END
+    ELSE IF EXISTS (SELECT 1 FROM inserted) AND NOT UPDATE(estadoInscripcion) AND NOT UPDATE(idGrupoPertenece)
+        RETURN;
+
+    UPDATE C
+    SET C.cuposOcupados = C.cuposOcupados + D.delta
+    FROM Proceso.CupoGrupo AS C
+    INNER JOIN (
+        SELECT idGrupo, SUM(signo) AS delta
+        FROM (
+            SELECT idGrupoPertenece AS idGrupo, 1 AS signo FROM inserted WHERE estadoInscripcion <> 'Retirado'
+            UNION ALL
+            SELECT idGrupoPertenece, -1 FROM deleted WHERE estadoInscripcion <> 'Retirado'
+        ) AS M
+        GROUP BY idGrupo
+        HAVING SUM(signo) <> 0
+    ) AS D ON D.idGrupo = C.idGrupo;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Reconstruir los Cupos por Grupo
+-- Recuenta las inscripciones que ocupan cupo de cada grupo (recorrido
+-- completo), crea los contadores que falten y devuelve los grupos cuyo
+-- contador no coincida. Con @soloVerificar = 1 solo informa.
+-- La transaccin la confirma el cliente.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ReconstruirCuposGrupo
+    @soloVerificar BIT = 0
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @calculado TABLE (
+        idGrupo INTEGER NOT NULL PRIMARY KEY,
+        cuposOcupados INTEGER NOT NULL
+    );
+
+    INSERT INTO @calculado (idGrupo, cuposOcupados)
+    SELECT G.idGrupo, COUNT(I.idInscripcion)
+    FROM Proceso.Grupo AS G
+    LEFT JOIN Proceso.Inscripcion AS I WITH (TABLOCK, HOLDLOCK)
+        ON I.idGrupoPertenece = G.idGrupo AND I.estadoInscripcion <> 'Retirado'
+    GROUP BY G.idGrupo;
+
+    SELECT
+        K.idGrupo AS ID_Grupo,
+        C.cuposOcupados AS Cupos_Guardados,
+        K.cuposOcupados AS Cupos_Calculados
+    FROM @calculado AS K
+    LEFT JOIN Proceso.CupoGrupo AS C ON C.idGrupo = K.idGrupo
+    WHERE C.cuposOcupados IS NULL OR C.cuposOcupados != K.cuposOcupados
+    ORDER BY K.idGrupo;
+
+    IF @soloVerificar = 1
+        RETURN 0;
+
+    MERGE Proceso.CupoGrupo WITH (HOLDLOCK) AS C
+    USING @calculado AS K ON C.idGrupo = K.idGrupo
+    WHEN MATCHED AND C.cuposOcupados != K.cuposOcupados THEN
+        UPDATE SET C.cuposOcupados = K.cuposOcupados
+    WHEN NOT MATCHED BY TARGET THEN
+        INSERT (idGrupo, cuposOcupados) VALUES (K.idGrupo, K.cuposOcupados);
+    RETURN 0;
+END
+GO
+
+/* Carga inicial de los contadores con las inscripciones existentes. */
+BEGIN TRANSACTION;
+EXEC Proceso.sp_ReconstruirCuposGrupo;
+COMMIT TRANSACTION;
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Consultar los Cupos de un Grupo
+-- Devuelve idGrupo, cupos mximos, cupos ocupados y la versin del contador.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_CuposGrupo
+    @idGrupo INTEGER
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT G.idGrupo AS ID_Grupo, G.cuposMaximos AS Cupos_Maximos, C.cuposOcupados AS Cupos_Ocupados, C.version AS Version
+    FROM Proceso.Grupo AS G
+    INNER JOIN Proceso.CupoGrupo AS C ON C.idGrupo = G.idGrupo
+    WHERE G.idGrupo = @idGrupo;
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- Tipo de tabla para un lote de inscripciones a un grupo
+-- 'orden' es la posicin de la solicitud en el lote: si no hay cupo para
+-- todas, se inscriben las primeras.
+--------------------------------------------------------------------------
+*/
+IF TYPE_ID('Proceso.TipoInscripcionLote') IS NULL
+    CREATE TYPE Proceso.TipoInscripcionLote AS TABLE (
+        orden INTEGER NOT NULL PRIMARY KEY,
+        cedulaIdentidad VARCHAR(10) NOT NULL,
+        presentoFeBautismo BIT NOT NULL,
+        estadoPago VARCHAR(9) NOT NULL,
+        montoPago DECIMAL(6,2) NOT NULL
+    );
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Inscribir un Lote de Catequizados en un Grupo
+-- 1. Clasifica las solicitudes sin bloquear nada: cdulas inexistentes,
+--    datos invlidos y catequizados ya inscritos (o repetidos en el lote).
+-- 2. Reserva los cupos con una sola actualizacin condicional del contador:
+--    toma los que pide el lote o los que queden libres, lo que sea menor,
+--    sin pasar de Grupo.cuposMaximos. Desde ese momento la fila del contador
+--    queda bloqueada hasta el COMMIT, as que las dems inscripciones al
+--    mismo grupo esperan solo lo que dura este INSERT.
+-- 3. Con el contador bloqueado repite la comprobacin de duplicados (otra
+--    sesin pudo inscribir al mismo catequizado entre el paso 1 y el 2),
+--    asigna los cupos en el orden del lote, devuelve los que no se usaron
+--    e inserta las inscripciones con IDs de Proceso.SecuenciaInscripcion.
+-- Devuelve dos resultados:
+--   1. Una fila (codigo, mensaje, inscritos, sinCupo, cuposMaximos,
+--      cuposOcupados, version) y el mismo cdigo en RETURN (mismos cdigos
+--      que los procedimientos ...ConCodigo). Quedarse sin cupo no es un
+--      error: el lote se inscribe hasta llenar el grupo y el resto se
+--      informa.
+--   2. Si el cdigo es 0, una fila por solicitud: ID_Orden, Cedula,
+--      Resultado (Inscrito, SinCupo, Duplicado, NoEncontrado o Invalido) e
+--      ID_Inscripcion.
+-- La transaccin la confirma el cliente (un COMMIT por lote).
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_InscribirLote
+    @idGrupo INTEGER,
+    @solicitudes Proceso.TipoInscripcionLote READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    /* 1. VALIDACIN DE CAMPOS OBLIGATORIOS */
+    IF @idGrupo IS NULL OR NOT EXISTS (SELECT 1 FROM @solicitudes)
+    BEGIN
+        SELECT 1 AS codigo, 'ERROR: El grupo y las solicitudes de inscripcin son obligatorios.' AS mensaje,
+               0 AS inscritos, 0 AS sinCupo, NULL AS cuposMaximos, NULL AS cuposOcupados, NULL AS version;
+        RETURN 1;
+    END
+
+    IF NOT EXISTS (SELECT 1 FROM Proceso.Grupo WHERE idGrupo = @idGrupo)
+    BEGIN
+        SELECT 7 AS codigo, 'ERROR: No existe ningn grupo con el ID ' + CAST(@idGrupo AS VARCHAR) AS mensaje,
+               0 AS inscritos, 0 AS sinCupo, NULL AS cuposMaximos, NULL AS cuposOcupados, NULL AS version;
+        RETURN 7;
+    END
+
+    /* 2. CLASIFICACIN DE LAS SOLICITUDES (sin bloqueos) */
+    DECLARE @resultados TABLE (
+        orden INTEGER NOT NULL PRIMARY KEY,
+        cedulaIdentidad VARCHAR(10) NOT NULL,
+        idCatequizado INTEGER NULL,
+        presentoFeBautismo BIT NOT NULL,
+        estadoPago VARCHAR(9) NOT NULL,
+        montoPago DECIMAL(6,2) NOT NULL,
+        resultado VARCHAR(12) NULL,
+        idInscripcion INTEGER NULL
+    );
+
+    INSERT INTO @resultados (orden, cedulaIdentidad, idCatequizado, presentoFeBautismo, estadoPago, montoPago, resultado)
+    SELECT S.orden, S.cedulaIdentidad, C.idCatequizado, S.presentoFeBautismo, S.estadoPago, S.montoPago,
+           CASE WHEN C.idCatequizado IS NULL THEN 'NoEncontrado'
+                WHEN S.estadoPago NOT IN ('Pendiente', 'Pagado', 'Exonerado') OR S.montoPago < 0 THEN 'Invalido'
+           END
+    FROM @solicitudes AS S
+    LEFT JOIN Proceso.Catequizado AS C ON C.cedulaIdentidad = S.cedulaIdentidad;
+
+    /* Un catequizado repetido en el lote solo se considera la primera vez. */
+    UPDATE R
+    SET R.resultado = 'Duplicado'
+    FROM @resultados AS R
+    WHERE R.resultado IS NULL
+      AND EXISTS (SELECT 1 FROM @resultados AS P WHERE P.idCatequizado = R.idCatequizado AND P.orden < R.orden);
+
+    UPDATE R
+    SET R.resultado = 'Duplicado'
+    FROM @resultados AS R
+    WHERE R.resultado IS NULL
+      AND EXISTS (SELECT 1 FROM Proceso.Inscripcion AS I
+                  WHERE I.idCatequizadoRealiza = R.idCatequizado AND I.idGrupoPertenece = @idGrupo);
+
+    BEGIN TRY
+        DECLARE @solicitados INTEGER, @reservados INTEGER = 0, @usados INTEGER = 0;
+        SELECT @solicitados = COUNT(*) FROM @resultados WHERE resultado IS NULL;
+
+        /* Un grupo sin contador (creado antes de este script sin reconstruir) lo recibe con el recuento actual. */
+        IF NOT EXISTS (SELECT 1 FROM Proceso.CupoGrupo WITH (UPDLOCK, HOLDLOCK) WHERE idGrupo = @idGrupo)
+            INSERT INTO Proceso.CupoGrupo (idGrupo, cuposOcupados)
+            SELECT @idGrupo, COUNT(*)
+            FROM Proceso.Inscripcion
+            WHERE idGrupoPertenece = @idGrupo AND estadoInscripcion <> 'Retirado';
+
+        IF @solicitados > 0
+        BEGIN
+            /* 3. RESERVA CONDICIONAL: lee los cupos libres y los ocupa en la misma sentencia. */
+            DECLARE @reserva TABLE (reservados INTEGER NOT NULL);
+
+            UPDATE C
+            SET C.cuposOcupados = C.cuposOcupados +
+                    CASE WHEN G.cuposMaximos - C.cuposOcupados < @solicitados
+                         THEN G.cuposMaximos - C.cuposOcupados ELSE @solicitados END
+            OUTPUT inserted.cuposOcupados - deleted.cuposOcupados INTO @reserva (reservados)
+            FROM Proceso.CupoGrupo AS C
+            INNER JOIN Proceso.Grupo AS G ON G.idGrupo = C.idGrupo
+            WHERE C.idGrupo = @idGrupo
+              AND C.cuposOcupados < G.cuposMaximos;
+
+            SELECT @reservados = ISNULL(SUM(reservados), 0) FROM @reserva;
+        END
+
+        IF @reservados > 0
+        BEGIN
+            /* 4. Con el contador bloqueado, ninguna otra inscripcin al grupo puede confirmarse: se repite la comprobacin. */
+            UPDATE R
+            SET R.resultado = 'Duplicado'
+            FROM @resultados AS R
+            WHERE R.resultado IS NULL
+              AND EXISTS (SELECT 1 FROM Proceso.Inscripcion AS I
+                          WHERE I.idCatequizadoRealiza = R.idCatequizado AND I.idGrupoPertenece = @idGrupo);
+
+            /* Los cupos se asignan en el orden del lote. */
+            WITH Candidatas AS (
+                SELECT resultado, ROW_NUMBER() OVER (ORDER BY orden) AS posicion
+                FROM @resultados
+                WHERE resultado IS NULL
+            )
+            UPDATE Candidatas
+            SET resultado = CASE WHEN posicion <= @reservados THEN 'Inscrito' ELSE 'SinCupo' END;
+
+            SELECT @usados = COUNT(*) FROM @resultados WHERE resultado = 'Inscrito';
+
+            /* Devuelve los cupos reservados para catequizados que resultaron duplicados. */
+            IF @usados < @reservados
+                UPDATE Proceso.CupoGrupo
+                SET cuposOcupados = cuposOcupados - (@reservados - @usados)
+                WHERE idGrupo = @idGrupo;
+
+            IF @usados > 0
+            BEGIN
+                DECLARE @primerValor SQL_VARIANT, @primerID INTEGER;
+                EXEC sp_sequence_get_range @sequence_name = N'Proceso.SecuenciaInscripcion',
+                                           @range_size = @usados, @range_first_value = @primerValor OUTPUT;
+                SET @primerID = CAST(@primerValor AS INTEGER);
+
+                WITH Inscritas AS (
+                    SELECT idInscripcion, ROW_NUMBER() OVER (ORDER BY orden) AS posicion
+                    FROM @resultados
+                    WHERE resultado = 'Inscrito'
+                )
+                UPDATE Inscritas
+                SET idInscripcion = @primerID + posicion - 1;
+
+                /* Los cupos ya se reservaron en el paso 3: tr_Inscripcion_Cupos no debe volver a contarlos. */
+                EXEC sp_set_session_context @key = N'inscripcionConCupo', @value = 1;
+
+                INSERT INTO Proceso.Inscripcion (idInscripcion, idCatequizadoRealiza, idGrupoPertenece, fechaInscripcion,
+                                                 estadoInscripcion, presentoFeBautismo, estadoPago, montoPago)
+                SELECT idInscripcion, idCatequizado, @idGrupo, CAST(GETDATE() AS DATE),
+                       'Cursando', presentoFeBautismo, estadoPago, montoPago
+                FROM @resultados
+                WHERE resultado = 'Inscrito';
+
+                EXEC sp_set_session_context @key = N'inscripcionConCupo', @value = NULL;
+            END
+        END
+
+        /* Sin cupos reservados, las solicitudes vlidas que quedan no tienen cupo. */
+        UPDATE @resultados SET resultado = 'SinCupo' WHERE resultado IS NULL;
+
+        SELECT 0 AS codigo,
+               'OK: Inscritos: ' + CAST(@usados AS VARCHAR) + ', sin cupo: ' + CAST((SELECT COUNT(*) FROM @resultados WHERE resultado = 'SinCupo') AS VARCHAR) AS mensaje,
+               @usados AS inscritos,
+               (SELECT COUNT(*) FROM @resultados WHERE resultado = 'SinCupo') AS sinCupo,
+               G.cuposMaximos, C.cuposOcupados, C.version
+        FROM Proceso.Grupo AS G
+        INNER JOIN Proceso.CupoGrupo AS C ON C.idGrupo = G.idGrupo
+        WHERE G.idGrupo = @idGrupo;
+
+        SELECT orden AS ID_Orden, cedulaIdentidad AS Cedula, resultado AS Resultado, idInscripcion AS ID_Inscripcion
+        FROM @resultados
+        ORDER BY orden;
+        RETURN 0;
+    END TRY
+    BEGIN CATCH
+        /* La marca no debe quedar en la sesin: la conexin vuelve al pool. */
+        EXEC sp_set_session_context @key = N'inscripcionConCupo', @value = NULL;
+        SELECT 50 AS codigo, 'ERROR CRTICO SQL: ' + ERROR_MESSAGE() AS mensaje,
+               0 AS inscritos, 0 AS sinCupo, NULL AS cuposMaximos, NULL AS cuposOcupados, NULL AS version;
+        RETURN 50;
+    END CATCH
+END
+GO
\ No newline at end of file
@@ -0,0 +1,289 @@
+/* Establece el contexto de la base de datos a 'CATEQUESIS' */
+USE CATEQUESIS
+GO
+
+/* --------------------------------------------------------------------------
+-- ndice filtrado de la cola de traslados pendientes
+-- Solo contiene las solicitudes 'Pendiente' (las resueltas salen del ndice),
+-- ordenadas por parroquia destino e ID: la cola se lee sin recorrer el
+-- historial de traslados.
+--------------------------------------------------------------------------
+*/
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Traslado_Pendiente' AND object_id = OBJECT_ID('Proceso.Traslado'))
+    CREATE NONCLUSTERED INDEX IX_Traslado_Pendiente
+        ON Proceso.Traslado (idParroquiaDestino, idTraslado)
+        INCLUDE (idCatequizadoSolicita, idParroquiaOrigen, fechaSolicitud)
+        WHERE estadoTraslado = 'Pendiente';
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Listar la Cola de Traslados Pendientes
+-- Devuelve una pgina de solicitudes 'Pendiente' (paginacin por ID, en
+-- orden de llegada), opcionalmente solo las de una parroquia destino.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ListarTrasladosPendientes
+    @desdeId INTEGER = 0,
+    @tamanioPagina INTEGER = 500,
+    @idParroquiaDestino INTEGER = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF @desdeId IS NULL SET @desdeId = 0;
+    IF @tamanioPagina IS NULL OR @tamanioPagina < 1 SET @tamanioPagina = 500;
+    IF @tamanioPagina > 5000 SET @tamanioPagina = 5000;
+
+    SELECT TOP (@tamanioPagina)
+        T.idTraslado AS ID_Traslado,
+        C.idCatequizado AS ID_Catequizado,
+        C.cedulaIdentidad AS Cedula,
+        C.nombres AS Nombres,
+        C.apellidos AS Apellidos,
+        T.idParroquiaOrigen AS ID_Parroquia_Origen,
+        PO.nombreParroquia AS Parroquia_Origen,
+        T.idParroquiaDestino AS ID_Parroquia_Destino,
+        PD.nombreParroquia AS Parroquia_Destino,
+        T.fechaSolicitud AS Fecha_Solicitud,
+        T.motivoTraslado AS Motivo
+    FROM Proceso.Traslado AS T
+    INNER JOIN Proceso.Catequizado AS C ON C.idCatequizado = T.idCatequizadoSolicita
+    LEFT JOIN Configuracion.Parroquia AS PO ON PO.idParroquia = T.idParroquiaOrigen
+    LEFT JOIN Configuracion.Parroquia AS PD ON PD.idParroquia = T.idParroquiaDestino
+    WHERE T.estadoTraslado = 'Pendiente'
+      AND T.idTraslado > @desdeId
+      AND (@idParroquiaDestino IS NULL OR T.idParroquiaDestino = @idParroquiaDestino)
+    ORDER BY T.idTraslado
+    /* Recompila para que el filtro opcional use el ndice adecuado en cada caso. */
+    OPTION (RECOMPILE);
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Solicitar un Traslado
+-- Crea una solicitud 'Pendiente' desde la parroquia actual del catequizado.
+-- Devuelve una fila (codigo, mensaje, idTraslado) y el mismo cdigo con
+-- RETURN (mismos cdigos que los procedimientos ...ConCodigo; 9 = traslado
+-- no vlido: ya hay una solicitud pendiente o el destino es la parroquia
+-- actual).
+-- La transaccin la confirma el cliente.
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_SolicitarTraslado
+    @cedulaIdentidad VARCHAR(10),
+    @idParroquiaDestino INTEGER,
+    @motivoTraslado VARCHAR(255),
+    @documentoConstanciaPath VARCHAR(1024)
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    /* 1. VALIDACIN DE CAMPOS OBLIGATORIOS */
+    IF ISNULL(LTRIM(RTRIM(@cedulaIdentidad)), '') = '' OR @idParroquiaDestino IS NULL
+       OR ISNULL(LTRIM(RTRIM(@motivoTraslado)), '') = '' OR ISNULL(LTRIM(RTRIM(@documentoConstanciaPath)), '') = ''
+    BEGIN
+        SELECT 1 AS codigo, 'ERROR: La cdula, la parroquia destino, el motivo y la constancia son obligatorios.' AS mensaje, NULL AS idTraslado;
+        RETURN 1;
+    END
+
+    /* 2. VALIDACIONES DE NEGOCIO */
+    DECLARE @idCatequizado INTEGER, @idParroquiaOrigen INTEGER;
+    SELECT @idCatequizado = idCatequizado, @idParroquiaOrigen = idParroquiaPertenece
+    FROM Proceso.Catequizado WHERE cedulaIdentidad = @cedulaIdentidad;
+
+    IF @idCatequizado IS NULL
+    BEGIN
+        SELECT 7 AS codigo, 'ERROR: No existe ningn catequizado con la cdula ' + @cedulaIdentidad AS mensaje, NULL AS idTraslado;
+        RETURN 7;
+    END
+
+    IF NOT EXISTS (SELECT 1 FROM Configuracion.Parroquia WHERE idParroquia = @idParroquiaDestino)
+    BEGIN
+        SELECT 5 AS codigo, 'ERROR: La parroquia seleccionada no existe en el sistema.' AS mensaje, NULL AS idTraslado;
+        RETURN 5;
+    END
+
+    IF @idParroquiaDestino = @idParroquiaOrigen
+    BEGIN
+        SELECT 9 AS codigo, 'ERROR: El catequizado ya pertenece a la parroquia destino.' AS mensaje, NULL AS idTraslado;
+        RETURN 9;
+    END
+
+    IF EXISTS (SELECT 1 FROM Proceso.Traslado WITH (UPDLOCK, HOLDLOCK)
+               WHERE idCatequizadoSolicita = @idCatequizado AND estadoTraslado = 'Pendiente')
+    BEGIN
+        SELECT 9 AS codigo, 'ERROR: El catequizado ya tiene una solicitud de traslado pendiente.' AS mensaje, NULL AS idTraslado;
+        RETURN 9;
+    END
+
+    /* 3. BLOQUE DE INSERCIN */
+    BEGIN TRY
+        DECLARE @NuevoID INTEGER;
+        SELECT @NuevoID = ISNULL(MAX(idTraslado), 0) + 1 FROM Proceso.Traslado WITH (UPDLOCK, HOLDLOCK);
+
+        INSERT INTO Proceso.Traslado (idTraslado, idCatequizadoSolicita, idParroquiaOrigen, idParroquiaDestino,
+                                      fechaSolicitud, fechaAprobacion, motivoTraslado, estadoTraslado, documentoConstanciaPath)
+        VALUES (@NuevoID, @idCatequizado, @idParroquiaOrigen, @idParroquiaDestino,
+                CAST(GETDATE() AS DATE), NULL, LTRIM(RTRIM(@motivoTraslado)), 'Pendiente', LTRIM(RTRIM(@documentoConstanciaPath)));
+
+        SELECT 0 AS codigo, 'OK: Solicitud de traslado registrada. Cdigo asignado: ' + CAST(@NuevoID AS VARCHAR) AS mensaje, @NuevoID AS idTraslado;
+        RETURN 0;
+    END TRY
+    BEGIN CATCH
+        SELECT 50 AS codigo, 'ERROR CRTICO SQL: ' + ERROR_MESSAGE() AS mensaje, NULL AS idTraslado;
+        RETURN 50;
+    END CATCH
+END
+GO
+
+/* --------------------------------------------------------------------------
+-- Tipo de tabla para un lote de traslados a resolver
+-- La clave primaria impide resolver dos veces el mismo traslado en la misma
+-- llamada.
+--------------------------------------------------------------------------
+*/
+IF TYPE_ID('Proceso.TipoTrasladoLote') IS NULL
+    CREATE TYPE Proceso.TipoTrasladoLote AS TABLE (
+        idTraslado INTEGER NOT NULL PRIMARY KEY
+    );
+GO
+
+/* --------------------------------------------------------------------------
+-- SP para Aprobar o Rechazar un Lote de Traslados
+-- Resuelve todas las solicitudes del lote con sentencias sobre el conjunto
+-- completo: cambia el estado de los traslados y, al aprobar, mueve a los
+-- catequizados a la parroquia destino. Si alguna solicitud del lote no se
+-- puede resolver no se modifica ninguna.
+-- Devuelve dos resultados:
+--   1. Una fila (codigo, mensaje), con el mismo cdigo en RETURN (mismos
+--      cdigos que los procedimientos ...ConCodigo; 9 = traslado no vlido:
+--      ya resuelto, o el catequizado ya no est en la parroquia de origen).
+--   2. Si el cdigo es 0, una fila por traslado resuelto: ID_Traslado,
+--      ID_Parroquia_Origen y el catequizado ya actualizado, con las mismas
+--      columnas que sp_ListarCatequizadosPaginado (el cliente actualiza sus
+--      cachs sin volver a consultar).
+-- La transaccin la confirma el cliente (un COMMIT por lote).
+--------------------------------------------------------------------------
+*/
+CREATE OR ALTER PROCEDURE Proceso.sp_ResolverTrasladosLote
+    @traslados Proceso.TipoTrasladoLote READONLY,
+    @aprobar BIT,
+    @fechaResolucion DATE = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    /* 1. VALIDACIN DE CAMPOS OBLIGATORIOS */
+    IF @aprobar IS NULL OR NOT EXISTS (SELECT 1 FROM @traslados)
+    BEGIN
+        SELECT 1 AS codigo, 'ERROR: Los traslados y la decisin (aprobar o rechazar) son obligatorios.' AS mensaje;
+        RETURN 1;
+    END
+
+    IF @fechaResolucion IS NULL SET @fechaResolucion = CAST(GETDATE() AS DATE);
+
+    /* 2. VALIDACIONES DE NEGOCIO (con las filas bloqueadas hasta el COMMIT del cliente) */
+    DECLARE @resueltos TABLE (
+        idTraslado INTEGER NOT NULL PRIMARY KEY,
+        idCatequizado INTEGER NOT NULL,
+        idParroquiaOrigen INTEGER NOT NULL,
+        idParroquiaDestino INTEGER NOT NULL,
+        estadoTraslado VARCHAR(10) NOT NULL
+    );
+
+    INSERT INTO @resueltos (idTraslado, idCatequizado, idParroquiaOrigen, idParroquiaDestino, estadoTraslado)
+    SELECT T.idTraslado, T.idCatequizadoSolicita, T.idParroquiaOrigen, T.idParroquiaDestino, T.estadoTraslado
+    FROM Proceso.Traslado AS T WITH (UPDLOCK, HOLDLOCK)
+    INNER JOIN @traslados AS L ON L.idTraslado = T.idTraslado;
+
+    DECLARE @idInvalido INTEGER;
+
+    SELECT TOP (1) @idInvalido = L.idTraslado
+    FROM @traslados AS L
+    WHERE NOT EXISTS (SELECT 1 FROM @resueltos AS R WHERE R.idTraslado = L.idTraslado);
+
+    IF @idInvalido IS NOT NULL
+    BEGIN
+        SELECT 7 AS codigo, 'ERROR: No existe ningn traslado con el ID ' + CAST(@idInvalido AS VARCHAR) AS mensaje;
+        RETURN 7;
+    END
+
+    SELECT TOP (1) @idInvalido = idTraslado FROM @resueltos WHERE estadoTraslado <> 'Pendiente';
+
+    IF @idInvalido IS NOT NULL
+    BEGIN
+        SELECT 9 AS codigo, 'ERROR: El traslado ' + CAST(@idInvalido AS VARCHAR) + ' ya fue resuelto.' AS mensaje;
+        RETURN 9;
+    END
+
+    IF @aprobar = 1
+    BEGIN
+        /* Un catequizado movido por otro traslado despus de su solicitud ya no est en la parroquia de origen. */
+        SELECT TOP (1) @idInvalido = R.idTraslado
+        FROM @resueltos AS R
+        INNER JOIN Proceso.Catequizado AS C WITH (UPDLOCK, HOLDLOCK) ON C.idCatequizado = R.idCatequizado
+        WHERE C.idParroquiaPertenece <> R.idParroquiaOrigen;
+
+        IF @idInvalido IS NOT NULL
+        BEGIN
+            SELECT 9 AS codigo, 'ERROR: El catequizado del traslado ' + CAST(@idInvalido AS VARCHAR) + ' ya no pertenece a la parroquia de origen.' AS mensaje;
+            RETURN 9;
+        END
+
+        SELECT TOP (1) @idInvalido = MAX(idTraslado)
+        FROM @resueltos
+        GROUP BY idCatequizado
+        HAVING COUNT(*) > 1;
+
+        IF @idInvalido IS NOT NULL
+        BEGIN
+            SELECT 9 AS codigo, 'ERROR: El lote aprueba ms de un traslado para el mismo catequizado (traslado ' + CAST(@idInvalido AS VARCHAR) + ').' AS mensaje;
+            RETURN 9;
+        END
+    END
+
+    /* 3. BLOQUE DE ACTUALIZACIN (una sentencia para los traslados y otra para los catequizados) */
+    BEGIN TRY
+        UPDATE T
+        SET T.estadoTraslado = CASE WHEN @aprobar = 1 THEN 'Aprobado' ELSE 'Rechazado' END,
+            T.fechaAprobacion = CASE WHEN @aprobar = 1 THEN @fechaResolucion ELSE NULL END
+        FROM Proceso.Traslado AS T
+        INNER JOIN @resueltos AS R ON R.idTraslado = T.idTraslado;
+
+        IF @aprobar = 1
+            UPDATE C
+            SET C.idParroquiaPertenece = R.idParroquiaDestino
+            FROM Proceso.Catequizado AS C
+            INNER JOIN @resueltos AS R ON R.idCatequizado = C.idCatequizado;
+
+        SELECT 0 AS codigo,
+               'OK: Traslados ' + CASE WHEN @aprobar = 1 THEN 'aprobados' ELSE 'rechazados' END + ': ' + CAST((SELECT COUNT(*) FROM @resueltos) AS VARCHAR) AS mensaje;
+
+        SELECT
+            R.idTraslado AS ID_Traslado,
+            R.idParroquiaOrigen AS ID_Parroquia_Origen,
+            C.idCatequizado AS ID_Catequizado,
+            C.idParroquiaPertenece AS ID_Parroquia,
+            CPA.nombreParroquia AS Nombre_Parroquia,
+            C.nombres AS Nombres,
+            C.apellidos AS Apellidos,
+            C.cedulaIdentidad AS Cedula,
+            C.fechaNacimiento AS Fecha_Nacimiento,
+            C.direccionDomicilio AS Direccion,
+            C.nombreRepresentante AS Nombre_Representante,
+            C.telefonoRepresentante AS Telefono_Representante,
+            C.emailRepresentante AS Email_Representante,
+            C.fechaBautismo AS Fecha_Bautismo,
+            C.parroquiaBautismo AS Parroquia_Bautismo
+        FROM @resueltos AS R
+        INNER JOIN Proceso.Catequizado AS C ON C.idCatequizado = R.idCatequizado
+        LEFT JOIN Configuracion.Parroquia AS CPA ON CPA.idParroquia = C.idParroquiaPertenece
+        ORDER BY R.idTraslado;
+        RETURN 0;
+    END TRY
+    BEGIN CATCH
+        SELECT 50 AS codigo, 'ERROR CRTICO SQL: ' + ERROR_MESSAGE() AS mensaje;
+        RETURN 50;
+    END CATCH
+END
+GO
\ No newline at end of file
@@ -0,0 +1,37 @@
+from typing import NamedTuple
+
+from Catequizado.modeloCatequizado import Catequizado
+
+# Estados que acepta Proceso.Traslado (CK_Traslado_estado)
+ESTADOS_TRASLADO = ("Pendiente", "Aprobado", "Rechazado")
+
+# Registro inmutable de una solicitud de la cola de traslados pendientes
+class TrasladoPendiente(NamedTuple):
+    idTraslado: int
+    idCatequizado: int
+    cedulaIdentidad: str
+    nombres: str
+    apellidos: str
+    idParroquiaOrigen: int
+    nombreParroquiaOrigen: str
+    idParroquiaDestino: int
+    nombreParroquiaDestino: str
+    fechaSolicitud: object
+    motivoTraslado: str
+
+    # Construye el registro a partir de una fila de sp_ListarTrasladosPendientes (mismas columnas y orden)
+    @classmethod
+    def desde_fila(cls, row):
+        return cls._make(tuple(row[:11]))
+
+# Traslado ya resuelto: el catequizado viene como quedó después del lote (en la parroquia destino si se aprobó)
+class TrasladoResuelto(NamedTuple):
+    idTraslado: int
+    idParroquiaOrigen: int
+    catequizado: Catequizado
+
+    # Construye el registro a partir de una fila del segundo resultado de sp_ResolverTrasladosLote:
+    # ID_Traslado, ID_Parroquia_Origen y las columnas de sp_ListarCatequizadosPaginado
+    @classmethod
+    def desde_fila(cls, row):
+        return cls(row[0], row[1], Catequizado.desde_fila(row[2:]))
\ No newline at end of file
@@ -0,0 +1,96 @@
+from Traslado.repositorioTraslado import RepositorioTraslado
+
+# Solicitudes de la cola que se muestran (y se pueden resolver juntas) por página
+TAMANIO_PAGINA_COLA = 50
+
+# Clase que maneja las solicitudes de traslado de parroquia desde la consola
+class OperacionesTraslado:
+
+    def __init__(self):
+        self.repositorio = RepositorioTraslado()
+
+    def operacion_traslados(self):
+        print("\n--- Traslados de Parroquia ---")
+        opcion = input("(s)olicitar un traslado o (r)evisar la cola de pendientes: ").strip().lower()
+        if opcion == 's':
+            self.operacion_solicitar()
+        elif opcion == 'r':
+            self.operacion_revisar_cola()
+        else:
+            print("[ERROR] Opción no válida. Use s o r.")
+
+    def operacion_solicitar(self):
+        cedula = input("Cédula del catequizado: ").strip()
+        try:
+            idParroquiaDestino = int(input("ID de la Parroquia destino: ").strip())
+        except ValueError:
+            print("[ERROR] El ID de la parroquia debe ser numérico.")
+            return
+        motivo = input("Motivo del traslado: ").strip()
+        documento = input("Ruta de la constancia: ").strip()
+
+        try:
+            resultado = self.repositorio.solicitar(cedula, idParroquiaDestino, motivo, documento)
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return
+        print(resultado.mensaje, "\n")
+
+    # Muestra la cola por páginas; las solicitudes elegidas de cada página se aprueban o rechazan en un solo lote
+    def operacion_revisar_cola(self):
+        filtro = input("ID de la Parroquia destino (Enter para todas): ").strip()
+        try:
+            idParroquiaDestino = int(filtro) if filtro else None
+        except ValueError:
+            print("[ERROR] El ID de la parroquia debe ser numérico.")
+            return
+
+        desdeId = 0
+        while True:
+            try:
+                pendientes, siguienteId = self.repositorio.listarPendientes(idParroquiaDestino, desdeId,
+                                                                            TAMANIO_PAGINA_COLA)
+            except Exception as e:
+                print("\nError durante la ejecución de la consulta:", e)
+                return
+            if not pendientes:
+                print("No hay traslados pendientes.")
+                return
+
+            print("\n---------- TRASLADOS PENDIENTES ----------")
+            for traslado in pendientes:
+                print(f"[{traslado.idTraslado}] {traslado.apellidos} {traslado.nombres} ({traslado.cedulaIdentidad}) | "
+                      f"{traslado.nombreParroquiaOrigen} -> {traslado.nombreParroquiaDestino} | "
+                      f"{traslado.fechaSolicitud} | {traslado.motivoTraslado}")
+            print("------------------------------------------")
+
+            self._resolver_pagina(pendientes)
+
+            if siguienteId is None:
+                return
+            if input("¿Ver la página siguiente? (s/n): ").strip().lower() != 's':
+                return
+            desdeId = siguienteId
+
+    def _resolver_pagina(self, pendientes):
+        decision = input("(a)probar, (r)echazar o Enter para no resolver ninguno: ").strip().lower()
+        if decision not in ('a', 'r'):
+            return
+        eleccion = input("IDs separados por comas (Enter = todos los de la página): ").strip()
+        try:
+            ids = [int(valor) for valor in eleccion.split(",")] if eleccion else \
+                [traslado.idTraslado for traslado in pendientes]
+        except ValueError:
+            print("[ERROR] Los IDs deben ser numéricos.")
+            return
+
+        accion = "APROBAR" if decision == 'a' else "RECHAZAR"
+        if input(f"¿Confirma {accion} {len(set(ids))} traslado(s)? (s/n): ").strip().lower() != 's':
+            print("Operación cancelada.")
+            return
+        try:
+            resultado = self.repositorio.resolverLote(ids, decision == 'a')
+        except Exception as e:
+            print("\nError durante la ejecución de la consulta:", e)
+            return
+        print(resultado.mensaje, "\n")
\ No newline at end of file
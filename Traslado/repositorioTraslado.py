@@ -0,0 +1,116 @@
+from datetime import date
+
+import connection as conexion
+from audit import audit_image, get_audit_writer
+from instrumentation import instrumented
+from Catequizado.busquedaCatequizado import get_indice_catequizados
+from Catequizado.cacheCatequizado import get_cache_catequizados
+from Catequizado.procedimientosCatequizado import (CODIGO_CAMPOS_OBLIGATORIOS, ErrorCatequizado, LlamadaProcedimiento,
+                                                   descartar_resultados)
+from Catequizado.repositorioCatequizado import ResultadoOperacion
+from Traslado.modeloTraslado import TrasladoPendiente, TrasladoResuelto
+
+# Repositorio sin estado para Proceso.Traslado: la cola de solicitudes pendientes y su resolución por lotes
+class RepositorioTraslado:
+    SQL_LISTAR_PENDIENTES = "{CALL Proceso.sp_ListarTrasladosPendientes(?,?,?)}"
+    SOLICITAR = LlamadaProcedimiento("Proceso.sp_SolicitarTraslado", 4)
+    # Los IDs viajan como un parámetro con valores de tabla (TVP): (idTraslado,)
+    RESOLVER_LOTE = LlamadaProcedimiento("Proceso.sp_ResolverTrasladosLote", 3)
+
+    # --- MÉTODOS AUXILIARES ---
+
+    # --- OPERACIONES ---
+
+    # Crea una solicitud 'Pendiente' desde la parroquia actual del catequizado; en 'datos' devuelve su ID
+    @instrumented("solicitar_traslado", SOLICITAR.nombre)
+    def solicitar(self, cedulaIdentidad, idParroquiaDestino, motivoTraslado, documentoConstanciaPath,
+                  cancelacion=None):
+        parametros = (cedulaIdentidad, idParroquiaDestino, motivoTraslado, documentoConstanciaPath)
+        with conexion.get_connection_pool().connection(self.SOLICITAR.sql, cancelacion) as (database, cursor):
+            try:
+                row = self.SOLICITAR.ejecutar(cursor, parametros)
+            except ErrorCatequizado as e:
+                database.rollback()
+                return ResultadoOperacion(False, e.mensaje, codigo=e.codigo)
+            database.commit()
+        return ResultadoOperacion(True, row[1], row[2])
+
+    # Devuelve una página de la cola de pendientes (en orden de llegada, opcionalmente de una parroquia destino)
+    # y el ID desde el que empieza la página siguiente (None si no hay más)
+    @instrumented("listar_traslados", "Proceso.sp_ListarTrasladosPendientes")
+    def listarPendientes(self, idParroquiaDestino=None, desdeId=0, tamanioPagina=100, cancelacion=None):
+        with conexion.get_connection_pool().connection(self.SQL_LISTAR_PENDIENTES, cancelacion) as (database, cursor):
+            cursor.execute(self.SQL_LISTAR_PENDIENTES, (desdeId, tamanioPagina, idParroquiaDestino))
+            pendientes = [TrasladoPendiente.desde_fila(row) for row in cursor.fetchall()]
+
+        siguienteId = pendientes[-1].idTraslado if len(pendientes) == tamanioPagina else None
+        return pendientes, siguienteId
+
+    # Generador que recorre toda la cola de pendientes página por página
+    def iterarPendientes(self, idParroquiaDestino=None, tamanioPagina=500):
+        desdeId = 0
+        while desdeId is not None:
+            pendientes, desdeId = self.listarPendientes(idParroquiaDestino, desdeId, tamanioPagina)
+            yield from pendientes
+
+    # Aprueba ('aprobar' = True) o rechaza todos los traslados indicados en una sola llamada y una sola
+    # transacción: o se resuelven todos o ninguno. Al aprobar, los catequizados pasan a la parroquia destino.
+    # En 'datos' devuelve la lista de TrasladoResuelto, con cada catequizado tal como quedó
+    @instrumented("resolver_traslados", RESOLVER_LOTE.nombre)
+    def resolverLote(self, idsTraslado, aprobar, fechaResolucion=None, cancelacion=None):
+        ids = sorted(set(idsTraslado))
+        if not ids:
+            return ResultadoOperacion(False, "ERROR: No hay traslados para resolver.",
+                                      codigo=CODIGO_CAMPOS_OBLIGATORIOS)
+        # La fecha se fija en el cliente para que la base de datos y la auditoría registren la misma
+        fechaResolucion = fechaResolucion or date.today()
+
+        with conexion.get_connection_pool().connection(self.RESOLVER_LOTE.sql, cancelacion) as (database, cursor):
+            try:
+                row = self.RESOLVER_LOTE.ejecutar(cursor, ([(idTraslado,) for idTraslado in ids], aprobar,
+                                                           fechaResolucion), descartarResto=False)
+                # El segundo resultado trae los traslados resueltos con el catequizado ya actualizado
+                resueltos = [TrasladoResuelto.desde_fila(fila) for fila in cursor.fetchall()] \
+                    if cursor.nextset() else []
+                descartar_resultados(cursor)
+            except ErrorCatequizado as e:
+                database.rollback()
+                return ResultadoOperacion(False, e.mensaje, codigo=e.codigo)
+            except Exception:
+                database.rollback()
+                raise
+            database.commit()
+
+        if aprobar:
+            self._aplicarTraslados(resueltos)
+        self._auditar(resueltos, aprobar, fechaResolucion)
+        return ResultadoOperacion(True, row[1], resueltos)
+
+    def aprobarLote(self, idsTraslado, fechaResolucion=None, cancelacion=None):
+        return self.resolverLote(idsTraslado, True, fechaResolucion, cancelacion)
+
+    def rechazarLote(self, idsTraslado, fechaResolucion=None, cancelacion=None):
+        return self.resolverLote(idsTraslado, False, fechaResolucion, cancelacion)
+
+    # Descarta de la caché por cédula los catequizados trasladados y actualiza su parroquia en el índice de
+    # búsqueda con los registros que devolvió el procedimiento (sin volver a consultarlos).
+    # Las listas de clase de Asistencia no cambian: se guardan por grupo y no incluyen la parroquia
+    def _aplicarTraslados(self, resueltos):
+        actuales = {resuelto.catequizado.cedulaIdentidad: resuelto.catequizado for resuelto in resueltos}
+        get_cache_catequizados().invalidar(*actuales)
+        get_indice_catequizados().actualizar(list(actuales), actuales.get)
+
+    # Con auditoría habilitada: el cambio de estado de cada traslado y, al aprobar, el cambio de parroquia
+    def _auditar(self, resueltos, aprobar, fechaResolucion):
+        auditoria = get_audit_writer()
+        if not auditoria.enabled:
+            return
+        estado = "Aprobado" if aprobar else "Rechazado"
+        antes = audit_image({"estadoTraslado": "Pendiente", "fechaAprobacion": None})
+        despues = audit_image({"estadoTraslado": estado, "fechaAprobacion": fechaResolucion if aprobar else None})
+        for resuelto in resueltos:
+            auditoria.record("UPDATE", "Proceso.Traslado", resuelto.idTraslado, despues, antes)
+            if aprobar:
+                auditoria.record("UPDATE", "Proceso.Catequizado", resuelto.catequizado.idCatequizado,
+                                 audit_image({"idParroquiaPertenece": resuelto.catequizado.idParroquiaPertenece}),
+                                 audit_image({"idParroquiaPertenece": resuelto.idParroquiaOrigen}))
\ No newline at end of file
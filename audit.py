@@ -0,0 +1,408 @@
+# Auditoría asíncrona de las escrituras: las imágenes antes/después de cada cambio se guardan primero en un archivo
+# de respaldo local (JSON Lines) y luego un hilo en segundo plano las inserta por lotes en Seguridad.Auditoria.
+# La operación que audita solo paga una escritura local; la base de datos recibe una llamada por lote.
+# Si el proceso termina o la base de datos no responde, los registros siguen en el archivo y se envían después
+# (entrega "al menos una vez": tras una caída entre el INSERT y el punto de control un lote puede repetirse)
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import NamedTuple
+
+import connection as conexion
+
+# Valores por defecto (se pueden sobrescribir en la sección "auditoria" de config.json)
+DEFAULT_AUDIT_CONFIG = {
+    "habilitada": False,                    # Sin auditoría las escrituras no leen la imagen anterior
+    "id_usuario": 1,                        # Seguridad.Usuario que figura como autor de los cambios
+    "tamanio_cola": 10000,                  # Registros en memoria pendientes de enviar
+    "tamanio_lote": 200,                    # Registros por llamada a sp_RegistrarAuditoriaLote
+    "intervalo": 1.0,                       # Segundos máximos que un registro espera a completar su lote
+    "espera_cola": 0.5,                     # Segundos que una escritura espera por espacio si la cola está llena
+    "archivo_respaldo": "auditoria.jsonl",  # Archivo de respaldo local (el punto de control va en <archivo>.pos)
+    "fsync": False                          # Forzar cada registro al disco (más lento; resiste cortes de energía)
+}
+
+# Espera máxima (segundos) entre reintentos cuando la base de datos no responde
+ESPERA_MAXIMA_REINTENTO = 30.0
+
+# Imagen vacía para el lado que no existe (datosAntiguos de un INSERT, datosNuevos de un DELETE)
+IMAGEN_VACIA = "{}"
+
+_logger = logging.getLogger("catequizado.auditoria")
+
+
+# Registro de auditoría con las columnas de Seguridad.Auditoria (el ID lo asigna el procedimiento)
+class AuditRecord(NamedTuple):
+    idUsuarioRealiza: int
+    fechaHoraAccion: str        # ISO 8601, hora local del cliente al momento del cambio
+    accionRealizada: str        # INSERT, UPDATE o DELETE
+    tablaAfectada: str
+    idRegistroAfectado: int
+    datosNuevos: str            # JSON
+    datosAntiguos: str          # JSON
+
+    def a_linea(self):
+        return (json.dumps(self._asdict(), ensure_ascii=False) + "\n").encode("utf-8")
+
+    @classmethod
+    def desde_linea(cls, linea):
+        return cls(**json.loads(linea.decode("utf-8")))
+
+    # Columnas del TVP Seguridad.TipoAuditoriaLote, sin 'orden' (la posición del registro en el lote)
+    def fila_lote(self):
+        return (self.idUsuarioRealiza, datetime.fromisoformat(self.fechaHoraAccion), self.accionRealizada,
+                self.tablaAfectada, self.idRegistroAfectado, self.datosNuevos, self.datosAntiguos)
+
+# Serializa un registro (NamedTuple o diccionario) como imagen JSON; los campos indicados en 'excluir' no se guardan
+def audit_image(registro, excluir=()):
+    if registro is None:
+        return IMAGEN_VACIA
+    campos = registro if isinstance(registro, dict) else registro._asdict()
+    datos = {campo: valor for campo, valor in campos.items() if campo not in excluir}
+    return json.dumps(datos, default=str, ensure_ascii=False)
+
+
+# Escritor de auditoría que no hace nada (auditoría deshabilitada)
+class _NullAuditWriter:
+    enabled = False
+
+    def record(self, accion, tabla, idRegistro, nuevos=IMAGEN_VACIA, antiguos=IMAGEN_VACIA):
+        pass
+
+    def flush(self, timeout=None):
+        return True
+
+    def stats(self):
+        return {}
+
+    def close(self, timeout=None):
+        pass
+
+
+# Escritor de auditoría: archivo de respaldo + cola acotada + hilo que inserta por lotes.
+# Cada registro se escribe en el archivo antes de entrar a la cola, con sus posiciones de inicio y fin en el archivo
+# (en bytes desde el primer registro escrito). El punto de control (<archivo>.pos) guarda hasta qué posición
+# los registros ya están confirmados en la base de datos, sin huecos: con varios hilos auditando, un registro
+# puede entrar a la cola después de otro escrito más adelante en el archivo.
+# Contrapresión: si la cola está llena, la escritura espera 'espera_cola' segundos; si sigue llena no se
+# pierde nada: el registro ya está en el archivo y el hilo pasa a leer desde ahí hasta ponerse al día
+class AuditWriter:
+    SQL_REGISTRAR_LOTE = "{CALL Seguridad.sp_RegistrarAuditoriaLote(?)}"
+
+    enabled = True
+
+    def __init__(self, archivo, id_usuario=1, tamanio_cola=10000, tamanio_lote=200, intervalo=1.0,
+                 espera_cola=0.5, fsync=False, enviar=None):
+        if tamanio_cola < 1 or tamanio_lote < 1:
+            raise ValueError("Configuración de auditoría inválida: tamanio_cola y tamanio_lote deben ser >= 1.")
+
+        self.archivo = archivo
+        self.archivo_posicion = f"{archivo}.pos"
+        self.id_usuario = id_usuario
+        self.tamanio_lote = tamanio_lote
+        self.intervalo = intervalo
+        self.espera_cola = espera_cola
+        self.fsync = fsync
+        # Función que inserta un lote de AuditRecord (por defecto, el procedimiento por el pool de conexiones)
+        self._enviar = enviar or self._enviar_base_datos
+
+        self._cola = queue.Queue(tamanio_cola)
+        self._lock = threading.Lock()
+        self._hay_trabajo = threading.Event()
+        self._detener = threading.Event()
+
+        # Posiciones lógicas: 'base' es la posición del inicio del archivo actual (crece al vaciarlo)
+        self._base = 0
+        self._confirmado = self._abrir_archivo()
+        # Registros enviados más allá de un hueco (inicio -> fin): el punto de control avanza cuando el hueco se envía
+        self._tramos = {}
+        self._escrito = self._base + self._archivo.tell()
+        # Pendientes en el archivo al iniciar (o desbordados de la cola): se leen desde el archivo
+        self._leer_archivo = self._escrito > self._confirmado
+
+        self._enviados = 0
+        self._lotes = 0
+        self._desbordes = 0
+        self._reintentos = 0
+        self._ultimo_error = None
+
+        self._hilo = threading.Thread(target=self._trabajar, name="auditoria", daemon=True)
+        self._hilo.start()
+        if self._leer_archivo:
+            self._hay_trabajo.set()
+
+    # --- ARCHIVO DE RESPALDO ---
+
+    # Abre el archivo de respaldo para agregar y devuelve la posición confirmada del punto de control.
+    # Una última línea incompleta (caída a mitad de una escritura) se descarta
+    def _abrir_archivo(self):
+        with open(self.archivo, "ab+") as archivo:
+            archivo.seek(0)
+            contenido = archivo.read()
+            completo = contenido.rfind(b"\n") + 1
+            if completo < len(contenido):
+                _logger.warning("Auditoría: se descarta un registro incompleto al final de %s.", self.archivo)
+                archivo.truncate(completo)
+
+        try:
+            with open(self.archivo_posicion, "r") as archivo:
+                confirmado = int(archivo.read().strip() or 0)
+        except FileNotFoundError:
+            confirmado = 0
+        # Un punto de control más allá del archivo (archivo reemplazado a mano) se toma como "nada confirmado"
+        if confirmado > completo:
+            confirmado = 0
+
+        self._archivo = open(self.archivo, "ab")
+        return confirmado
+
+    def _guardar_posicion(self, posicion):
+        temporal = f"{self.archivo_posicion}.tmp"
+        with open(temporal, "w") as archivo:
+            archivo.write(str(posicion))
+        os.replace(temporal, self.archivo_posicion)
+
+    # Lee del archivo hasta 'tamanio_lote' registros completos a partir de la posición confirmada.
+    # Los que ya se enviaron desde la cola se incluyen sin registro (solo para avanzar el punto de control)
+    def _leer_lote_archivo(self):
+        inicio = self._confirmado - self._base
+        lote = []
+        with open(self.archivo, "rb") as archivo:
+            archivo.seek(inicio)
+            fin = inicio
+            for linea in archivo:
+                if not linea.endswith(b"\n"):
+                    break
+                inicio, fin = fin, fin + len(linea)
+                if self._base + inicio in self._tramos:
+                    lote.append((self._base + inicio, self._base + fin, None))
+                    continue
+                try:
+                    lote.append((self._base + inicio, self._base + fin, AuditRecord.desde_linea(linea)))
+                except (ValueError, TypeError):
+                    _logger.error("Auditoría: se omite una línea ilegible en %s (posición %s).", self.archivo, fin)
+                    lote.append((self._base + inicio, self._base + fin, None))
+                if len(lote) >= self.tamanio_lote:
+                    break
+        return lote
+
+    # --- PRODUCTORES ---
+
+    # Audita un cambio: 'nuevos' y 'antiguos' son las imágenes JSON (ver audit_image)
+    def record(self, accion, tabla, idRegistro, nuevos=IMAGEN_VACIA, antiguos=IMAGEN_VACIA):
+        registro = AuditRecord(self.id_usuario, datetime.now().isoformat(timespec="milliseconds"), accion,
+                               tabla, idRegistro, nuevos, antiguos)
+        linea = registro.a_linea()
+
+        # 1. Escritura anticipada en el archivo: a partir de aquí el registro sobrevive a una caída
+        with self._lock:
+            self._archivo.write(linea)
+            self._archivo.flush()
+            if self.fsync:
+                os.fsync(self._archivo.fileno())
+            inicio = self._escrito
+            self._escrito += len(linea)
+            fin = self._escrito
+
+        # 2. Cola en memoria (con contrapresión); si sigue llena, el hilo lo leerá del archivo.
+        # Otro hilo puede encolar antes un registro escrito después: el punto de control no salta este
+        try:
+            self._cola.put((inicio, fin, registro), timeout=self.espera_cola)
+        except queue.Full:
+            with self._lock:
+                self._leer_archivo = True
+                self._desbordes += 1
+        self._hay_trabajo.set()
+
+    # Espera hasta que todo lo auditado esté confirmado en la base de datos; devuelve False si se agota el tiempo
+    def flush(self, timeout=None):
+        limite = None if timeout is None else time.monotonic() + timeout
+        self._hay_trabajo.set()
+        while True:
+            with self._lock:
+                if self._confirmado >= self._escrito:
+                    return True
+            if not self._hilo.is_alive() or (limite is not None and time.monotonic() >= limite):
+                return False
+            time.sleep(0.01)
+
+    # --- HILO DE ENVÍO ---
+
+    def _trabajar(self):
+        espera = self.intervalo
+        while not self._detener.is_set():
+            lote = self._siguiente_lote()
+            if not lote:
+                continue
+            try:
+                registros = [registro for inicio, fin, registro in lote if registro is not None]
+                if registros:
+                    self._enviar(registros)
+            except Exception as e:
+                # Base de datos no disponible: el lote se reintenta (sigue en el archivo) con espera creciente
+                self._reintentos += 1
+                self._ultimo_error = str(e)
+                _logger.warning("Auditoría: no se pudo enviar un lote de %s registros (%s); reintento en %.1f s.",
+                                len(lote), e, espera)
+                with self._lock:
+                    self._leer_archivo = True
+                self._detener.wait(espera)
+                espera = min(espera * 2, ESPERA_MAXIMA_REINTENTO)
+                continue
+
+            espera = self.intervalo
+            if registros:
+                self._enviados += len(registros)
+                self._lotes += 1
+            self._confirmar(lote)
+
+    # Arma el siguiente lote: desde el archivo si hay pendientes fuera de la cola; si no, desde la cola,
+    # esperando como máximo 'intervalo' segundos a que el lote se complete
+    def _siguiente_lote(self):
+        if self._leer_archivo:
+            self._descartar_cola()
+            lote = self._leer_lote_archivo()
+            if lote:
+                return lote
+            with self._lock:
+                # Solo se vuelve a la cola si nadie escribió después de la lectura
+                if self._escrito <= self._confirmado:
+                    self._leer_archivo = False
+            return None
+
+        if not self._hay_trabajo.wait(self.intervalo):
+            return None
+        self._hay_trabajo.clear()
+
+        lote = []
+        limite = time.monotonic() + self.intervalo
+        while len(lote) < self.tamanio_lote and not self._detener.is_set():
+            try:
+                inicio, fin, registro = self._cola.get(timeout=max(0.0, limite - time.monotonic()))
+            except queue.Empty:
+                break
+            if fin > self._confirmado:
+                lote.append((inicio, fin, registro))
+        if self._cola.qsize():
+            self._hay_trabajo.set()
+        return lote
+
+    # En modo archivo los registros de la cola se leerán del archivo: se sacan para liberar a los productores
+    def _descartar_cola(self):
+        while True:
+            try:
+                self._cola.get_nowait()
+            except queue.Empty:
+                return
+
+    # Marca como confirmados los registros del lote y avanza el punto de control hasta el primer hueco
+    # (un registro anterior que todavía no se envía); si ya no queda nada pendiente, vacía el archivo de respaldo
+    def _confirmar(self, lote):
+        with self._lock:
+            for inicio, fin, registro in lote:
+                if fin > self._confirmado:
+                    self._tramos[inicio] = fin
+            while self._confirmado in self._tramos:
+                self._confirmado = self._tramos.pop(self._confirmado)
+            if self._confirmado >= self._escrito:
+                self._tramos.clear()
+                self._archivo.truncate(0)
+                self._base = self._escrito
+                self._guardar_posicion(0)
+            else:
+                self._guardar_posicion(self._confirmado - self._base)
+
+    def _enviar_base_datos(self, registros):
+        with conexion.get_connection_pool().connection(self.SQL_REGISTRAR_LOTE) as (database, cursor):
+            try:
+                filas = [(orden,) + registro.fila_lote() for orden, registro in enumerate(registros, 1)]
+                cursor.execute(self.SQL_REGISTRAR_LOTE, (filas,))
+                row = cursor.fetchone()
+                if row is None:
+                    raise RuntimeError("sp_RegistrarAuditoriaLote no devolvió resultado.")
+                if row[0] != 0:
+                    raise RuntimeError(row[1])
+            except Exception:
+                database.rollback()
+                raise
+            database.commit()
+
+    # --- ESTADO Y CIERRE ---
+
+    def stats(self):
+        with self._lock:
+            return {
+                "pendientes": self._escrito - self._confirmado,
+                "en_cola": self._cola.qsize(),
+                "modo_archivo": self._leer_archivo,
+                "enviados": self._enviados,
+                "lotes": self._lotes,
+                "desbordes": self._desbordes,
+                "reintentos": self._reintentos,
+                "ultimo_error": self._ultimo_error
+            }
+
+    # Intenta enviar lo pendiente (hasta 'timeout' segundos) y detiene el hilo.
+    # Lo que no alcance a enviarse queda en el archivo de respaldo para la próxima ejecución
+    def close(self, timeout=5.0):
+        if not self.flush(timeout):
+            _logger.warning("Auditoría: quedan %s bytes pendientes en %s; se enviarán en la próxima ejecución.",
+                            self._escrito - self._confirmado, self.archivo)
+        self._detener.set()
+        self._hay_trabajo.set()
+        self._hilo.join(timeout)
+        with self._lock:
+            self._archivo.close()
+
+
+# Escritor compartido por todo el proceso (se crea la primera vez que se necesita)
+_audit_writer = None
+_audit_writer_lock = threading.Lock()
+
+# Función para leer la configuración de la auditoría (usa los valores por defecto si no existe la sección)
+def get_audit_config(config_file='config.json'):
+    audit_config = dict(DEFAULT_AUDIT_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            audit_config.update(json.load(file).get('auditoria', {}))
+    except FileNotFoundError:
+        pass
+    return audit_config
+
+# Función para crear el escritor de auditoría a partir de su configuración
+def build_audit_writer(config):
+    if not config["habilitada"]:
+        return _NullAuditWriter()
+    if not config["archivo_respaldo"]:
+        raise ValueError("La auditoría requiere la clave 'archivo_respaldo' en la sección 'auditoria'.")
+    return AuditWriter(config["archivo_respaldo"], config["id_usuario"], config["tamanio_cola"],
+                       config["tamanio_lote"], config["intervalo"], config["espera_cola"], config["fsync"])
+
+# Función que devuelve el escritor compartido, creándolo a partir de config.json si aún no existe
+def get_audit_writer(config_file='config.json'):
+    global _audit_writer
+    if _audit_writer is None:
+        with _audit_writer_lock:
+            if _audit_writer is None:
+                _audit_writer = build_audit_writer(get_audit_config(config_file))
+    return _audit_writer
+
+# Función para reemplazar el escritor compartido (p. ej. uno con otra función de envío desde código)
+def set_audit_writer(writer):
+    global _audit_writer
+    with _audit_writer_lock:
+        if _audit_writer is not None and _audit_writer is not writer:
+            _audit_writer.close()
+        _audit_writer = writer
+
+# Función para cerrar el escritor compartido (envía lo pendiente que alcance y detiene el hilo al salir)
+def close_audit_writer():
+    global _audit_writer
+    with _audit_writer_lock:
+        if _audit_writer is not None:
+            _audit_writer.close()
+            _audit_writer = None
\ No newline at end of file
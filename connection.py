@@ -1,6 +1,21 @@
 # Importar las librerías para trabjar con JSONs y conexión de BBD
 import json
-import pyodbc
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from instrumentation import get_instrumentation
+
+# Valores por defecto del pool de conexiones (se pueden sobrescribir en la sección "pool" de config.json)
+DEFAULT_POOL_CONFIG = {
+    "min_size": 1,              # Conexiones que se mantienen abiertas aunque estén ociosas
+    "max_size": 5,              # Máximo de conexiones físicas abiertas a la vez
+    "idle_timeout": 300,        # Segundos que una conexión puede estar ociosa antes de cerrarse
+    "checkout_timeout": 30,     # Segundos que se espera por una conexión libre antes de fallar
+    "validation_interval": 30   # Segundos de inactividad a partir de los cuales se valida la conexión al prestarla
+}
 
 # Función para leer el archivo de configuración y devolver los parámetros de conexión
 def get_db_config(config_file='config.json'):
@@ -8,20 +23,38 @@ def get_db_config(config_file='config.json'):
         config = json.load(file)
     return config['sql_server']
 
-# Función para establecer la conexión a la base de datos SQL Server
-def create_db_connection():
-    config = get_db_config()
-    connection_string = (
+# Función para leer la configuración del pool (usa los valores por defecto si no existe la sección)
+def get_pool_config(config_file='config.json'):
+    with open(config_file, 'r') as file:
+        config = json.load(file)
+    pool_config = dict(DEFAULT_POOL_CONFIG)
+    pool_config.update(config.get('pool', {}))
+    return pool_config
+
+# pyodbc se importa al abrir la primera conexión: los comandos que no llegan a la base de datos
+# (--help, validaciones) no pagan el costo de cargar el driver
+def _pyodbc():
+    import pyodbc
+    return pyodbc
+
+# Función para construir la cadena de conexión ODBC a partir de la configuración
+def build_connection_string(config):
+    return (
         f"DRIVER={{SQL Server}};"
         f"SERVER={config['name_server']};"
         f"DATABASE={config['database']};"
         f"UID={config['user']};"
         f"PWD={config['password']}"
     )
-    
+
+# Función para establecer la conexión a la base de datos SQL Server
+def create_db_connection():
+    config = get_db_config()
+    connection_string = build_connection_string(config)
+
     try:
         # Establecer la conexión
-        database = pyodbc.connect(connection_string)
+        database = _pyodbc().connect(connection_string)
     except Exception as e:
         print("\nError al conectar a la base de datos:", e)
         raise
@@ -32,3 +65,261 @@ def create_db_connection():
         return database, cursor
 
 
+# Clase que mantiene un conjunto de conexiones pyodbc reutilizables y seguras entre hilos
+class ConnectionPool:
+    def __init__(self, connection_string, min_size=1, max_size=5, idle_timeout=300,
+                 checkout_timeout=30, validation_interval=30, connect=None):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Configuración de pool inválida: se requiere 0 <= min_size <= max_size y max_size >= 1.")
+
+        self.connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.validation_interval = validation_interval
+        # Función que abre una conexión física (por defecto pyodbc; los benchmarks pueden usar otro motor)
+        self.connect = connect
+
+        # Conexiones libres como pares (conexión, instante del último uso); la más reciente queda al final
+        self._libres = deque()
+        # Número de conexiones físicas abiertas (libres + prestadas)
+        self._total = 0
+        self._cerrado = False
+        self._condicion = threading.Condition()
+        # Cursores reutilizables por conexión y sentencia (ver prepared_cursor)
+        self._cursores_preparados = {}
+
+        # Abrir las conexiones mínimas para que la primera operación no pague el login
+        for _ in range(self.min_size):
+            database = self._abrir_conexion()
+            self._libres.append((database, time.monotonic()))
+            self._total += 1
+
+    # Abre una conexión física nueva (siempre fuera del candado)
+    def _abrir_conexion(self):
+        if self.connect is not None:
+            return self.connect(self.connection_string)
+        return _pyodbc().connect(self.connection_string, autocommit=False)
+
+    # Cierra una conexión física ignorando errores (p. ej. si el servidor ya la cortó)
+    def _cerrar_conexion(self, database):
+        # Al cerrar la conexión se cierran también sus cursores
+        self._cursores_preparados.pop(id(database), None)
+        try:
+            database.close()
+        except Exception:
+            pass
+
+    # Verifica que una conexión siga viva antes de prestarla
+    def _conexion_valida(self, database, ultimo_uso):
+        if getattr(database, 'closed', False):
+            return False
+        # Solo se hace la consulta de prueba si la conexión estuvo ociosa un buen rato
+        if time.monotonic() - ultimo_uso < self.validation_interval:
+            return True
+        try:
+            cursor = database.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    # Cierra las conexiones libres que superaron el tiempo de inactividad (respetando el mínimo)
+    def _descartar_ociosas(self):
+        expiradas = []
+        ahora = time.monotonic()
+        with self._condicion:
+            # Las más antiguas están al inicio de la cola
+            while (self._libres and self._total > self.min_size
+                   and ahora - self._libres[0][1] > self.idle_timeout):
+                expiradas.append(self._libres.popleft()[0])
+                self._total -= 1
+            if expiradas:
+                self._condicion.notify(len(expiradas))
+        for database in expiradas:
+            self._cerrar_conexion(database)
+
+    # Presta una conexión del pool (reutiliza una libre o abre una nueva si hay cupo)
+    def acquire(self):
+        self._descartar_ociosas()
+        limite = time.monotonic() + self.checkout_timeout
+
+        while True:
+            candidata = None
+            abrir_nueva = False
+            with self._condicion:
+                while True:
+                    if self._cerrado:
+                        raise RuntimeError("El pool de conexiones está cerrado.")
+                    if self._libres:
+                        # LIFO: la conexión usada más recientemente es la que menos probablemente esté caída
+                        candidata = self._libres.pop()
+                        break
+                    if self._total < self.max_size:
+                        # Se reserva el cupo antes de soltar el candado para no exceder max_size
+                        self._total += 1
+                        abrir_nueva = True
+                        break
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        raise TimeoutError(
+                            f"No hay conexiones disponibles en el pool tras {self.checkout_timeout} segundos.")
+                    self._condicion.wait(restante)
+
+            if abrir_nueva:
+                try:
+                    return self._abrir_conexion()
+                except Exception:
+                    with self._condicion:
+                        self._total -= 1
+                        self._condicion.notify()
+                    raise
+
+            database, ultimo_uso = candidata
+            if self._conexion_valida(database, ultimo_uso):
+                return database
+
+            # La conexión estaba caída: se descarta y se intenta con otra
+            self._cerrar_conexion(database)
+            with self._condicion:
+                self._total -= 1
+                self._condicion.notify()
+
+    # Devuelve una conexión al pool; si está dañada (o el pool cerrado) se cierra definitivamente
+    def release(self, database, discard=False):
+        if not discard:
+            try:
+                # Deshace cualquier transacción abierta para que el siguiente usuario reciba una conexión limpia
+                database.rollback()
+            except Exception:
+                discard = True
+
+        with self._condicion:
+            if discard or self._cerrado:
+                self._total -= 1
+            else:
+                self._libres.append((database, time.monotonic()))
+            self._condicion.notify()
+
+        if discard or self._cerrado:
+            self._cerrar_conexion(database)
+
+    # Devuelve el cursor de 'database' dedicado a la sentencia 'sql'. pyodbc no vuelve a preparar una sentencia
+    # si se ejecuta el mismo texto en el mismo cursor, así cada llamada se prepara una sola vez por conexión.
+    # Una conexión prestada la usa un solo hilo a la vez, por lo que no hace falta el candado
+    def prepared_cursor(self, database, sql):
+        cursores = self._cursores_preparados.setdefault(id(database), {})
+        cursor = cursores.get(sql)
+        if cursor is None:
+            cursor = cursores[sql] = database.cursor()
+        return cursor
+
+    # Context manager que presta una conexión con su cursor y la devuelve al terminar.
+    # Con 'prepared_sql' el cursor es el reutilizable de esa sentencia y no se cierra al devolver la conexión.
+    # Con 'cancellation' (un TokenCancelacion) el cursor se registra en el token para que otro hilo pueda
+    # cancelar la consulta, y se retira al devolver la conexión: desde entonces puede usarlo otra solicitud
+    @contextmanager
+    def connection(self, prepared_sql=None, cancellation=None):
+        instrumentation = get_instrumentation()
+        with instrumentation.measure("conexion"):
+            database = self.acquire()
+        cursor = None
+        discard = False
+        try:
+            if prepared_sql is None:
+                cursor = database.cursor()
+            else:
+                cursor = self.prepared_cursor(database, prepared_sql)
+            if cancellation is not None:
+                cancellation.registrar(cursor)
+            if instrumentation.enabled:
+                # Se miden execute, fetch, commit y rollback; al pool se devuelve siempre la conexión original
+                yield instrumentation.wrap(database, cursor)
+            else:
+                yield database, cursor
+        except Exception as e:
+            # Un error del driver puede dejar la conexión inutilizable: no se reutiliza
+            # (si pyodbc no se ha cargado, el error no puede venir del driver)
+            pyodbc = sys.modules.get("pyodbc")
+            if pyodbc is not None and isinstance(e, pyodbc.Error):
+                discard = True
+            raise
+        finally:
+            if cursor is not None and cancellation is not None:
+                cancellation.liberar(cursor)
+            if cursor is not None and prepared_sql is None:
+                try:
+                    cursor.close()
+                except Exception:
+                    discard = True
+            elif cursor is not None and not discard:
+                discard = not self._drenar(cursor)
+            self.release(database, discard=discard)
+
+    # El cursor preparado se queda con la conexión sin cerrarse: sus resultados sin leer (una lectura que se
+    # detuvo antes del final, otros conjuntos de resultados) se descartan antes de devolverla. Sin MARS,
+    # el siguiente cursor que la use fallaría con "Connection is busy with results for another hstmt".
+    # Devuelve False si no se pudo (la conexión se descarta)
+    @staticmethod
+    def _drenar(cursor):
+        try:
+            while cursor.nextset():
+                pass
+        except Exception:
+            return False
+        return True
+
+    # Cierra todas las conexiones libres; las prestadas se cierran cuando se devuelvan
+    def close(self):
+        with self._condicion:
+            self._cerrado = True
+            libres = [database for database, _ in self._libres]
+            self._libres.clear()
+            self._total -= len(libres)
+            self._condicion.notify_all()
+        for database in libres:
+            self._cerrar_conexion(database)
+
+    # Estadísticas básicas del pool
+    def stats(self):
+        with self._condicion:
+            return {
+                "total": self._total,
+                "libres": len(self._libres),
+                "prestadas": self._total - len(self._libres),
+                "max_size": self.max_size
+            }
+
+
+# Pool compartido por todo el proceso (se crea la primera vez que se necesita)
+_pool = None
+_pool_lock = threading.Lock()
+
+# Función que devuelve el pool compartido, creándolo a partir de config.json si aún no existe
+def get_connection_pool(config_file='config.json'):
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                connection_string = build_connection_string(get_db_config(config_file))
+                _pool = ConnectionPool(connection_string, **get_pool_config(config_file))
+    return _pool
+
+# Función para reemplazar el pool compartido (p. ej. por uno conectado a otro motor en los benchmarks)
+def set_connection_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool is not pool:
+            _pool.close()
+        _pool = pool
+
+# Función para cerrar el pool compartido (p. ej. al salir de la aplicación)
+def close_connection_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
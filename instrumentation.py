@@ -0,0 +1,408 @@
+# Instrumentación del acceso a datos: mide préstamo de conexiones, execute, fetch, commit y rollback
+# y envía las métricas a uno o varios destinos (memoria, archivo de log o formato de texto de Prometheus)
+import functools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import NamedTuple
+
+# Valores por defecto (se pueden sobrescribir en la sección "instrumentacion" de config.json)
+DEFAULT_INSTRUMENTATION_CONFIG = {
+    "habilitada": False,        # Sin instrumentación el costo es una comprobación por operación
+    "sink": "memoria",          # memoria | log | prometheus
+    "archivo": None,            # Archivo de destino para los sinks log (JSON Lines) y prometheus
+    "umbral_lento_ms": None,    # Las llamadas (execute) que superen este tiempo se registran como consultas lentas
+    "archivo_lentas": None      # Archivo del log de consultas lentas (por defecto se usa el logging estándar)
+}
+
+# Límites (en segundos) de los buckets del histograma de latencias
+BUCKETS_LATENCIA = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PATRON_PROCEDIMIENTO = re.compile(r"CALL\s+([\w.]+)", re.IGNORECASE)
+
+_logger = logging.getLogger("catequizado.metricas")
+
+
+# Métrica de una operación medida
+class Metrica(NamedTuple):
+    instante: float             # time.time() al terminar la operación
+    operacion: str              # conexion, execute, fetch, commit, rollback o la operación del repositorio
+    procedimiento: str          # Procedimiento almacenado involucrado (None si no aplica)
+    latencia: float             # Segundos
+    filas: int                  # Filas leídas (None si no aplica)
+    resultado: str              # OK, ERROR o EXCEPCION
+
+    def a_diccionario(self):
+        datos = self._asdict()
+        datos["latencia_ms"] = round(datos.pop("latencia") * 1000, 3)
+        return datos
+
+# Devuelve el nombre del procedimiento de una sentencia {CALL ...} (con caché: las sentencias son constantes)
+_procedimientos = {}
+
+def procedure_name(sql):
+    nombre = _procedimientos.get(sql)
+    if nombre is None:
+        coincidencia = PATRON_PROCEDIMIENTO.search(sql)
+        nombre = coincidencia.group(1) if coincidencia else "sql"
+        if len(_procedimientos) < 1000:
+            _procedimientos[sql] = nombre
+    return nombre
+
+# Resultado a partir del mensaje OK:/ERROR: de los procedimientos que aún no devuelven código
+def outcome_from_message(mensaje):
+    if isinstance(mensaje, str) and mensaje.startswith("ERROR"):
+        return "ERROR"
+    return "OK"
+
+
+# --- MEDICIONES ---
+
+# Medición en curso; el código medido puede anotar filas y el mensaje de resultado
+class Medicion:
+    __slots__ = ("_instrumentacion", "operacion", "procedimiento", "filas", "resultado", "_inicio")
+
+    def __init__(self, instrumentacion, operacion, procedimiento):
+        self._instrumentacion = instrumentacion
+        self.operacion = operacion
+        self.procedimiento = procedimiento
+        self.filas = None
+        self.resultado = "OK"
+
+    def anotar(self, filas=None, mensaje=None, codigo=None):
+        if filas is not None:
+            self.filas = filas
+        if codigo is not None:
+            self.resultado = "OK" if codigo == 0 else "ERROR"
+        elif mensaje is not None:
+            self.resultado = outcome_from_message(mensaje)
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        latencia = time.perf_counter() - self._inicio
+        if exc_type is not None:
+            self.resultado = "EXCEPCION"
+        self._instrumentacion.record(Metrica(time.time(), self.operacion, self.procedimiento, latencia,
+                                             self.filas, self.resultado))
+        return False
+
+# Medición que no hace nada (instrumentación deshabilitada); se reutiliza una sola instancia
+class _MedicionNula:
+    __slots__ = ()
+
+    def anotar(self, filas=None, mensaje=None, codigo=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_MEDICION_NULA = _MedicionNula()
+
+
+# --- DESTINOS (SINKS) ---
+
+# Agregador en memoria: cantidad, tiempo total, máximo, filas e histograma por (operación, procedimiento, resultado)
+class MemorySink:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def record(self, metrica):
+        clave = (metrica.operacion, metrica.procedimiento, metrica.resultado)
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = {"cantidad": 0, "segundos": 0.0, "max": 0.0, "filas": 0,
+                                               "buckets": [0] * len(BUCKETS_LATENCIA)}
+            serie["cantidad"] += 1
+            serie["segundos"] += metrica.latencia
+            serie["max"] = max(serie["max"], metrica.latencia)
+            if metrica.filas:
+                serie["filas"] += metrica.filas
+            for indice, limite in enumerate(BUCKETS_LATENCIA):
+                if metrica.latencia <= limite:
+                    serie["buckets"][indice] += 1
+                    break
+
+    # Resumen por serie, listo para mostrar o serializar en JSON
+    def snapshot(self):
+        with self._lock:
+            return [{
+                "operacion": operacion,
+                "procedimiento": procedimiento,
+                "resultado": resultado,
+                "cantidad": serie["cantidad"],
+                "filas": serie["filas"],
+                "promedio_ms": round(serie["segundos"] / serie["cantidad"] * 1000, 3),
+                "max_ms": round(serie["max"] * 1000, 3)
+            } for (operacion, procedimiento, resultado), serie in sorted(self._series.items(), key=str)]
+
+    # Métricas en el formato de texto de Prometheus (histograma de latencias y contador de filas)
+    def prometheus_text(self):
+        lineas = [
+            "# HELP catequizado_operacion_segundos Latencia de las operaciones de acceso a datos.",
+            "# TYPE catequizado_operacion_segundos histogram"
+        ]
+        filas = []
+        with self._lock:
+            for (operacion, procedimiento, resultado), serie in sorted(self._series.items(), key=str):
+                etiquetas = (f'operacion="{operacion}",procedimiento="{procedimiento or ""}",'
+                             f'resultado="{resultado}"')
+                acumulado = 0
+                for limite, cantidad in zip(BUCKETS_LATENCIA, serie["buckets"]):
+                    acumulado += cantidad
+                    lineas.append(f'catequizado_operacion_segundos_bucket{{{etiquetas},le="{limite}"}} {acumulado}')
+                lineas.append(f'catequizado_operacion_segundos_bucket{{{etiquetas},le="+Inf"}} {serie["cantidad"]}')
+                lineas.append(f"catequizado_operacion_segundos_sum{{{etiquetas}}} {serie['segundos']:.6f}")
+                lineas.append(f"catequizado_operacion_segundos_count{{{etiquetas}}} {serie['cantidad']}")
+                filas.append(f"catequizado_operacion_filas_total{{{etiquetas}}} {serie['filas']}")
+        lineas.append("# HELP catequizado_operacion_filas_total Filas leídas por las operaciones.")
+        lineas.append("# TYPE catequizado_operacion_filas_total counter")
+        return "\n".join(lineas + filas) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def close(self):
+        pass
+
+# Escribe cada métrica como una línea JSON en un archivo de log
+class LogSink:
+    def __init__(self, archivo):
+        self._logger = logging.getLogger(f"catequizado.metricas.{archivo}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._handler = logging.FileHandler(archivo, encoding="utf-8")
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger.addHandler(self._handler)
+
+    def record(self, metrica):
+        self._logger.info(json.dumps(metrica.a_diccionario(), ensure_ascii=False))
+
+    def close(self):
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
+
+# Agrega en memoria y vuelca periódicamente el texto de Prometheus a un archivo
+# (p. ej. para el textfile collector de node_exporter); el archivo se reemplaza de forma atómica
+class PrometheusSink(MemorySink):
+    def __init__(self, archivo, intervalo=15):
+        super().__init__()
+        self.archivo = archivo
+        self.intervalo = intervalo
+        self._ultimo_volcado = time.monotonic()
+        # Un solo volcado a la vez: todos escriben el mismo archivo temporal antes de reemplazar el destino.
+        # Es aparte de _lock para que los registros no esperen a la escritura del archivo
+        self._lock_volcado = threading.Lock()
+
+    def record(self, metrica):
+        super().record(metrica)
+        # Si otro hilo ya está volcando, no hace falta esperarlo
+        if (time.monotonic() - self._ultimo_volcado >= self.intervalo
+                and self._lock_volcado.acquire(blocking=False)):
+            try:
+                if time.monotonic() - self._ultimo_volcado >= self.intervalo:
+                    self._volcar()
+            finally:
+                self._lock_volcado.release()
+
+    def flush(self):
+        with self._lock_volcado:
+            self._volcar()
+
+    def _volcar(self):
+        self._ultimo_volcado = time.monotonic()
+        temporal = f"{self.archivo}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.prometheus_text())
+        os.replace(temporal, self.archivo)
+
+    def close(self):
+        self.flush()
+
+
+# --- INSTRUMENTACIÓN ---
+
+class Instrumentation:
+    def __init__(self, sinks=(), slow_query_ms=None, slow_query_log=None):
+        self.sinks = list(sinks)
+        self.slow_query_ms = slow_query_ms
+        self._logger_lentas = logging.getLogger("catequizado.consultas_lentas")
+        self._handler_lentas = None
+        if slow_query_log:
+            self._handler_lentas = logging.FileHandler(slow_query_log, encoding="utf-8")
+            self._handler_lentas.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self._logger_lentas.addHandler(self._handler_lentas)
+        # Si no hay destinos ni umbral, todas las mediciones son la medición nula
+        self.enabled = bool(self.sinks) or slow_query_ms is not None
+
+    # Context manager que mide el bloque: with instrumentacion.measure("execute", "Proceso.sp_X") as m: ...
+    def measure(self, operacion, procedimiento=None):
+        if not self.enabled:
+            return _MEDICION_NULA
+        return Medicion(self, operacion, procedimiento)
+
+    # Un error de un destino (disco lleno, permisos, etc.) se registra y no hace fallar la operación medida
+    def record(self, metrica):
+        for sink in self.sinks:
+            try:
+                sink.record(metrica)
+            except Exception:
+                _logger.exception("No se pudo registrar la métrica en %s.", type(sink).__name__)
+        # El umbral se aplica a cada llamada (execute) a un procedimiento
+        if (self.slow_query_ms is not None and metrica.operacion == "execute"
+                and metrica.latencia * 1000 >= self.slow_query_ms):
+            self._logger_lentas.warning(
+                "Consulta lenta (%.1f ms): %s %s resultado=%s filas=%s", metrica.latencia * 1000,
+                metrica.operacion, metrica.procedimiento, metrica.resultado, metrica.filas)
+
+    # Envuelve la conexión y el cursor prestados por el pool para medir execute, fetch, commit y rollback
+    def wrap(self, database, cursor):
+        cursor = InstrumentedCursor(cursor, self)
+        return InstrumentedConnection(database, cursor, self), cursor
+
+    # Primer sink en memoria configurado (para consultar las métricas desde la aplicación)
+    def memory_sink(self):
+        return next((sink for sink in self.sinks if isinstance(sink, MemorySink)), None)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+        if self._handler_lentas is not None:
+            self._logger_lentas.removeHandler(self._handler_lentas)
+            self._handler_lentas.close()
+
+# Cursor que mide execute y fetch*; el resto de atributos (cancel, close, description...) pasan directo
+class InstrumentedCursor:
+    def __init__(self, cursor, instrumentacion):
+        self._cursor = cursor
+        self._instrumentacion = instrumentacion
+        self.procedimiento = None
+
+    def execute(self, sql, *parametros):
+        self.procedimiento = procedure_name(sql)
+        with self._instrumentacion.measure("execute", self.procedimiento):
+            self._cursor.execute(sql, *parametros)
+        return self
+
+    def fetchone(self):
+        with self._instrumentacion.measure("fetch", self.procedimiento) as medicion:
+            row = self._cursor.fetchone()
+            # Las filas de los procedimientos ...ConCodigo empiezan con (codigo, mensaje);
+            # pyodbc lanza AttributeError si la fila no tiene la columna: getattr con valor por defecto
+            medicion.anotar(filas=0 if row is None else 1, codigo=getattr(row, "codigo", None))
+        return row
+
+    def fetchmany(self, tamanio):
+        with self._instrumentacion.measure("fetch", self.procedimiento) as medicion:
+            rows = self._cursor.fetchmany(tamanio)
+            medicion.anotar(filas=len(rows))
+        return rows
+
+    def fetchall(self):
+        with self._instrumentacion.measure("fetch", self.procedimiento) as medicion:
+            rows = self._cursor.fetchall()
+            medicion.anotar(filas=len(rows))
+        return rows
+
+    def __getattr__(self, nombre):
+        return getattr(self._cursor, nombre)
+
+# Conexión que mide commit y rollback (etiquetados con el último procedimiento ejecutado en su cursor)
+class InstrumentedConnection:
+    def __init__(self, database, cursor, instrumentacion):
+        self._database = database
+        self._cursor = cursor
+        self._instrumentacion = instrumentacion
+
+    def commit(self):
+        with self._instrumentacion.measure("commit", self._cursor.procedimiento):
+            self._database.commit()
+
+    def rollback(self):
+        with self._instrumentacion.measure("rollback", self._cursor.procedimiento):
+            self._database.rollback()
+
+    def __getattr__(self, nombre):
+        return getattr(self._database, nombre)
+
+# Decorador para medir una operación completa del repositorio; el resultado se toma del código devuelto
+def instrumented(operacion, procedimiento=None):
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            instrumentacion = get_instrumentation()
+            if not instrumentacion.enabled:
+                return funcion(*args, **kwargs)
+            with instrumentacion.measure(operacion, procedimiento) as medicion:
+                resultado = funcion(*args, **kwargs)
+                medicion.anotar(codigo=getattr(resultado, "codigo", None))
+                return resultado
+        return envoltura
+    return decorador
+
+
+# Instrumentación compartida por todo el proceso (se crea la primera vez que se necesita)
+_instrumentation = None
+_instrumentation_lock = threading.Lock()
+
+# Función para leer la configuración de la instrumentación (usa los valores por defecto si no existe la sección o el archivo)
+def get_instrumentation_config(config_file='config.json'):
+    instrumentation_config = dict(DEFAULT_INSTRUMENTATION_CONFIG)
+    try:
+        with open(config_file, 'r') as file:
+            instrumentation_config.update(json.load(file).get('instrumentacion', {}))
+    except FileNotFoundError:
+        pass
+    return instrumentation_config
+
+# Función para crear la instrumentación a partir de su configuración
+def build_instrumentation(config):
+    if not config["habilitada"]:
+        return Instrumentation()
+
+    sink = config["sink"]
+    if sink == "memoria":
+        sinks = [MemorySink()]
+    elif sink in ("log", "prometheus"):
+        if not config["archivo"]:
+            raise ValueError(f"El sink '{sink}' requiere la clave 'archivo' en la sección 'instrumentacion'.")
+        sinks = [LogSink(config["archivo"]) if sink == "log" else PrometheusSink(config["archivo"])]
+    else:
+        raise ValueError(f"Sink de instrumentación no soportado: '{sink}'. Use memoria, log o prometheus.")
+    return Instrumentation(sinks, config["umbral_lento_ms"], config["archivo_lentas"])
+
+# Función que devuelve la instrumentación compartida, creándola a partir de config.json si aún no existe
+def get_instrumentation(config_file='config.json'):
+    global _instrumentation
+    if _instrumentation is None:
+        with _instrumentation_lock:
+            if _instrumentation is None:
+                _instrumentation = build_instrumentation(get_instrumentation_config(config_file))
+    return _instrumentation
+
+# Función para reemplazar la instrumentación compartida (p. ej. activar un sink en memoria desde código)
+def set_instrumentation(instrumentation):
+    global _instrumentation
+    with _instrumentation_lock:
+        if _instrumentation is not None and _instrumentation is not instrumentation:
+            _instrumentation.close()
+        _instrumentation = instrumentation
+
+# Función para cerrar la instrumentación compartida (vuelca los archivos pendientes al salir)
+def close_instrumentation():
+    global _instrumentation
+    with _instrumentation_lock:
+        if _instrumentation is not None:
+            _instrumentation.close()
+            _instrumentation = None
\ No newline at end of file
@@ -1,8 +1,24 @@
-# Importa la clase del archivo 'app.py'
-from Catequizado.operacionesCatequizado import OperacionesCatequizado
+import sys
 
 if __name__ == "__main__":
+    # 0. Con argumentos se ejecuta la línea de comandos sin menú (python main.py --help)
+    if len(sys.argv) > 1:
+        from Catequizado.cliCatequizado import main as cli
+        sys.exit(cli(sys.argv[1:]))
+
+    # Importa la clase del archivo 'app.py' (solo el menú la necesita)
+    from Catequizado.operacionesCatequizado import OperacionesCatequizado
+    import audit as auditoria
+    import connection as conexion
+    import instrumentation as instrumentacion
+
     # 1. Crea el objeto "Volante"
     app = OperacionesCatequizado()
-    # 2. Arranca el menú
-    app.iniciar_operaciones()
\ No newline at end of file
+    try:
+        # 2. Arranca el menú
+        app.iniciar_operaciones()
+    finally:
+        # 3. Envía la auditoría pendiente, cierra las conexiones del pool y vuelca las métricas al salir
+        auditoria.close_audit_writer()
+        conexion.close_connection_pool()
+        instrumentacion.close_instrumentation()
\ No newline at end of file
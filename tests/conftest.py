@@ -0,0 +1,21 @@
+# Las pruebas importan los módulos desde la raíz del repositorio (como main.py)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import connection as conexion
+from Benchmark.motorSQLite import conectar_sqlite, crear_esquema
+
+
+# Pool compartido conectado a una base SQLite temporal (el motor de los benchmarks) en lugar de SQL Server
+@pytest.fixture
+def pool_sqlite(tmp_path):
+    ruta = str(tmp_path / "catequizado.db")
+    crear_esquema(ruta, numero_parroquias=3)
+    pool = conexion.ConnectionPool(ruta, min_size=0, max_size=2, checkout_timeout=1, connect=conectar_sqlite)
+    conexion.set_connection_pool(pool)
+    yield pool
+    conexion.close_connection_pool()
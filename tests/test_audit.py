@@ -0,0 +1,115 @@
+import os
+import threading
+import time
+
+from audit import AuditWriter
+
+TABLA = "Proceso.Catequizado"
+
+
+# Espera (como máximo 'timeout' segundos) a que se cumpla la condición
+def _esperar(condicion, timeout=5.0):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if condicion():
+            return True
+        time.sleep(0.01)
+    return condicion()
+
+def _writer(archivo, enviados, **opciones):
+    opciones.setdefault("intervalo", 0.05)
+    return AuditWriter(str(archivo), enviar=lambda registros: enviados.extend(
+        registro.idRegistroAfectado for registro in registros), **opciones)
+
+
+# Un registro escrito en el archivo antes que otro, pero encolado después, no se pierde ni se salta
+def test_registro_encolado_tarde_no_se_pierde(tmp_path):
+    archivo = tmp_path / "auditoria.jsonl"
+    enviados = []
+    writer = _writer(archivo, enviados)
+
+    escrito = threading.Event()
+    continuar = threading.Event()
+    put_original = writer._cola.put
+
+    def put_demorado(item, timeout=None):
+        if item[-1].idRegistroAfectado == 1:
+            escrito.set()
+            continuar.wait(5)
+        put_original(item, timeout=timeout)
+
+    writer._cola.put = put_demorado
+    hilo = threading.Thread(target=writer.record, args=("INSERT", TABLA, 1))
+    hilo.start()
+    assert escrito.wait(5)
+
+    writer.record("INSERT", TABLA, 2)
+    assert _esperar(lambda: enviados == [2])
+    # El registro 1 sigue pendiente: ni flush lo da por confirmado ni el archivo se vacía
+    assert not writer.flush(0.2)
+    assert os.path.getsize(archivo) > 0
+
+    continuar.set()
+    hilo.join()
+    assert writer.flush(5)
+    assert sorted(enviados) == [1, 2]
+    writer.close()
+    assert os.path.getsize(archivo) == 0
+
+def test_escrituras_concurrentes_se_envian_todas(tmp_path):
+    enviados = []
+    writer = _writer(tmp_path / "auditoria.jsonl", enviados, tamanio_lote=7)
+
+    def auditar(desde):
+        for idRegistro in range(desde, desde + 100):
+            writer.record("UPDATE", TABLA, idRegistro)
+
+    hilos = [threading.Thread(target=auditar, args=(inicio,)) for inicio in range(0, 800, 100)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert writer.flush(10)
+    writer.close()
+    assert sorted(enviados) == list(range(800))
+
+# Con la cola llena los registros se leen del archivo, en orden y sin perder ninguno
+def test_desborde_de_cola_lee_del_archivo(tmp_path):
+    enviados = []
+    # El primer envío se detiene hasta terminar de escribir, así la cola se llena con seguridad
+    continuar = threading.Event()
+
+    def enviar(registros):
+        continuar.wait(5)
+        enviados.extend(registro.idRegistroAfectado for registro in registros)
+
+    writer = AuditWriter(str(tmp_path / "auditoria.jsonl"), intervalo=0.05, tamanio_cola=2, espera_cola=0,
+                         enviar=enviar)
+    for idRegistro in range(50):
+        writer.record("INSERT", TABLA, idRegistro)
+    continuar.set()
+    assert writer.flush(10)
+    writer.close()
+    assert sorted(enviados) == list(range(50))
+    assert writer.stats()["desbordes"] > 0
+
+# Si la base de datos no responde, los registros quedan en el archivo y se envían en la próxima ejecución
+def test_recuperacion_desde_el_archivo(tmp_path):
+    archivo = tmp_path / "auditoria.jsonl"
+
+    def fallar(registros):
+        raise RuntimeError("sin conexión")
+
+    caido = AuditWriter(str(archivo), intervalo=0.05, enviar=fallar)
+    for idRegistro in range(5):
+        caido.record("DELETE", TABLA, idRegistro)
+    assert not caido.flush(0.3)
+    caido.close(timeout=0.1)
+    assert os.path.getsize(archivo) > 0
+
+    enviados = []
+    writer = _writer(archivo, enviados)
+    assert writer.flush(5)
+    writer.close()
+    assert enviados == list(range(5))
+    assert os.path.getsize(archivo) == 0
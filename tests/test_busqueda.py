@@ -0,0 +1,85 @@
+import threading
+
+from Catequizado.busquedaCatequizado import IndiceBusquedaCatequizado
+from Catequizado.modeloCatequizado import Catequizado
+
+
+def _catequizado(idCatequizado, nombres, apellidos, cedula):
+    return Catequizado(idCatequizado, 1, nombres, apellidos, cedula, "2015-01-01", "Quito", "Representante",
+                       "0991234567", "a@b.com", "2015-02-01", "Parroquia", "Parroquia 1")
+
+REGISTROS = [_catequizado(1, "Ana", "Pérez", "1712345678"), _catequizado(2, "Luis", "Mora", "1712345679")]
+
+
+# Una invalidación (p. ej. una importación masiva) que llega mientras se lee la tabla no publica el índice leído
+def test_invalidacion_durante_la_construccion_descarta_el_indice():
+    indice = IndiceBusquedaCatequizado()
+
+    def fuente():
+        yield REGISTROS[0]
+        indice.invalidar()
+        yield REGISTROS[1]
+
+    indice.reconstruir(fuente, lambda cedula: None)
+
+    assert not indice.cargado
+    assert indice.buscar("Ana") == ([], 0)
+
+# cargar() vuelve a leer hasta obtener un índice sin invalidaciones pendientes
+def test_cargar_vuelve_a_leer_tras_una_invalidacion():
+    indice = IndiceBusquedaCatequizado()
+    lecturas = []
+    importado = _catequizado(3, "Ana", "Vega", "1712345670")
+
+    def fuente():
+        lecturas.append(1)
+        yield from REGISTROS
+        if len(lecturas) == 1:
+            indice.invalidar()
+        else:
+            yield importado
+
+    indice.cargar(fuente, lambda cedula: None)
+
+    assert len(lecturas) == 2
+    resultados, total = indice.buscar("Ana")
+    assert total == 2
+    assert {catequizado.idCatequizado for catequizado in resultados} == {1, 3}
+
+# Un registro modificado durante la lectura se vuelve a resolver al terminar
+def test_cambio_durante_la_construccion_queda_pendiente():
+    indice = IndiceBusquedaCatequizado()
+    actualizado = REGISTROS[1]._replace(nombres="Lucas")
+
+    def fuente():
+        yield REGISTROS[0]
+        indice.actualizar(["1712345679"], lambda cedula: None)
+        yield REGISTROS[1]
+
+    indice.reconstruir(fuente, {"1712345679": actualizado}.get)
+
+    assert indice.cargado
+    assert indice.buscar("Luis") == ([], 0)
+    assert indice.buscar("Lucas")[1] == 1
+
+# Las búsquedas concurrentes siguen usando el índice anterior mientras se construye el nuevo
+def test_busquedas_durante_la_reconstruccion_usan_el_indice_anterior():
+    indice = IndiceBusquedaCatequizado()
+    indice.reconstruir(lambda: iter(REGISTROS), lambda cedula: None)
+    leyendo = threading.Event()
+    continuar = threading.Event()
+
+    def fuente():
+        yield REGISTROS[0]
+        leyendo.set()
+        continuar.wait(5)
+
+    hilo = threading.Thread(target=indice.reconstruir, args=(fuente, lambda cedula: None))
+    hilo.start()
+    assert leyendo.wait(5)
+    try:
+        assert indice.buscar("Luis")[1] == 1
+    finally:
+        continuar.set()
+        hilo.join(5)
+    assert indice.buscar("Luis") == ([], 0)
@@ -0,0 +1,41 @@
+from Catequizado.cacheCatequizado import CacheCatequizado
+
+CEDULA = "1712345678"
+
+
+# Una fila leída antes de una invalidación concurrente no se guarda: quedaría desactualizada hasta que expire
+def test_fila_leida_antes_de_invalidar_no_se_guarda():
+    cache = CacheCatequizado()
+    generacion = cache.generacion(CEDULA)
+    # Otra sesión actualiza el registro mientras se consultaba la base de datos
+    cache.invalidar(CEDULA)
+    cache.guardar(CEDULA, "fila anterior", generacion)
+
+    assert cache.obtener(CEDULA) is None
+    assert cache.estadisticas()["omitidos"] == 1
+
+def test_fila_leida_sin_invalidaciones_se_guarda():
+    cache = CacheCatequizado()
+    generacion = cache.generacion(CEDULA)
+    cache.guardar(CEDULA, "fila", generacion)
+
+    assert cache.obtener(CEDULA) == "fila"
+    assert cache.estadisticas()["omitidos"] == 0
+
+# Después de la invalidación, una lectura nueva (con la generación nueva) sí se guarda
+def test_lectura_posterior_a_la_invalidacion_se_guarda():
+    cache = CacheCatequizado()
+    cache.guardar(CEDULA, "fila anterior")
+    cache.invalidar(CEDULA)
+    generacion = cache.generacion(CEDULA)
+    cache.guardar(CEDULA, "fila actual", generacion)
+
+    assert cache.obtener(CEDULA) == "fila actual"
+
+def test_limpiar_descarta_lecturas_en_curso():
+    cache = CacheCatequizado()
+    generacion = cache.generacion(CEDULA)
+    cache.limpiar()
+    cache.guardar(CEDULA, "fila", generacion)
+
+    assert cache.obtener(CEDULA) is None
@@ -0,0 +1,78 @@
+import sqlite3
+
+from Benchmark import motorSQLite
+from Catalogo.cacheCatalogo import CatalogoReferencia
+from Catalogo.snapshotCatalogo import guardar_snapshot, leer_snapshot
+
+
+def _catalogo(tmp_path, pool, intervalo=300):
+    return CatalogoReferencia(str(tmp_path / "catalogos.snapshot"), intervalo, origen=pool.connection_string)
+
+# Agrega una parroquia y sube la versión de los catálogos, como el trigger de Configuracion.Parroquia
+def _nueva_parroquia(pool, monkeypatch, idParroquia):
+    with sqlite3.connect(pool.connection_string) as database:
+        database.execute("INSERT INTO Parroquia VALUES (?, ?)", (idParroquia, f"Parroquia {idParroquia}"))
+    database.close()
+    monkeypatch.setattr(motorSQLite, "VERSION_CATALOGOS", motorSQLite.VERSION_CATALOGOS + 1)
+
+
+def test_snapshot_ida_y_vuelta(tmp_path, pool_sqlite):
+    catalogos = _catalogo(tmp_path, pool_sqlite).actual()
+    ruta = str(tmp_path / "copia.snapshot")
+    guardar_snapshot(ruta, catalogos, "origen")
+
+    leidos, modificado = leer_snapshot(ruta, "origen")
+    assert leidos == catalogos
+    assert leidos.nombreParroquia(2) == "Parroquia 2"
+    # El archivo de otra base de datos no se usa
+    assert leer_snapshot(ruta, "otro origen") is None
+
+def test_snapshot_danado_se_ignora(tmp_path, pool_sqlite):
+    ruta = tmp_path / "catalogos.snapshot"
+    guardar_snapshot(str(ruta), _catalogo(tmp_path, pool_sqlite).actual(), "origen")
+    datos = bytearray(ruta.read_bytes())
+    datos[-1] ^= 0xFF
+    ruta.write_bytes(bytes(datos))
+
+    assert leer_snapshot(str(ruta), "origen") is None
+
+# Un segundo proceso inicia con el archivo local sin consultar los catálogos
+def test_inicio_desde_el_archivo_local(tmp_path, pool_sqlite):
+    _catalogo(tmp_path, pool_sqlite).actual()
+
+    catalogo = _catalogo(tmp_path, pool_sqlite)
+    assert catalogo.validarParroquia(3) is True
+    estadisticas = catalogo.estadisticas()
+    assert estadisticas["desde_archivo"] == 1
+    assert estadisticas["verificaciones"] == 0
+
+# Solo se vuelven a leer los catálogos cuando cambia la versión
+def test_verificacion_de_version(tmp_path, pool_sqlite, monkeypatch):
+    catalogo = _catalogo(tmp_path, pool_sqlite)
+    catalogo.actual()
+    catalogo.refrescar()
+    assert catalogo.estadisticas()["recargas"] == 1
+
+    _nueva_parroquia(pool_sqlite, monkeypatch, 4)
+    assert catalogo.refrescar().nombreParroquia(4) == "Parroquia 4"
+    assert catalogo.estadisticas()["recargas"] == 2
+    # El archivo local queda con la versión nueva
+    leidos, modificado = leer_snapshot(catalogo.archivo_snapshot, pool_sqlite.connection_string)
+    assert leidos.version == motorSQLite.VERSION_CATALOGOS
+
+# Un ID desconocido fuerza la comprobación de versión: puede ser una parroquia recién creada
+def test_parroquia_nueva_se_valida_sin_esperar_al_intervalo(tmp_path, pool_sqlite, monkeypatch):
+    catalogo = _catalogo(tmp_path, pool_sqlite)
+    assert catalogo.validarParroquia(4) is False
+
+    _nueva_parroquia(pool_sqlite, monkeypatch, 4)
+    assert catalogo.validarParroquia(4) is True
+
+# Si la base de datos no responde se siguen usando los catálogos ya cargados
+def test_base_de_datos_caida_conserva_los_catalogos(tmp_path, pool_sqlite):
+    catalogo = _catalogo(tmp_path, pool_sqlite, intervalo=0)
+    catalogos = catalogo.actual()
+    pool_sqlite.close()
+
+    assert catalogo.actual() is catalogos
+    assert catalogo.estadisticas()["fallos"] == 1
@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+from connection import ConnectionPool
+
+
+# Conexión falsa que registra si se cerró; 'fallar_rollback' simula una conexión cortada por el servidor
+class ConexionFalsa:
+    def __init__(self, fallar_rollback=False, fallar_nextset=False):
+        self.fallar_rollback = fallar_rollback
+        self.fallar_nextset = fallar_nextset
+        self.cerrada = False
+
+    def cursor(self):
+        return CursorFalso(self)
+
+    def rollback(self):
+        if self.fallar_rollback:
+            raise RuntimeError("conexión cortada")
+
+    def close(self):
+        self.cerrada = True
+
+class CursorFalso:
+    def __init__(self, database):
+        self.database = database
+
+    def execute(self, sql, parametros=()):
+        return self
+
+    def nextset(self):
+        if self.database.fallar_nextset:
+            raise RuntimeError("conexión cortada")
+        return False
+
+    def close(self):
+        pass
+
+def _pool(conexiones, **opciones):
+    opciones.setdefault("min_size", 0)
+    opciones.setdefault("max_size", 1)
+    creadas = iter(conexiones)
+    return ConnectionPool("falsa", connect=lambda cadena: next(creadas), **opciones)
+
+
+# Sin conexiones libres ni cupo, acquire() espera 'checkout_timeout' segundos y falla
+def test_espera_agotada_sin_conexiones_libres():
+    pool = _pool([ConexionFalsa()], checkout_timeout=0.2)
+    prestada = pool.acquire()
+
+    inicio = time.monotonic()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+    assert time.monotonic() - inicio >= 0.2
+    pool.release(prestada)
+
+# Una conexión devuelta mientras otro hilo espera se le presta a ese hilo
+def test_espera_termina_al_devolver_una_conexion():
+    conexion = ConexionFalsa()
+    pool = _pool([conexion], checkout_timeout=5)
+    prestada = pool.acquire()
+    threading.Timer(0.1, pool.release, args=(prestada,)).start()
+
+    assert pool.acquire() is conexion
+
+# Una conexión que no se puede limpiar al devolverla se cierra y libera su cupo
+def test_conexion_danada_se_descarta():
+    danada, nueva = ConexionFalsa(fallar_rollback=True), ConexionFalsa()
+    pool = _pool([danada, nueva])
+
+    pool.release(pool.acquire())
+    assert danada.cerrada
+    assert pool.stats()["total"] == 0
+    assert pool.acquire() is nueva
+
+# El cursor preparado que no se pudo drenar deja la conexión ocupada: no vuelve al pool
+def test_cursor_preparado_sin_drenar_descarta_la_conexion():
+    conexion = ConexionFalsa(fallar_nextset=True)
+    pool = _pool([conexion])
+
+    with pool.connection("{CALL Proceso.sp_Prueba}") as (database, cursor):
+        cursor.execute("{CALL Proceso.sp_Prueba}")
+    assert conexion.cerrada
+    assert pool.stats() == {"total": 0, "libres": 0, "prestadas": 0, "max_size": 1}
+
+# Un error del driver descarta la conexión; cualquier otro error la devuelve al pool
+def test_error_del_driver_descarta_la_conexion():
+    pyodbc = pytest.importorskip("pyodbc")
+    danada, sana = ConexionFalsa(), ConexionFalsa()
+    pool = _pool([danada, sana])
+
+    with pytest.raises(pyodbc.Error):
+        with pool.connection():
+            raise pyodbc.Error("08S01", "enlace de comunicación")
+    assert danada.cerrada
+
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("error de la aplicación")
+    assert not sana.cerrada
+    assert pool.stats()["libres"] == 1
+
+# Con el motor SQLite: las conexiones se reutilizan sin abrir más de max_size
+def test_pool_reutiliza_conexiones(pool_sqlite):
+    for _ in range(5):
+        with pool_sqlite.connection() as (database, cursor):
+            assert cursor.execute("SELECT 1").fetchone() == (1,)
+    assert pool_sqlite.stats() == {"total": 1, "libres": 1, "prestadas": 0, "max_size": 2}